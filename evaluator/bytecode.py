@@ -0,0 +1,367 @@
+import operator
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+from evaluator.compiler import free_variables
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Node, Number, Variable)
+
+ADD = 0
+SUBTRACT = 1
+MULTIPLY = 2
+DIVIDE = 3
+POWER = 4
+NEGATE = 5
+ABSOLUTE = 6
+LOAD_CONSTANT = 7
+LOAD_VARIABLE = 8
+STORE_VARIABLE = 9
+CALL = 10
+POP = 11
+
+OPCODE_BITS = 4
+"""
+The number of low bits of an instruction word holding the opcode. The
+remaining bits hold the operand.
+"""
+
+OPCODE_NAMES = ('ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'POWER', 'NEGATE',
+                'ABSOLUTE', 'LOAD_CONSTANT', 'LOAD_VARIABLE', 'STORE_VARIABLE',
+                'CALL', 'POP')
+
+_BINARY_OPCODES = {'+': ADD, '-': SUBTRACT, '*': MULTIPLY, '/': DIVIDE,
+                   '**': POWER}
+
+_BINARY_OPERATIONS = (operator.add, operator.sub, operator.mul,
+                      operator.truediv, operator.pow)
+
+_MASK = (1 << OPCODE_BITS) - 1
+
+class BytecodeProgram:
+    """
+    An expression compiled into a flat instruction stream for a stack machine.
+
+    Every instruction is a single unsigned word of an `array`, with the
+    opcode in the low `OPCODE_BITS` bits and the index of a constant or of a
+    variable slot in the remaining bits. Literals and functions are stored
+    once in a constant pool. Programs do not keep the tree they were compiled
+    from, so they take a few bytes per node and are cheap to keep in large
+    numbers. `compile_tree` produces faster but much larger functions.
+
+    Attributes
+    ----------
+    code : array
+        The instruction words.
+    constants : Tuple[Any, ...]
+        The constant pool.
+    variables : Tuple[str, ...]
+        The names of the variables that must be bound to evaluate the
+        expression. They occupy the first variable slots.
+    slots : Tuple[str, ...]
+        The names of all variable slots: `variables`, followed by the
+        variables that are assigned before they are read.
+    stack_size : int
+        The maximum depth of the value stack during an evaluation.
+    assigns : bool
+        Whether the expression assigns variables.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**2 + y')
+    >>> program = compile_bytecode(tree)
+    >>> program.evaluate(x=3, y=1)
+    10
+    >>> program.disassemble()[:3]
+    [('LOAD_VARIABLE', 'x'), ('LOAD_CONSTANT', 2), ('POWER', None)]
+    """
+    __slots__ = ('code', 'constants', 'variables', 'slots', 'stack_size',
+                 'assigns')
+
+    def __init__(self, code: array, constants: Tuple[Any, ...],
+                 variables: Tuple[str, ...], slots: Tuple[str, ...],
+                 stack_size: int) -> None:
+        """
+        Initialize a BytecodeProgram instance.
+
+        .. warning::
+            Do not instantiate this class directly. Use `compile_bytecode`
+            instead.
+        """
+        self.code = code
+        self.constants = constants
+        self.variables = variables
+        self.slots = slots
+        self.stack_size = stack_size
+        self.assigns = any(word & _MASK == STORE_VARIABLE for word in code)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Get the size of the instruction stream in bytes.
+
+        Returns
+        -------
+        int
+            The number of bytes of the instruction words.
+        """
+        return self.code.itemsize * len(self.code)
+
+    def run(self, values: List[Any]) -> Any:
+        """
+        Execute the program.
+
+        Parameters
+        ----------
+        values : List[Any]
+            The values of the variable slots, in the order of `slots`. The
+            list is updated by assignments.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+        """
+        constants = self.constants
+        binary = _BINARY_OPERATIONS
+        stack: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+
+        for word in self.code:
+            opcode = word & _MASK
+
+            if opcode == LOAD_VARIABLE:
+                push(values[word >> OPCODE_BITS])
+            elif opcode == LOAD_CONSTANT:
+                push(constants[word >> OPCODE_BITS])
+            elif opcode < NEGATE:
+                right = pop()
+                stack[-1] = binary[opcode](stack[-1], right)
+            elif opcode == NEGATE:
+                stack[-1] = -stack[-1]
+            elif opcode == ABSOLUTE:
+                stack[-1] = abs(stack[-1])
+            elif opcode == CALL:
+                stack[-1] = constants[word >> OPCODE_BITS](stack[-1])
+            elif opcode == STORE_VARIABLE:
+                values[word >> OPCODE_BITS] = stack[-1]
+            else:
+                pop()
+
+        return stack[-1]
+
+    def evaluate(self, **kwargs) -> Any:
+        """
+        Evaluate the expression with the given variable values.
+
+        Parameters
+        ----------
+        **kwargs
+            Variable values to be used in the evaluation of the expression.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value.
+        """
+        values = [kwargs[name] for name in self.variables]
+        values.extend([None] * (len(self.slots) - len(values)))
+
+        return self.run(values)
+
+    def execute(self, namespace: Dict[str, Any]) -> Any:
+        """
+        Evaluate the expression with the values of a namespace.
+
+        Variables assigned by the expression are stored back into the
+        namespace, like the evaluating parser does with its `ids`.
+
+        Parameters
+        ----------
+        namespace : Dict[str, Any]
+            A dictionary mapping variable names to their values.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value. The namespace is
+            not modified in that case.
+        """
+        values = [namespace[name] for name in self.variables]
+        values.extend([None] * (len(self.slots) - len(values)))
+        result = self.run(values)
+
+        if self.assigns:
+            for name, value in zip(self.slots, values):
+                namespace[name] = value
+
+        return result
+
+    def evaluate_many(self, **kwargs) -> List[Any]:
+        """
+        Evaluate the expression at many points.
+
+        Parameters
+        ----------
+        **kwargs
+            Variable values to be used in the evaluation of the expression.
+            Each value is either a sequence, holding one value per point, or
+            a scalar that is used for every point.
+
+        Returns
+        -------
+        List[Any]
+            The values of the expression, one per point. If every value is a
+            scalar a single point is evaluated.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value.
+        ValueError
+            If the sequences have different lengths.
+        """
+        columns = [kwargs[name] for name in self.variables]
+        lengths = {len(column) for column in columns
+                   if hasattr(column, '__len__')}
+
+        if len(lengths) > 1:
+            raise ValueError('all sequences must have the same length')
+
+        size = lengths.pop() if lengths else 1
+        columns = [column if hasattr(column, '__len__') else [column] * size
+                   for column in columns]
+        padding = [None] * (len(self.slots) - len(self.variables))
+        run = self.run
+
+        return [run([*point, *padding]) for point in zip(*columns)] \
+            if columns else [run(padding[:]) for _ in range(size)]
+
+    def disassemble(self) -> List[Tuple[str, Any]]:
+        """
+        Decode the instruction stream.
+
+        Returns
+        -------
+        List[Tuple[str, Any]]
+            The name of every instruction along with its operand: a constant,
+            a variable name, or None for instructions without operand.
+        """
+        instructions: List[Tuple[str, Any]] = []
+
+        for word in self.code:
+            opcode, index = word & _MASK, word >> OPCODE_BITS
+
+            if opcode in (LOAD_CONSTANT, CALL):
+                operand = self.constants[index]
+            elif opcode in (LOAD_VARIABLE, STORE_VARIABLE):
+                operand = self.slots[index]
+            else:
+                operand = None
+
+            instructions.append((OPCODE_NAMES[opcode], operand))
+
+        return instructions
+
+    def __call__(self, *args) -> Any:
+        values = list(args)
+        values.extend([None] * (len(self.slots) - len(values)))
+
+        return self.run(values)
+
+    def __repr__(self) -> str:
+        return f'BytecodeProgram({len(self.code)} instructions, \
+{len(self.constants)} constants)'
+
+def compile_bytecode(tree: Node | Sequence[Node]) -> BytecodeProgram:
+    """
+    Compile an expression tree into a stack machine program.
+
+    A sequence of trees is compiled as the statements of a document: they
+    are executed in order, the values of all but the last one are dropped,
+    and the program returns the value of the last one.
+
+    Parameters
+    ----------
+    tree : Node | Sequence[Node]
+        The root of the expression tree, or the roots of the trees of the
+        statements.
+
+    Returns
+    -------
+    BytecodeProgram
+        The compiled program.
+    """
+    statements = [tree] if isinstance(tree, Node) else list(tree)
+    variables = free_variables(statements)
+    slots: Dict[str, int] = {name: index for index, name in enumerate(variables)}
+    constants: Dict[Tuple[str, Any], int] = {}
+    code = array('I')
+    emit = code.append
+    depth = stack_size = 0
+
+    def constant(value: Any) -> int:
+        # Equal values of different types, such as 1 and 1.0, must not share
+        # an entry of the pool.
+        key = (type(value).__name__, value)
+
+        if key not in constants:
+            constants[key] = len(constants)
+
+        return constants[key]
+
+    def slot(name: str) -> int:
+        if name not in slots:
+            slots[name] = len(slots)
+
+        return slots[name]
+
+    # The post-order of the tree is exactly the order in which a stack
+    # machine consumes operands.
+    for index, statement in enumerate(statements):
+        if index:
+            emit(POP)
+            depth -= 1
+
+        for node in statement.walk():
+            match node:
+                case Number():
+                    emit(LOAD_CONSTANT | constant(node.value) << OPCODE_BITS)
+                    depth += 1
+                case Variable():
+                    emit(LOAD_VARIABLE | slot(node.name) << OPCODE_BITS)
+                    depth += 1
+                case Assignment():
+                    emit(STORE_VARIABLE | slot(node.name) << OPCODE_BITS)
+                case BinaryOperation():
+                    emit(_BINARY_OPCODES[node.operator])
+                    depth -= 1
+                case Negation():
+                    emit(NEGATE)
+                case AbsoluteValue():
+                    emit(ABSOLUTE)
+                case Function():
+                    implementation = Function.implementations[node.name]
+                    emit(CALL | constant(implementation) << OPCODE_BITS)
+                case _:
+                    raise TypeError(f'unsupported node: {node!r}')
+
+            stack_size = max(stack_size, depth)
+
+    pool = [None] * len(constants)
+
+    for (_, value), index in constants.items():
+        pool[index] = value
+
+    return BytecodeProgram(code, tuple(pool), variables, tuple(slots),
+                           stack_size)
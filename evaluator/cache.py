@@ -0,0 +1,326 @@
+import re
+import sys
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Dict, List
+
+from evaluator.bytecode import BytecodeProgram, compile_bytecode
+from evaluator.nodes import Node
+from lexer.diagnostics import Diagnostic
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+# Only the characters ignored by the lexers. Newlines separate statements
+# and other whitespace characters are illegal.
+_SPACES = re.compile(r'[ \t]+')
+
+def normalize(text: str) -> str:
+    """
+    Normalize the whitespace of an expression.
+
+    Spaces and tabs are insignificant between tokens, so texts that only
+    differ in spacing share the same key. Spaces between two names or
+    numbers, and between two '*', are kept because removing them would merge
+    the tokens. Newlines are kept, since they separate statements.
+
+    Parameters
+    ----------
+    text : str
+        The expression text.
+
+    Returns
+    -------
+    str
+        The normalized text.
+
+    Examples
+    --------
+    >>> normalize('  x ** 2 +\\t3 * y ')
+    'x**2+3*y'
+    """
+    text = text.strip(' \t')
+
+    def join(match: re.Match) -> str:
+        before, after = text[match.start() - 1], text[match.end()]
+
+        if before == after == '*' or \
+           (_is_word(before) and _is_word(after)):
+            return ' '
+
+        return ''
+
+    return _SPACES.sub(join, text)
+
+def _is_word(character: str) -> bool:
+    return character.isalnum() or character in '_.'
+
+class ExpressionCache:
+    """
+    A least recently used cache of compiled expressions.
+
+    Expressions are keyed by their normalized text and compiled into
+    `BytecodeProgram` instances, so evaluating a repeated expression skips
+    lexing, parsing and compilation. The cache is bounded both by the number
+    of entries and by the approximate size of the programs.
+
+    Attributes
+    ----------
+    max_entries : int
+        The maximum number of cached expressions.
+    max_bytes : int
+        The maximum total size of the cached programs, in bytes.
+    enabled : bool
+        Whether the cache is used. A disabled cache compiles nothing and
+        `get` always returns None.
+    hits : int
+        The number of lookups answered from the cache.
+    misses : int
+        The number of lookups that compiled the expression.
+    evictions : int
+        The number of entries removed to respect the bounds.
+    nbytes : int
+        The total size of the cached programs, in bytes.
+
+    Examples
+    --------
+    >>> cache = ExpressionCache(max_entries=2)
+    >>> cache.get('x + 1') is cache.get('x+1')
+    True
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, max_entries: int = 4096,
+                 max_bytes: int = 16 * 1024 * 1024,
+                 enabled: bool = True) -> None:
+        """
+        Initialize an ExpressionCache instance.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of cached expressions. The default is 4096.
+        max_bytes : int, optional
+            The maximum total size of the cached programs, in bytes. The
+            default is 16 MiB.
+        enabled : bool, optional
+            Whether the cache is used. The default is True.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+        self._entries: OrderedDict[str, BytecodeProgram] = OrderedDict()
+        self._lock = RLock()
+        self._parser: PolynomialTreeParser | None = None
+
+    def get(self, text: str) -> BytecodeProgram | None:
+        """
+        Get the compiled form of an expression, compiling it on a miss.
+
+        Parameters
+        ----------
+        text : str
+            The expression text.
+
+        Returns
+        -------
+        BytecodeProgram | None
+            The compiled expression, or None if the cache is disabled or the
+            text could not be parsed. Texts with syntax errors are not cached.
+        """
+        if not self.enabled:
+            return None
+
+        key = normalize(text)
+
+        with self._lock:
+            program = self._entries.get(key)
+
+            if program is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+                return program
+
+            self.misses += 1
+            program = self.compile(text)
+
+            if program is None:
+                return None
+
+            self._entries[key] = program
+            self.nbytes += _entry_size(key, program)
+            self._evict()
+
+            return program
+
+    def compile(self, text: str) -> BytecodeProgram | None:
+        """
+        Compile an expression without looking it up or storing it.
+
+        Parameters
+        ----------
+        text : str
+            The expression text.
+
+        Returns
+        -------
+        BytecodeProgram | None
+            The compiled expression, or None if the text could not be parsed.
+            All the statements of the text are compiled, in order, and the
+            program returns the value of the last one.
+        """
+        with self._lock:
+            parser = self._get_parser()
+            errors = parser.syntax_errors
+            trees = parser.parse_document(text)
+
+            if parser._last_result(trees, errors) is None:
+                return None
+
+        return compile_bytecode(trees)
+
+    def parse(self, text: str) -> Node | None:
+        """
+        Parse an expression into a tree with the parser of the cache.
+
+        If the text holds several statements, the tree of the last one is
+        returned.
+
+        Parameters
+        ----------
+        text : str
+            The expression text.
+
+        Returns
+        -------
+        Node | None
+            The root of the expression tree, or None if the text could not be
+            parsed.
+        """
+        with self._lock:
+            return self._get_parser().parse(text)
+
+    def diagnose(self, text: str) -> List[Diagnostic]:
+        """
+        Get the errors found in an expression by the parser of the cache.
+
+        Texts with errors are never cached, so they are parsed again.
+
+        Parameters
+        ----------
+        text : str
+            The expression text.
+
+        Returns
+        -------
+        List[Diagnostic]
+            The lexical and syntax errors of the text, empty if it is valid.
+        """
+        with self._lock:
+            parser = self._get_parser()
+            parser.parse(text)
+
+            return list(parser.diagnostics)
+
+    def evaluate(self, text: str, ids: Dict[str, Any],
+                 fallback: Callable[[str], Any]) -> Any:
+        """
+        Evaluate an expression with the bindings of an evaluating parser.
+
+        The cached program is used when every variable it reads is bound.
+        Otherwise, or when the cache is disabled, the text is evaluated by
+        `fallback`, which may for example prompt for the missing values.
+
+        Parameters
+        ----------
+        text : str
+            The expression text.
+        ids : Dict[str, Any]
+            The variable bindings. Assigned variables are stored back.
+        fallback : Callable[[str], Any]
+            A function evaluating the text directly, typically the `parse`
+            method of a `PolynomialParser` sharing `ids`.
+
+        Returns
+        -------
+        Any
+            The value of the expression, or None if it could not be parsed.
+        """
+        if not self.enabled:
+            return fallback(text)
+
+        program = self.get(text)
+
+        if program is None:
+            return None
+
+        if any(name not in ids for name in program.variables):
+            return fallback(text)
+
+        return program.execute(ids)
+
+    def resize(self, max_entries: int | None = None,
+               max_bytes: int | None = None) -> None:
+        """
+        Change the bounds of the cache, evicting entries if needed.
+
+        Parameters
+        ----------
+        max_entries : int | None, optional
+            The new maximum number of entries, if given.
+        max_bytes : int | None, optional
+            The new maximum total size in bytes, if given.
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.nbytes = 0
+
+    def _get_parser(self) -> PolynomialTreeParser:
+        if self._parser is None:
+            self._parser = PolynomialTreeParser.build()
+
+        return self._parser
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self.nbytes > self.max_bytes):
+            key, program = self._entries.popitem(last=False)
+            self.nbytes -= _entry_size(key, program)
+            self.evictions += 1
+
+    def __contains__(self, text: str) -> bool:
+        return normalize(text) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'ExpressionCache({len(self)} entries, {self.hits} hits, \
+{self.misses} misses)'
+
+def _entry_size(key: str, program: BytecodeProgram) -> int:
+    return sys.getsizeof(key) + program.nbytes
+
+expression_cache = ExpressionCache()
+"""
+The cache shared by the whole process. Set `expression_cache.enabled` to
+False to opt out.
+"""
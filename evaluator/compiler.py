@@ -0,0 +1,780 @@
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from evaluator.exact import (common_denominator, exact_divide, exact_power,
+                             is_rational)
+from evaluator.modular import modular_inverse, reduce_many, residue
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Node, Number, Variable)
+from evaluator.polynomial import Polynomial
+
+POWER_CHAIN_LIMIT = 256
+"""
+The largest constant integer exponent that the compiler lowers into
+multiplications. Larger powers are computed with '**'. Note that a lowered
+float power overflows to infinity instead of raising OverflowError.
+"""
+
+class CompiledExpression:
+    """
+    An expression tree compiled into a Python function.
+
+    The tree is translated once into Python source code, so evaluating the
+    expression costs a single function call instead of a parser run.
+    Subexpressions that occur several times in the tree are evaluated only
+    once per call, constant integer powers are computed with a few shared
+    multiplications, and long sums and products are split into statements so
+    that expressions with many terms stay within the limits of the Python
+    compiler.
+
+    Attributes
+    ----------
+    tree : Node
+        The expression tree that was compiled.
+    variables : Tuple[str, ...]
+        The names of the variables that must be bound to evaluate the
+        expression, in the order expected by `function`.
+    function : Callable[..., Any]
+        A function taking the variable values as positional arguments and
+        returning the value of the expression.
+    source : str
+        The generated Python source code.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**2 + y')
+    >>> f = compile_tree(tree)
+    >>> f.evaluate(x=3, y=1)
+    10
+    >>> f.evaluate_many(x=[1, 2, 3], y=1)
+    [2, 5, 10]
+    """
+
+    def __init__(self, tree: Node, variables: Tuple[str, ...],
+                 function: Callable[..., Any],
+                 batch_function: Callable[..., List[Any]],
+                 source: str) -> None:
+        """
+        Initialize a CompiledExpression instance.
+
+        .. warning::
+            Do not instantiate this class directly. Use `compile_tree`
+            instead.
+        """
+        self.tree = tree
+        self.variables = variables
+        self.function = function
+        self.source = source
+        self._batch_function = batch_function
+
+    def evaluate(self, **kwargs) -> Any:
+        """
+        Evaluate the expression with the given variable values.
+
+        Parameters
+        ----------
+        **kwargs
+            Variable values to be used in the evaluation of the expression.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value.
+        """
+        return self.function(*[kwargs[name] for name in self.variables])
+
+    def evaluate_many(self, **kwargs) -> List[Any]:
+        """
+        Evaluate the expression at many points.
+
+        Parameters
+        ----------
+        **kwargs
+            Variable values to be used in the evaluation of the expression.
+            Each value is either a sequence, holding one value per point, or
+            a scalar that is used for every point.
+
+        Returns
+        -------
+        List[Any]
+            The values of the expression, one per point. If every value is a
+            scalar a single point is evaluated.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value.
+        ValueError
+            If the sequences have different lengths.
+        """
+        return self._batch_function(*batch_columns(self.variables, kwargs))
+
+    def __call__(self, *args) -> Any:
+        return self.function(*args)
+
+def batch_columns(variables: Sequence[str],
+                  values: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Get the arguments of a batch function from the values of the variables.
+
+    Parameters
+    ----------
+    variables : Sequence[str]
+        The names of the variables, in the order of the columns.
+    values : Dict[str, Any]
+        The values of the variables. Each value is either a sequence,
+        holding one value per point, or a scalar that is used for every
+        point.
+
+    Returns
+    -------
+    Tuple[Any, ...]
+        The number of points, followed by one sequence of values per
+        variable. If every value is a scalar there is a single point.
+
+    Raises
+    ------
+    KeyError
+        If a variable has no value.
+    ValueError
+        If the sequences have different lengths.
+    """
+    columns = [values[name] for name in variables]
+    lengths = {len(column) for column in columns
+               if hasattr(column, '__len__')}
+
+    if len(lengths) > 1:
+        raise ValueError('all sequences must have the same length')
+
+    size = lengths.pop() if lengths else 1
+    columns = [column if hasattr(column, '__len__') else [column] * size
+               for column in columns]
+
+    return size, *columns
+
+def free_variables(tree: Node | Sequence[Node]) -> Tuple[str, ...]:
+    """
+    Get the variables whose values must be supplied to evaluate a tree.
+
+    A variable is free if it is read before being assigned in the evaluation
+    order of the expression, or of the statements if several trees are
+    given.
+
+    Parameters
+    ----------
+    tree : Node | Sequence[Node]
+        The root of the expression tree, or the roots of the trees of
+        statements evaluated in order.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The sorted names of the free variables.
+    """
+    assigned: set = set()
+    free: set = set()
+
+    for statement in [tree] if isinstance(tree, Node) else tree:
+        for node in statement.walk():
+            if isinstance(node, Variable) and node.name not in assigned:
+                free.add(node.name)
+            elif isinstance(node, Assignment):
+                assigned.add(node.name)
+
+    return tuple(sorted(free))
+
+class _CodeGenerator:
+    """
+    Translate an expression tree into Python statements and an expression.
+
+    Chains of additions or multiplications are flattened into a single Python
+    expression, and split into accumulator statements every `chunk` operands
+    so the nesting depth of the generated code stays bounded. Constant integer
+    powers up to `POWER_CHAIN_LIMIT` are lowered into multiplications along
+    an addition chain, and the intermediate powers of a base are kept in
+    locals shared by the whole expression.
+
+    In exact mode, divisions and powers call the exact helpers. In modular
+    mode, every value is reduced modulo `modulus`, or modulo `_m` at run time
+    if no modulus is given, divisions multiply by a modular inverse, and
+    powers use the three-argument `pow`.
+    """
+
+    chunk = 64
+
+    def __init__(self, tree: Node, exact: bool = False,
+                 modulus: int | None = None, modular: bool = False) -> None:
+        self.modulus = modulus
+        # Without a modulus, the literals are reduced by the caller into the
+        # names of `residues`.
+        self.modular = modular or modulus is not None
+        self.residues: Dict[str, Any] = {}
+        self.names: Dict[str, str] = {}
+        self.constants: Dict[str, Any] = {}
+        # Templates of the operators that are not written as Python operators.
+        self.templates: Dict[str, str] = {}
+
+        if self.modular:
+            self.constants.update(_inverse=modular_inverse)
+            self.templates = {'*': '({0} * {1} % _m)',
+                              '/': '({0} * _inverse({1}, _m) % _m)'}
+
+            if modulus is not None:
+                self.constants.update(_m=modulus)
+        elif exact:
+            self.templates = {'/': '_divide({0}, {1})',
+                              '**': '_power({0}, {1})'}
+
+        self.temporaries: Dict[Node, str] = {}
+        self.powers: Dict[Node, Dict[int, str]] = {}
+        self.statements: List[str] = []
+        self.locals = 0
+        # Values can only be reused when no variable is assigned.
+        self.pure = not any(isinstance(node, Assignment)
+                            for node in tree.walk())
+        self.shared = self._shared_subtrees(tree)
+
+    def _shared_subtrees(self, tree: Node) -> set:
+        if not self.pure:
+            return set()
+
+        counts: Dict[Node, int] = {}
+
+        for node in tree.walk():
+            if node.children():
+                counts[node] = counts.get(node, 0) + 1
+
+        return {node for node, count in counts.items() if count > 1}
+
+    def name(self, variable: str) -> str:
+        if variable not in self.names:
+            self.names[variable] = f'_v{len(self.names)}'
+
+        return self.names[variable]
+
+    def constant(self, value: Any) -> str:
+        name = f'_c{len(self.constants)}'
+        self.constants[name] = value
+
+        return name
+
+    def local(self) -> str:
+        self.locals += 1
+
+        return f'_l{self.locals}'
+
+    def generate(self, node: Node) -> str:
+        if node in self.shared:
+            if node in self.temporaries:
+                return self.temporaries[node]
+
+            code = self._generate(node)
+            temporary = f'_t{len(self.temporaries)}'
+            self.temporaries[node] = temporary
+
+            return f'({temporary} := {code})'
+
+        return self._generate(node)
+
+    def _generate(self, node: Node) -> str:
+        match node:
+            case Number():
+                if self.modulus is not None:
+                    return f'({residue(node.value, self.modulus)})'
+
+                if self.modular:
+                    if not is_rational(node.value):
+                        raise ValueError(f'{node.value!r} cannot be reduced \
+modulo an integer')
+
+                    name = f'_r{len(self.residues)}'
+                    self.residues[name] = node.value
+
+                    return name
+
+                # Huge integers are bound as constants, since their repr can
+                # exceed the limit of integer string conversion.
+                if type(node.value) is int and \
+                   node.value.bit_length() <= 1024 or \
+                   type(node.value) is float and math.isfinite(node.value):
+                    return f'({node.value!r})'
+
+                return self.constant(node.value)
+            case Variable():
+                return self.name(node.name)
+            case Assignment():
+                return f'({self.name(node.name)} := \
+{self.generate(node.expression)})'
+            case BinaryOperation():
+                if node.operator == '**' and self.modular:
+                    exponent = _integer_literal(node.right)
+
+                    if exponent is None:
+                        raise ValueError('modular exponents must be integer \
+constants')
+
+                    base = self.generate(node.left)
+
+                    if exponent < 0:
+                        base, exponent = f'_inverse({base}, _m)', -exponent
+
+                    return f'pow({base}, {exponent}, _m)'
+
+                if node.operator == '**':
+                    if self.pure and isinstance(node.right, Number) and \
+                       type(node.right.value) is int and \
+                       2 <= node.right.value <= POWER_CHAIN_LIMIT:
+                        return self._power(node.left, node.right.value)
+
+                    return self._sequence(node.left, [('**', node.right)])
+
+                if self.modular and node.precedence == 1:
+                    return f'({self._chain(node)} % _m)'
+
+                return self._chain(node)
+            case Negation():
+                if self.modular:
+                    return f'(-{self.generate(node.operand)} % _m)'
+
+                return f'(-{self.generate(node.operand)})'
+            case AbsoluteValue() | Function() if self.modular:
+                raise ValueError(f'{node.to_text()} is not defined modulo an \
+integer')
+            case AbsoluteValue():
+                return f'_abs({self.generate(node.operand)})'
+            case Function():
+                function = self.constant(Function.implementations[node.name])
+
+                return f'{function}({self.generate(node.argument)})'
+
+        raise TypeError(f'unsupported node: {node!r}')
+
+    def _power(self, base: Node, exponent: int) -> str:
+        # Every power is the product of its parent in the chain and an
+        # earlier power, so when a new power is computed its operands have
+        # already been assigned by the code on its left.
+        powers = self.powers.setdefault(base, {})
+        chain = addition_chain(exponent)
+        start = max(index for index, power in enumerate(chain)
+                    if power in powers or index == 0)
+
+        if chain[start] in powers:
+            code = powers[chain[start]]
+        elif isinstance(base, Variable):
+            code = powers[1] = self.generate(base)
+        else:
+            powers[1] = self.local()
+            code = f'({powers[1]} := {self.generate(base)})'
+
+        for previous, power in zip(chain[start:], chain[start + 1:]):
+            name = self.local()
+            code = f'({name} := {code} * {powers[power - previous]})'
+            powers[power] = name
+
+        return code
+
+    def _chain(self, node: BinaryOperation) -> str:
+        precedence = node.precedence
+        operations: List[Tuple[str, Node]] = []
+        first: Node = node
+
+        while isinstance(first, BinaryOperation) and \
+              first.precedence == precedence and \
+              (first is node or first not in self.shared):
+            operations.append((first.operator, first.right))
+            first = first.left
+
+        operations.reverse()
+
+        return self._sequence(first, operations)
+
+    def _sequence(self, first: Node, operations: List[Tuple[str, Node]]) -> str:
+        parts = [self.generate(first)]
+        calls = 0
+
+        for operator, operand in operations:
+            mark = len(self.statements)
+            code = self.generate(operand)
+
+            if len(self.statements) > mark or len(parts) > 2 * self.chunk or \
+               calls > self.chunk:
+                # Operands that needed statements of their own must be
+                # evaluated after everything on their left.
+                hoisted = self.statements[mark:]
+                del self.statements[mark:]
+
+                accumulator = self.local()
+                self.statements.append(f'{accumulator} = {" ".join(parts)}')
+                self.statements.extend(hoisted)
+                parts = [accumulator]
+                calls = 0
+
+            if operator in self.templates:
+                # Operators written as calls or reductions nest instead of
+                # extending the chain.
+                template = self.templates[operator]
+                parts = [template.format(" ".join(parts), code)]
+                calls += 1
+            else:
+                parts.extend((operator, code))
+
+        return f'({" ".join(parts)})'
+
+def _integer_literal(node: Node) -> int | None:
+    if isinstance(node, Negation):
+        value = _integer_literal(node.operand)
+
+        return -value if value is not None else None
+
+    if isinstance(node, Number) and type(node.value) is int:
+        return node.value
+
+    return None
+
+@lru_cache(maxsize=None)
+def _power_tree() -> Dict[int, int]:
+    # Knuth's power tree: the children of every node n are n + a for each
+    # power a on the path from the root to n, in order, unless already in
+    # the tree. Its paths are optimal addition chains for all exponents
+    # below 77 but a few, and close to optimal above.
+    parents = {1: 0}
+    level = [1]
+
+    while len(parents) < POWER_CHAIN_LIMIT:
+        next_level = []
+
+        for node in level:
+            path = [node]
+
+            while path[-1] != 1:
+                path.append(parents[path[-1]])
+
+            for power in reversed(path):
+                child = node + power
+
+                if child <= POWER_CHAIN_LIMIT and child not in parents:
+                    parents[child] = node
+                    next_level.append(child)
+
+        level = next_level
+
+    return parents
+
+def addition_chain(exponent: int) -> List[int]:
+    """
+    Get a short addition chain for an exponent.
+
+    Every power of the chain but the first is the sum of the previous power
+    and an earlier one, so `x**exponent` is computed with one multiplication
+    per step. Chains of different exponents share their prefixes, which lets
+    the compiler reuse intermediate powers across an expression.
+
+    Parameters
+    ----------
+    exponent : int
+        An exponent between 1 and `POWER_CHAIN_LIMIT`.
+
+    Returns
+    -------
+    List[int]
+        The powers of the chain, from 1 to `exponent`.
+
+    Examples
+    --------
+    >>> addition_chain(13)
+    [1, 2, 3, 5, 10, 13]
+    """
+    parents = _power_tree()
+    chain = [exponent]
+
+    while chain[-1] != 1:
+        chain.append(parents[chain[-1]])
+
+    chain.reverse()
+
+    return chain
+
+def compile_tree(tree: Node, exact: bool = False) -> CompiledExpression:
+    """
+    Compile an expression tree into a Python function.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the expression tree.
+    exact : bool, optional
+        If True, divisions and negative powers of rational numbers give
+        fractions instead of floats, like in the exact mode of the parser.
+        The default is False.
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled expression.
+    """
+    variables = free_variables(tree)
+    generator = _CodeGenerator(tree, exact)
+    parameters = [generator.name(variable) for variable in variables]
+    body = generator.generate(tree)
+
+    return _assemble(tree, variables, parameters, generator, body)
+
+def compile_polynomial(polynomial: Polynomial,
+                       exact: bool = False) -> CompiledExpression:
+    """
+    Compile an expanded polynomial into a Python function.
+
+    The generated function computes the powers of every variable once, by
+    repeated multiplication up to the largest exponent of the variable, and
+    forms every term from these shared powers instead of raising the
+    variables to a power in each term. Sparse polynomials with many terms of
+    high degree are much cheaper to evaluate this way, and the batch
+    function shares the powers in the same way at every point.
+
+    In exact mode, rational coefficients are multiplied by their common
+    denominator, so integer inputs are evaluated with integer arithmetic
+    only and a single division by the denominator at the end.
+
+    Parameters
+    ----------
+    polynomial : Polynomial
+        The polynomial to be compiled.
+    exact : bool, optional
+        If True and every coefficient is an int or a Fraction, the result is
+        computed exactly for rational inputs. The default is False.
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled polynomial. Its tree is the one returned by
+        `Polynomial.to_tree`.
+
+    Examples
+    --------
+    >>> p = Polynomial(('x', 'y'), {(3, 0): 2, (1, 2): -1})
+    >>> f = compile_polynomial(p)
+    >>> f.evaluate(x=2, y=3)
+    -2
+    >>> print(f.source.splitlines()[1])
+        _p0_2 = _v0 * _v0
+    >>> compile_polynomial(Polynomial(('x',), {(2,): Fraction(1, 3)}),
+    ...                    exact=True).evaluate(x=2)
+    Fraction(4, 3)
+    """
+    tree = polynomial.to_tree()
+    generator = _CodeGenerator(tree, exact)
+    terms = polynomial.terms
+    denominator = 1
+
+    if exact and all(is_rational(value) for value in terms.values()):
+        denominator = common_denominator(terms.values())
+        terms = {monomial: int(coefficient * denominator)
+                 for monomial, coefficient in terms.items()}
+
+    variables = polynomial.variables
+    parameters = [generator.name(variable) for variable in variables]
+    degrees = [max((monomial[index] for monomial in terms), default=0)
+               for index in range(len(variables))]
+    powers: Dict[Tuple[int, int], str] = {}
+
+    for index, (parameter, degree) in enumerate(zip(parameters, degrees)):
+        powers[index, 1] = parameter
+
+        for exponent in range(2, degree + 1):
+            power = f'_p{index}_{exponent}'
+            generator.statements.append(
+                f'{power} = {powers[index, exponent - 1]} * {parameter}')
+            powers[index, exponent] = power
+
+    parts: List[str] = []
+
+    for monomial, coefficient in terms.items():
+        factors = [powers[index, exponent]
+                   for index, exponent in enumerate(monomial) if exponent]
+
+        if not factors or coefficient != 1 or type(coefficient) is not int:
+            factors.insert(0, generator.generate(Number(coefficient)))
+
+        if len(parts) >= 2 * generator.chunk:
+            accumulator = generator.local()
+            generator.statements.append(f'{accumulator} = {" ".join(parts)}')
+            parts = [accumulator, '+']
+        elif parts:
+            parts.append('+')
+
+        parts.append(' * '.join(factors))
+
+    body = f'({" ".join(parts)})' if parts else '0'
+
+    if denominator != 1:
+        body = f'_divide({body}, {denominator})'
+
+    return _assemble(tree, variables, parameters, generator, body)
+
+def compile_modular(tree: Node, modulus: int) -> CompiledExpression:
+    """
+    Compile an expression tree into a function computing its value modulo an
+    integer.
+
+    Values are reduced after every operation, so they stay below the modulus
+    and evaluation never builds big integers. Divisions multiply by modular
+    inverses. Rational literals are reduced at compile time, and the
+    variables must be bound to integers.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the expression tree.
+    modulus : int
+        The modulus, usually a prime so that every non-zero value can be
+        divided by.
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled expression, returning integers in [0, modulus).
+
+    Raises
+    ------
+    ValueError
+        If the expression contains floating point literals, functions,
+        absolute values, or powers whose exponent is not an integer literal.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**2 / 3 + 1')
+    >>> compile_modular(tree, 7).evaluate_many(x=[0, 1, 2])
+    [1, 6, 0]
+    """
+    variables = free_variables(tree)
+    generator = _CodeGenerator(tree, modulus=modulus)
+    parameters = [generator.name(variable) for variable in variables]
+    body = f'({generator.generate(tree)} % _m)'
+
+    return _assemble(tree, variables, parameters, generator, body)
+
+def compile_residues(tree: Node) -> Callable[..., List[List[int]]]:
+    """
+    Compile an expression tree into a function computing its values modulo
+    several integers.
+
+    The tree is compiled once for all moduli, like `compile_modular` but with
+    the modulus bound at run time. The generated function reduces the input
+    values with `reduce_many`, then for every modulus reduces the literals
+    and evaluates every point with single-word arithmetic.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the expression tree.
+
+    Returns
+    -------
+    Callable[..., List[List[int]]]
+        A function taking a sequence of moduli followed by the arguments
+        returned by `batch_columns` for the variables of `free_variables`,
+        and returning for every modulus the values at all points, as
+        integers in [0, modulus).
+
+    Raises
+    ------
+    ValueError
+        If the expression contains floating point literals, functions,
+        absolute values, or powers whose exponent is not an integer literal.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**2 / 3 + 1')
+    >>> compile_residues(tree)([5, 7], 3, [0, 1, 2])
+    [[1, 3, 4], [1, 6, 0]]
+    """
+    variables = free_variables(tree)
+    generator = _CodeGenerator(tree, modular=True)
+    parameters = [generator.name(variable) for variable in variables]
+    body = f'({generator.generate(tree)} % _m)'
+    columns = ', '.join(f'_column{index}' for index in range(len(parameters)))
+    reduced = ', '.join(f'_reduced{index}' for index in range(len(parameters)))
+    unpacked = ''.join(f'{parameter}, ' for parameter in parameters)
+
+    if parameters:
+        moduli = f'for _m, {reduced} in _zip(_moduli, {columns}):'
+        loop = f'for {unpacked}in _zip({reduced}):'
+    else:
+        moduli = 'for _m in _moduli:'
+        loop = 'for _ in _range(_size):'
+
+    reductions = ''.join(
+        f'    _column{index} = _reduce(_column{index}, _moduli)\n'
+        for index in range(len(parameters)))
+    literals = ''.join(
+        f'        {name} = _residue({generator.constant(value)}, _m)\n'
+        for name, value in generator.residues.items())
+    loop_statements = ''.join(f'            {statement}\n'
+                              for statement in generator.statements)
+
+    source = (
+        f'def _evaluate_residues(_moduli, _size, {columns}):\n'
+        f'{reductions}'
+        f'    _table = []\n'
+        f'    {moduli}\n'
+        f'{literals}'
+        f'        _results = []\n'
+        f'        _append = _results.append\n'
+        f'        {loop}\n'
+        f'{loop_statements}'
+        f'            _append({body})\n'
+        f'        _table.append(_results)\n'
+        f'    return _table\n'
+    )
+
+    namespace: Dict[str, Any] = {'_zip': zip, '_range': range,
+                                 '_reduce': reduce_many, '_residue': residue}
+    namespace.update(generator.constants)
+    exec(compile(source, '<compiled expression>', 'exec'), namespace)
+
+    return namespace['_evaluate_residues']
+
+def _assemble(tree: Node, variables: Tuple[str, ...], parameters: List[str],
+              generator: _CodeGenerator, body: str) -> CompiledExpression:
+    signature = ', '.join(parameters)
+    columns = ', '.join(f'_column{index}' for index in range(len(parameters)))
+    unpacked = ''.join(f'{parameter}, ' for parameter in parameters)
+
+    if parameters:
+        loop = f'for {unpacked}in _zip({columns}):'
+    else:
+        loop = 'for _ in _range(_size):'
+
+    statements = ''.join(f'    {statement}\n'
+                         for statement in generator.statements)
+    loop_statements = ''.join(f'        {statement}\n'
+                              for statement in generator.statements)
+
+    source = (
+        f'def _evaluate({signature}):\n'
+        f'{statements}'
+        f'    return {body}\n'
+        f'\n'
+        f'def _evaluate_many(_size, {columns}):\n'
+        f'    _results = []\n'
+        f'    _append = _results.append\n'
+        f'    {loop}\n'
+        f'{loop_statements}'
+        f'        _append({body})\n'
+        f'    return _results\n'
+    )
+
+    namespace: Dict[str, Any] = {'_abs': abs, '_zip': zip, '_range': range,
+                                 '_divide': exact_divide,
+                                 '_power': exact_power}
+    namespace.update(generator.constants)
+    exec(compile(source, '<compiled expression>', 'exec'), namespace)
+
+    return CompiledExpression(tree, variables, namespace['_evaluate'],
+                              namespace['_evaluate_many'], source)
@@ -0,0 +1,379 @@
+import argparse
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+
+from evaluator.equivalence import canonical_form, canonical_hash
+from evaluator.nodes import Node
+
+Entry = Tuple[str, str, Tuple[str, ...], int | None]
+"""
+The canonical form of an expression: its text, its canonical hash as
+hexadecimal text, its essential variables and its total degree.
+"""
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS forms (
+    hash TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    variables TEXT NOT NULL,
+    degree INTEGER,
+    occurrences INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS form_variables (
+    hash TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (hash, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS forms_degree ON forms (degree);
+CREATE INDEX IF NOT EXISTS form_variables_name ON form_variables (name);
+'''
+
+def analyze(text: str | Node) -> Entry:
+    """
+    Compute the canonical form of an expression.
+
+    Parameters
+    ----------
+    text : str | Node
+        The expression, as text or as a parsed tree.
+
+    Returns
+    -------
+    Entry
+        The text, the canonical hash, the essential variables and the total
+        degree of the expression. The degree is None for expressions with a
+        non-constant divisor.
+
+    Raises
+    ------
+    ValueError
+        If the expression cannot be parsed or is not rational.
+    ZeroDivisionError
+        If the denominator of the expression vanishes everywhere.
+    """
+    key, variables, degree = canonical_form(text)
+
+    return str(text), format(key, 'x'), variables, degree
+
+def _analyze_chunk(texts: Sequence[str]) -> List[Entry | None]:
+    entries: List[Entry | None] = []
+
+    for text in texts:
+        try:
+            entries.append(analyze(text))
+        except (ValueError, ZeroDivisionError):
+            entries.append(None)
+
+    return entries
+
+class CorpusIndex:
+    """
+    An on-disk index of the distinct polynomials of a collection of
+    expressions.
+
+    Expressions are stored once per canonical hash, along with the number of
+    times they occurred, their essential variables and their total degree,
+    in an SQLite database. Membership and queries by variables and degree
+    are answered from the database without parsing the collection again.
+
+    Attributes
+    ----------
+    path : str
+        The path of the database, or ':memory:'.
+
+    Examples
+    --------
+    >>> index = CorpusIndex()
+    >>> index.ingest(['x*(y + 1)', 'x*y + x', 'x**5', '1 +'])
+    (2, 1, 1)
+    >>> 'x + x*y' in index
+    True
+    >>> index.query(variables=['x', 'y'], max_degree=4)
+    ['x*(y + 1)']
+    """
+
+    def __init__(self, path: str = ':memory:') -> None:
+        """
+        Initialize a CorpusIndex instance, creating the database if needed.
+
+        Parameters
+        ----------
+        path : str, optional
+            The path of the database. The default is ':memory:'.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def add(self, text: str | Node) -> bool:
+        """
+        Add an expression to the index.
+
+        Parameters
+        ----------
+        text : str | Node
+            The expression, as text or as a parsed tree.
+
+        Returns
+        -------
+        bool
+            True if the expression is new, False if an equivalent one was
+            already indexed.
+
+        Raises
+        ------
+        ValueError
+            If the expression cannot be parsed or is not rational.
+        ZeroDivisionError
+            If the denominator of the expression vanishes everywhere.
+        """
+        with self._connection:
+            return self._store(analyze(text))
+
+    def ingest(self, texts: Iterable[str], workers: int | None = 1,
+               chunk_size: int = 1024) -> Tuple[int, int, int]:
+        """
+        Add many expressions to the index, analyzing them in parallel.
+
+        Blank texts are skipped. Texts that cannot be parsed, or that are not
+        rational expressions, are counted as rejected.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The expressions.
+        workers : int | None, optional
+            The number of worker processes, or None for one per processor.
+            With a single worker the expressions are analyzed in this
+            process. The default is 1.
+        chunk_size : int, optional
+            The number of expressions sent to a worker at once, and stored
+            in a single transaction. The default is 1024.
+
+        Returns
+        -------
+        Tuple[int, int, int]
+            The numbers of new, duplicate and rejected expressions.
+        """
+        chunks = _chunks((text.strip() for text in texts if text.strip()),
+                         chunk_size)
+        added = duplicates = rejected = 0
+
+        if workers == 1:
+            results: Iterator[List[Entry | None]] = map(_analyze_chunk, chunks)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(workers)
+            results = executor.map(_analyze_chunk, chunks)
+
+        try:
+            for entries in results:
+                with self._connection:
+                    for entry in entries:
+                        if entry is None:
+                            rejected += 1
+                        elif self._store(entry):
+                            added += 1
+                        else:
+                            duplicates += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        return added, duplicates, rejected
+
+    def ingest_file(self, path: str, **kwargs) -> Tuple[int, int, int]:
+        """
+        Add the expressions of a file, one per line, to the index.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        **kwargs
+            Options of `ingest`.
+
+        Returns
+        -------
+        Tuple[int, int, int]
+            The numbers of new, duplicate and rejected expressions.
+        """
+        with open(path, encoding='utf-8') as file:
+            return self.ingest(file, **kwargs)
+
+    def find(self, text: str | Node) -> str | None:
+        """
+        Look up an expression equivalent to another.
+
+        Parameters
+        ----------
+        text : str | Node
+            The expression, as text or as a parsed tree.
+
+        Returns
+        -------
+        str | None
+            The text of the indexed expression, or None if there is none.
+
+        Raises
+        ------
+        ValueError
+            If the expression cannot be parsed or is not rational.
+        ZeroDivisionError
+            If the denominator of the expression vanishes everywhere.
+        """
+        row = self._connection.execute(
+            'SELECT text FROM forms WHERE hash = ?',
+            (format(canonical_hash(text), 'x'),)).fetchone()
+
+        return row[0] if row is not None else None
+
+    def query(self, variables: Iterable[str] | None = None,
+              max_degree: int | None = None) -> List[str]:
+        """
+        Get the indexed expressions with some variables and degree.
+
+        Parameters
+        ----------
+        variables : Iterable[str] | None, optional
+            The variables the expressions may depend on. Expressions that
+            depend on other variables are left out. All variables are
+            allowed if None, the default.
+        max_degree : int | None, optional
+            The maximum total degree. Only polynomials are returned if given.
+            The default is None.
+
+        Returns
+        -------
+        List[str]
+            The texts of the expressions, in the order they were indexed.
+        """
+        conditions: List[str] = []
+        parameters: List[Any] = []
+
+        if variables is not None:
+            names = sorted(set(variables))
+            conditions.append(f'''NOT EXISTS (
+                SELECT 1 FROM form_variables
+                WHERE form_variables.hash = forms.hash
+                AND name NOT IN ({", ".join("?" * len(names))}))''')
+            parameters.extend(names)
+
+        if max_degree is not None:
+            conditions.append('degree IS NOT NULL AND degree <= ?')
+            parameters.append(max_degree)
+
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        rows = self._connection.execute(
+            f'SELECT text FROM forms {where} ORDER BY rowid', parameters)
+
+        return [row[0] for row in rows]
+
+    def occurrences(self, text: str | Node) -> int:
+        """
+        Count the ingested expressions equivalent to another.
+
+        Parameters
+        ----------
+        text : str | Node
+            The expression, as text or as a parsed tree.
+
+        Returns
+        -------
+        int
+            The number of equivalent expressions added to the index.
+        """
+        row = self._connection.execute(
+            'SELECT occurrences FROM forms WHERE hash = ?',
+            (format(canonical_hash(text), 'x'),)).fetchone()
+
+        return row[0] if row is not None else 0
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        self._connection.close()
+
+    def _store(self, entry: Entry) -> bool:
+        text, key, variables, degree = entry
+        cursor = self._connection.execute(
+            'INSERT OR IGNORE INTO forms VALUES (?, ?, ?, ?, 1)',
+            (key, text, ','.join(variables), degree))
+
+        if cursor.rowcount == 0:
+            self._connection.execute('UPDATE forms SET occurrences = \
+occurrences + 1 WHERE hash = ?', (key,))
+
+            return False
+
+        self._connection.executemany(
+            'INSERT INTO form_variables VALUES (?, ?)',
+            [(key, name) for name in variables])
+
+        return True
+
+    def __contains__(self, text: str | Node) -> bool:
+        try:
+            return self.find(text) is not None
+        except (ValueError, ZeroDivisionError):
+            return False
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM forms').fetchone()[0]
+
+    def __enter__(self) -> 'CorpusIndex':
+        return self
+
+    def __exit__(self, *exception: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'CorpusIndex({self.path!r}, {len(self)} expressions)'
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Index the distinct polynomials of expression files.')
+    parser.add_argument('index', help='the path of the index database')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='add files to the index')
+    ingest.add_argument('files', nargs='+')
+    ingest.add_argument('--workers', type=int, default=None)
+
+    find = commands.add_parser('find', help='look up an expression')
+    find.add_argument('expression')
+
+    query = commands.add_parser('query', help='list indexed expressions')
+    query.add_argument('--variables', help='comma-separated names')
+    query.add_argument('--max-degree', type=int)
+
+    arguments = parser.parse_args()
+
+    with CorpusIndex(arguments.index) as index:
+        if arguments.command == 'ingest':
+            for path in arguments.files:
+                added, duplicates, rejected = index.ingest_file(
+                    path, workers=arguments.workers)
+                print(f'{path}: {added} new, {duplicates} duplicates, \
+{rejected} rejected')
+        elif arguments.command == 'find':
+            print(index.find(arguments.expression))
+        else:
+            variables = arguments.variables.split(',') \
+                if arguments.variables is not None else None
+
+            for text in index.query(variables, arguments.max_degree):
+                print(text)
+
+if __name__ == '__main__':
+    main()
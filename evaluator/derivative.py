@@ -0,0 +1,134 @@
+import math
+from typing import List, Tuple
+
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Node, Number, Variable)
+from evaluator.simplify import combine, is_constant, negate, simplify
+
+def differentiate(node: Node, variable: str) -> Node:
+    """
+    Compute the symbolic derivative of an expression.
+
+    Parameters
+    ----------
+    node : Node
+        The root of the expression tree.
+    variable : str
+        The name of the variable with respect to which the expression is
+        differentiated.
+
+    Returns
+    -------
+    Node
+        The simplified derivative of the expression.
+
+    Raises
+    ------
+    ValueError
+        If the expression contains an assignment to the differentiation
+        variable.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**3 + 2*x')
+    >>> differentiate(tree, 'x').to_text()
+    '3 * x ** 2 + 2'
+    """
+    return simplify(_derivative(simplify(node), variable))
+
+def _derivative(node: Node, variable: str) -> Node:
+    def step(node: Node, pairs: List[Tuple[Node, Node]]) -> Tuple[Node, Node]:
+        return node, _rule(node, pairs, variable)
+
+    return node.fold(step)[1]
+
+def _rule(node: Node, pairs: List[Tuple[Node, Node]], variable: str) -> Node:
+    match node:
+        case Number():
+            return Number(0)
+        case Variable():
+            return Number(1 if node.name == variable else 0)
+        case Negation():
+            return negate(pairs[0][1])
+        case Assignment():
+            if node.name == variable:
+                raise ValueError(f"cannot differentiate an assignment to \
+'{variable}'")
+
+            return pairs[0][1]
+        case AbsoluteValue():
+            u, du = pairs[0]
+
+            return combine('/', combine('*', u, du), node)
+        case Function():
+            du = pairs[0][1]
+
+            if is_constant(du, 0):
+                return du
+
+            return combine('*', _function_derivative(node), du)
+        case BinaryOperation():
+            return _binary_derivative(node.operator, *pairs[0], *pairs[1])
+
+    raise TypeError(f'unsupported node: {node!r}')
+
+def _binary_derivative(operator: str, u: Node, du: Node, v: Node,
+                       dv: Node) -> Node:
+    match operator:
+        case '+' | '-':
+            return combine(operator, du, dv)
+        case '*':
+            return combine('+', combine('*', du, v), combine('*', u, dv))
+        case '/':
+            numerator = combine('-', combine('*', du, v), combine('*', u, dv))
+
+            return combine('/', numerator, combine('**', v, Number(2)))
+
+    # Power rule, with the general form u**v * (v'*ln(u) + v*u'/u) used only
+    # when the exponent depends on the variable.
+    if is_constant(dv, 0):
+        if is_constant(du, 0):
+            return du
+
+        lowered = combine('-', v, Number(1))
+
+        return combine('*', combine('*', v, combine('**', u, lowered)), du)
+
+    logarithmic = combine('+', combine('*', dv, Function('ln', u)),
+                          combine('/', combine('*', v, du), u))
+
+    return combine('*', combine('**', u, v), logarithmic)
+
+def _function_derivative(node: Function) -> Node:
+    u = node.argument
+
+    match node.name:
+        case 'sin':
+            return Function('cos', u)
+        case 'cos':
+            return negate(Function('sin', u))
+        case 'tan':
+            return combine('/', Number(1),
+                           combine('**', Function('cos', u), Number(2)))
+        case 'asin' | 'acos':
+            root = Function('sqrt', combine('-', Number(1),
+                                            combine('**', u, Number(2))))
+            sign = Number(1) if node.name == 'asin' else Number(-1)
+
+            return combine('/', sign, root)
+        case 'atan':
+            return combine('/', Number(1),
+                           combine('+', Number(1), combine('**', u, Number(2))))
+        case 'exp':
+            return node
+        case 'ln':
+            return combine('/', Number(1), u)
+        case 'log2':
+            return combine('/', Number(1), combine('*', u, Number(math.log(2))))
+        case 'log10':
+            return combine('/', Number(1),
+                           combine('*', u, Number(math.log(10))))
+        case 'sqrt':
+            return combine('/', Number(1), combine('*', Number(2), node))
+
+    raise ValueError(f"unknown function '{node.name}'")
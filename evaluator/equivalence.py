@@ -0,0 +1,555 @@
+import hashlib
+import math
+import random
+from threading import Lock
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from evaluator.compiler import free_variables
+from evaluator.modular import modular_inverse, residue
+from evaluator.nodes import (Assignment, BinaryOperation, Negation, Node,
+                             Number, Variable)
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+FIELD_PRIME = 2**61 - 1
+"""
+The prime whose field the expressions are evaluated in.
+"""
+
+HASH_POINTS = 2
+"""
+The number of fixed points the canonical hash is computed at. Unrelated
+polynomials of total degree d collide with probability at most
+(d / FIELD_PRIME)**HASH_POINTS.
+"""
+
+_ATTEMPTS = 4
+
+# Texts are parsed exactly, so that decimal literals are rationals that can
+# be reduced modulo FIELD_PRIME.
+_parser: PolynomialTreeParser | None = None
+_parser_lock = Lock()
+
+def degree_bound(tree: Node) -> Tuple[int, int]:
+    """
+    Bound the degrees of a rational expression written as a single fraction.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the expression tree.
+
+    Returns
+    -------
+    Tuple[int, int]
+        Upper bounds of the total degrees of the numerator and of the
+        denominator.
+
+    Raises
+    ------
+    ValueError
+        If the expression is not rational, for example if it contains an
+        absolute value, a function or a non-integer exponent.
+
+    Examples
+    --------
+    >>> degree_bound(PolynomialTreeParser.build().parse('x**2 / (x*y + 1)'))
+    (2, 2)
+    """
+    assigned: Dict[str, Tuple[int, int]] = {}
+
+    def step(node: Node, children: List[Tuple[int, int]]) -> Tuple[int, int]:
+        match node:
+            case Number():
+                return 0, 0
+            case Variable():
+                return assigned.get(node.name, (1, 0))
+            case Assignment():
+                assigned[node.name] = children[0]
+
+                return children[0]
+            case Negation():
+                return children[0]
+            case BinaryOperation(operator='+' | '-'):
+                (n1, d1), (n2, d2) = children
+
+                return max(n1 + d2, n2 + d1), d1 + d2
+            case BinaryOperation(operator='*'):
+                (n1, d1), (n2, d2) = children
+
+                return n1 + n2, d1 + d2
+            case BinaryOperation(operator='/'):
+                (n1, d1), (n2, d2) = children
+
+                return n1 + d2, d1 + n2
+            case BinaryOperation(operator='**'):
+                exponent = _exponent(node.right)
+                numerator, denominator = children[0]
+
+                if exponent < 0:
+                    numerator, denominator = denominator, numerator
+
+                return numerator * abs(exponent), denominator * abs(exponent)
+
+        raise ValueError(f'not a rational expression: {node.to_text()}')
+
+    return tree.fold(step)
+
+def evaluate_points(tree: Node, points: Dict[str, Sequence[int]], count: int,
+                    modulus: int = FIELD_PRIME) -> List[int]:
+    """
+    Evaluate a rational expression modulo a prime at several points at once.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the expression tree.
+    points : Dict[str, Sequence[int]]
+        For every free variable, its residues at all the points.
+    count : int
+        The number of points.
+    modulus : int, optional
+        The prime modulus. The default is FIELD_PRIME.
+
+    Returns
+    -------
+    List[int]
+        The residues of the expression at the points.
+
+    Raises
+    ------
+    KeyError
+        If a variable of the expression has no value.
+    ValueError
+        If the expression is not rational.
+    ZeroDivisionError
+        If a denominator vanishes at one of the points.
+    """
+    assigned: Dict[str, List[int]] = {}
+
+    def step(node: Node, children: List[List[int]]) -> List[int]:
+        match node:
+            case Number():
+                return [residue(node.value, modulus)] * count
+            case Variable():
+                if node.name in assigned:
+                    return assigned[node.name]
+
+                return list(points[node.name])
+            case Assignment():
+                assigned[node.name] = children[0]
+
+                return children[0]
+            case Negation():
+                return [-a % modulus for a in children[0]]
+            case BinaryOperation(operator='+'):
+                return [(a + b) % modulus for a, b in zip(*children)]
+            case BinaryOperation(operator='-'):
+                return [(a - b) % modulus for a, b in zip(*children)]
+            case BinaryOperation(operator='*'):
+                return [a * b % modulus for a, b in zip(*children)]
+            case BinaryOperation(operator='/'):
+                return [a * modular_inverse(b, modulus) % modulus
+                        for a, b in zip(*children)]
+            case BinaryOperation(operator='**'):
+                exponent = _exponent(node.right)
+
+                if exponent < 0:
+                    return [pow(modular_inverse(a, modulus), -exponent,
+                                modulus) for a in children[0]]
+
+                return [pow(a, exponent, modulus) for a in children[0]]
+
+        raise ValueError(f'not a rational expression: {node.to_text()}')
+
+    return tree.fold(step)
+
+def equivalent(text_a: str | Node, text_b: str | Node,
+               error: float = 2.0**-64) -> bool:
+    """
+    Decide whether two expressions denote the same rational function.
+
+    Both expressions are evaluated at random points over the field of
+    integers modulo FIELD_PRIME. Different functions only agree at a random
+    point with probability at most d / FIELD_PRIME, where d bounds the degree
+    of the numerator of their difference (Schwartz-Zippel lemma), so enough
+    points are drawn for the probability of a wrong answer to stay below
+    `error`. A True answer may be wrong with that probability, a False
+    answer is always right, except for expressions whose rational
+    coefficients only differ by multiples of FIELD_PRIME.
+
+    Texts are parsed in exact mode, so decimal literals are read as the
+    rationals they denote. Trees must hold exact numbers too: trees of a
+    parser built with `exact=True`.
+
+    Parameters
+    ----------
+    text_a : str | Node
+        The first expression, as text or as a parsed tree.
+    text_b : str | Node
+        The second expression, as text or as a parsed tree.
+    error : float, optional
+        The maximum probability of a wrong answer. The default is 2**-64.
+
+    Returns
+    -------
+    bool
+        True if the expressions are equivalent with probability at least
+        1 - `error`, False if they are not.
+
+    Raises
+    ------
+    ValueError
+        If an expression cannot be parsed, holds several statements or is
+        not rational.
+    ZeroDivisionError
+        If the denominator of an expression vanishes everywhere.
+
+    Examples
+    --------
+    >>> equivalent('(x + y)**2', 'x**2 + 2*x*y + y**2')
+    True
+    >>> equivalent('(x + 1) / (x**2 - 1)', '1 / (x - 1)')
+    True
+    >>> equivalent('x**2', 'x**3')
+    False
+    >>> equivalent('0.5*x', 'x/2')
+    True
+    """
+    tree_a, tree_b = _parse(text_a), _parse(text_b)
+    (n1, d1), (n2, d2) = degree_bound(tree_a), degree_bound(tree_b)
+    degree = max(n1 + d2, n2 + d1)
+
+    if degree >= FIELD_PRIME:
+        raise ValueError('the degrees are too high for the field')
+
+    trials = 1 if degree == 0 else \
+        max(1, math.ceil(math.log(error) / math.log(degree / FIELD_PRIME)))
+    names = sorted(set(free_variables(tree_a)) | set(free_variables(tree_b)))
+
+    for attempt in range(_ATTEMPTS):
+        points = {name: [random.randrange(FIELD_PRIME) for _ in range(trials)]
+                  for name in names}
+
+        try:
+            return evaluate_points(tree_a, points, trials) == \
+                evaluate_points(tree_b, points, trials)
+        except ZeroDivisionError:
+            if attempt == _ATTEMPTS - 1:
+                raise
+
+    raise AssertionError('unreachable')
+
+def canonical_hash(text: str | Node) -> int:
+    """
+    Hash an expression so that equivalent expressions share the hash.
+
+    The expression is evaluated modulo FIELD_PRIME at HASH_POINTS fixed
+    points, where the value of every variable is derived from its name, so
+    the hash is the same in every process and can be stored. Equivalent
+    expressions always have the same hash, while different ones collide
+    with a probability that is negligible for any realistic degree.
+
+    Parameters
+    ----------
+    text : str | Node
+        The expression, as text or as a parsed tree.
+
+    Returns
+    -------
+    int
+        A non-negative integer below FIELD_PRIME**HASH_POINTS.
+
+    Raises
+    ------
+    ValueError
+        If the expression cannot be parsed, holds several statements or is
+        not rational.
+    ZeroDivisionError
+        If the denominator of the expression vanishes everywhere.
+
+    Examples
+    --------
+    >>> canonical_hash('(x - 1) * (x + 1)') == canonical_hash('x**2 - 1')
+    True
+    """
+    tree = _parse(text)
+
+    return _evaluate_fixed(tree, [_hash_probe()])[0]
+
+def essential_variables(text: str | Node) -> Tuple[str, ...]:
+    """
+    Get the variables an expression actually depends on.
+
+    Variables that cancel out, like x in 'x - x + y', are left out. Each
+    variable is changed in turn at a fixed point, and it is kept if the
+    value of the expression changes, so a variable may wrongly be left out
+    with negligible probability.
+
+    Parameters
+    ----------
+    text : str | Node
+        The expression, as text or as a parsed tree.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The sorted names of the variables.
+
+    Raises
+    ------
+    ValueError
+        If the expression cannot be parsed, holds several statements or is
+        not rational.
+    ZeroDivisionError
+        If the denominator of the expression vanishes everywhere.
+
+    Examples
+    --------
+    >>> essential_variables('x*y - y*x + z')
+    ('z',)
+    """
+    tree = _parse(text)
+
+    return _evaluate_fixed(tree, [_variables_probe(free_variables(tree))])[0]
+
+def total_degree(text: str | Node) -> int | None:
+    """
+    Get the total degree of a polynomial expression.
+
+    The expression is restricted to a line through fixed points, where it
+    becomes a univariate polynomial of the same degree with overwhelming
+    probability, and the degree is read from its finite differences. This
+    takes a number of evaluations proportional to the degree, but no
+    expansion.
+
+    Parameters
+    ----------
+    text : str | Node
+        The expression, as text or as a parsed tree.
+
+    Returns
+    -------
+    int | None
+        The total degree, -1 for the zero polynomial, or None if the
+        expression contains a division or a negative power with a
+        non-constant divisor.
+
+    Raises
+    ------
+    ValueError
+        If the expression cannot be parsed, holds several statements or is
+        not rational.
+
+    Examples
+    --------
+    >>> total_degree('(x + y)**2 - x**2 - y**2')
+    2
+    """
+    tree = _parse(text)
+    numerator, denominator = degree_bound(tree)
+
+    if denominator:
+        return None
+
+    return _evaluate_fixed(tree, [_degree_probe(numerator)])[0]
+
+def canonical_form(text: str | Node) -> Tuple[int, Tuple[str, ...],
+                                              int | None]:
+    """
+    Get the canonical hash, the essential variables and the total degree of
+    an expression at once.
+
+    The results are those of `canonical_hash`, `essential_variables` and
+    `total_degree`, but the expression is parsed once and all the points are
+    evaluated in a single pass over the tree.
+
+    Parameters
+    ----------
+    text : str | Node
+        The expression, as text or as a parsed tree.
+
+    Returns
+    -------
+    Tuple[int, Tuple[str, ...], int | None]
+        The canonical hash, the essential variables and the total degree.
+
+    Raises
+    ------
+    ValueError
+        If the expression cannot be parsed, holds several statements or is
+        not rational.
+    ZeroDivisionError
+        If the denominator of the expression vanishes everywhere.
+    """
+    tree = _parse(text)
+    numerator, denominator = degree_bound(tree)
+    probes = [_hash_probe(), _variables_probe(free_variables(tree))]
+
+    if not denominator:
+        probes.append(_degree_probe(numerator))
+
+    try:
+        results = _evaluate_fixed(tree, probes, attempts=1)
+    except ZeroDivisionError:
+        # The separate functions move to new points independently.
+        return canonical_hash(tree), essential_variables(tree), \
+            total_degree(tree)
+
+    return results[0], results[1], results[2] if not denominator else None
+
+_Probe = Tuple[int, Callable[[str, int], List[int]],
+               Callable[[List[int]], Any]]
+
+def _hash_probe() -> _Probe:
+    def column(name: str, attempt: int) -> List[int]:
+        return [_field_element('hash', name, attempt * HASH_POINTS + index)
+                for index in range(HASH_POINTS)]
+
+    def finish(values: List[int]) -> int:
+        result = 0
+
+        for value in values:
+            result = result * FIELD_PRIME + value
+
+        return result
+
+    return HASH_POINTS, column, finish
+
+def _variables_probe(names: Tuple[str, ...]) -> _Probe:
+    # The first point is a base point, and each of the others moves one
+    # variable away from it.
+    def column(name: str, attempt: int) -> List[int]:
+        values = [_field_element('base', name, attempt)] * (len(names) + 1)
+        values[names.index(name) + 1] = _field_element('moved', name, attempt)
+
+        return values
+
+    def finish(values: List[int]) -> Tuple[str, ...]:
+        return tuple(name for index, name in enumerate(names)
+                     if values[index + 1] != values[0])
+
+    return len(names) + 1, column, finish
+
+def _degree_probe(bound: int) -> _Probe:
+    def column(name: str, attempt: int) -> List[int]:
+        origin = _field_element('origin', name, attempt)
+        direction = _field_element('direction', name, attempt)
+
+        return [(origin + t * direction) % FIELD_PRIME
+                for t in range(bound + 1)]
+
+    # The k-th finite difference at the first point is k! times the
+    # coefficient of the Newton basis polynomial of degree k. It vanishes
+    # for every k above the degree, is not zero for the degree itself and,
+    # since the line is random, is not zero below it with overwhelming
+    # probability, so the degree is found by a binary search. A single
+    # difference, a sum over the first k + 1 values weighted by binomial
+    # coefficients, takes O(k) operations, so the search takes O(bound) when
+    # the bound is the degree and O(bound log bound) otherwise, instead of
+    # the O(bound**2) of the whole difference table.
+    def finish(values: List[int]) -> int:
+        inverses = [0, 1]
+
+        for i in range(2, bound + 1):
+            inverses.append(-(FIELD_PRIME // i) *
+                            inverses[FIELD_PRIME % i] % FIELD_PRIME)
+
+        def vanishes(k: int) -> bool:
+            # The sign of the difference does not matter.
+            total = values[0]
+            binomial = 1
+
+            for j in range(1, k + 1):
+                binomial = -binomial * (k - j + 1) % FIELD_PRIME * \
+                    inverses[j] % FIELD_PRIME
+                total += binomial * values[j]
+
+            return total % FIELD_PRIME == 0
+
+        if not vanishes(bound):
+            return bound
+
+        # The difference of order `high` vanishes, the one of order `low`
+        # does not, unless `low` is -1.
+        low, high = -1, bound
+
+        while high - low > 1:
+            middle = (low + high) // 2
+
+            if vanishes(middle):
+                high = middle
+            else:
+                low = middle
+
+        return low
+
+    return bound + 1, column, finish
+
+def _evaluate_fixed(tree: Node, probes: List[_Probe],
+                    attempts: int = _ATTEMPTS) -> List[Any]:
+    # Points are derived from the variable names and the attempt number, so
+    # results are reproducible. A vanishing denominator moves to new points.
+    names = free_variables(tree)
+    count = sum(probe[0] for probe in probes)
+
+    for attempt in range(attempts):
+        points = {name: [value for _, column, _ in probes
+                         for value in column(name, attempt)]
+                  for name in names}
+
+        try:
+            values = evaluate_points(tree, points, count)
+        except ZeroDivisionError:
+            if attempt == attempts - 1:
+                raise
+
+            continue
+
+        results = []
+        start = 0
+
+        for size, _, finish in probes:
+            results.append(finish(values[start:start + size]))
+            start += size
+
+        return results
+
+    raise AssertionError('unreachable')
+
+def _parse(text: str | Node) -> Node:
+    if isinstance(text, Node):
+        return text
+
+    global _parser
+
+    with _parser_lock:
+        if _parser is None:
+            _parser = PolynomialTreeParser.build(exact=True, scanner=True,
+                                                 pratt=True)
+
+        trees = _parser.parse_document(text)
+
+    if not trees:
+        raise ValueError(f'invalid expression: {text!r}')
+
+    # Earlier statements could assign variables of the last one, which would
+    # then be compared as free variables.
+    if len(trees) > 1:
+        raise ValueError(f'expected a single expression: {text!r}')
+
+    return trees[0]
+
+def _exponent(node: Node) -> int:
+    if isinstance(node, Negation):
+        return -_exponent(node.operand)
+
+    if isinstance(node, Number) and type(node.value) is int:
+        return node.value
+
+    raise ValueError(f'not an integer exponent: {node.to_text()}')
+
+def _field_element(*key: Any) -> int:
+    digest = hashlib.blake2b('\0'.join(map(str, key)).encode(),
+                             digest_size=16).digest()
+
+    return int.from_bytes(digest, 'little') % FIELD_PRIME
@@ -0,0 +1,119 @@
+from fractions import Fraction
+from math import lcm
+from typing import Any, Iterable
+
+def is_rational(value: Any) -> bool:
+    """
+    Check whether a value is an exact rational number.
+
+    Parameters
+    ----------
+    value : Any
+        The value to be checked.
+
+    Returns
+    -------
+    bool
+        True if the value is an int or a Fraction, False otherwise. Booleans
+        are not considered rational numbers.
+    """
+    return type(value) is int or type(value) is Fraction
+
+def normalize(value: Any) -> Any:
+    """
+    Convert fractions with a denominator of one to integers.
+
+    Parameters
+    ----------
+    value : Any
+        The value to be normalized.
+
+    Returns
+    -------
+    Any
+        The numerator of the value if it is an integral Fraction, the value
+        itself otherwise.
+    """
+    if type(value) is Fraction and value.denominator == 1:
+        return value.numerator
+
+    return value
+
+def exact_divide(a: Any, b: Any) -> Any:
+    """
+    Divide two numbers, exactly if both are rational.
+
+    Parameters
+    ----------
+    a : Any
+        The dividend.
+    b : Any
+        The divisor.
+
+    Returns
+    -------
+    Any
+        The quotient as an int or a Fraction if both operands are rational,
+        `a / b` otherwise.
+
+    Raises
+    ------
+    ZeroDivisionError
+        If the divisor is zero.
+
+    Examples
+    --------
+    >>> exact_divide(1, 3)
+    Fraction(1, 3)
+    >>> exact_divide(6, 3)
+    2
+    """
+    if is_rational(a) and is_rational(b):
+        return normalize(Fraction(a) / b)
+
+    return a / b
+
+def exact_power(a: Any, b: Any) -> Any:
+    """
+    Raise a number to a power, exactly if the result is rational.
+
+    Parameters
+    ----------
+    a : Any
+        The base.
+    b : Any
+        The exponent.
+
+    Returns
+    -------
+    Any
+        The power as an int or a Fraction if the base is rational and the
+        exponent is an integer, `a ** b` otherwise.
+
+    Examples
+    --------
+    >>> exact_power(2, -2)
+    Fraction(1, 4)
+    """
+    if is_rational(a) and type(b) is int:
+        return normalize(Fraction(a) ** b) if b < 0 else a ** b
+
+    return a ** b
+
+def common_denominator(values: Iterable[Any]) -> int:
+    """
+    Get the least common multiple of the denominators of rational numbers.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        Integers and fractions.
+
+    Returns
+    -------
+    int
+        The smallest positive integer whose products with all the values are
+        integers.
+    """
+    return lcm(1, *(value.denominator for value in values
+                    if type(value) is Fraction))
@@ -0,0 +1,388 @@
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from evaluator.compiler import free_variables
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Node, Number, Variable)
+
+Compute = Callable[[List[Any]], Any]
+
+CHAIN_BLOCK = 8
+"""
+The largest number of operands of a chain of additions or multiplications
+that is kept in a single node. Longer chains are split into blocks of this
+size, combined along a balanced tree.
+"""
+
+class IncrementalEvaluator:
+    """
+    An evaluator that recomputes only the subexpressions affected by the
+    variables that changed since the previous evaluation.
+
+    The tree is flattened into a graph where equal subexpressions are shared
+    and chains of additions or multiplications become a single node with up
+    to `CHAIN_BLOCK` operands. Every node keeps its last value along with the
+    nodes that depend on it, so changing a variable recomputes the nodes on
+    the paths from its occurrences to the root, and nothing else.
+
+    Short chains are evaluated from left to right, so their results are
+    identical to those of the parser. Longer chains are split into blocks
+    whose sums, or products, are combined along a balanced tree, so that
+    changing one operand of a chain of n operands recomputes O(log n) nodes
+    of bounded size. Their floating point results may then differ from
+    those of the parser in the last bits.
+
+    Attributes
+    ----------
+    tree : Node
+        The expression tree.
+    variables : Tuple[str, ...]
+        The names of the variables that must be bound.
+    bindings : Dict[str, Any]
+        The current values of the variables.
+    recomputed : int
+        The number of nodes computed by the last evaluation.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**2 + sin(y) * 3')
+    >>> evaluator = IncrementalEvaluator(tree)
+    >>> evaluator.evaluate(x=1, y=0)
+    1.0
+    >>> evaluator.update(x=2)
+    4.0
+    >>> evaluator.recomputed
+    3
+    """
+
+    def __init__(self, tree: Node) -> None:
+        """
+        Initialize an IncrementalEvaluator instance.
+
+        Parameters
+        ----------
+        tree : Node
+            The root of the expression tree.
+        """
+        self.tree = tree
+        self.variables = free_variables(tree)
+        self.bindings: Dict[str, Any] = {}
+        self.recomputed = 0
+
+        self._computes: List[Compute] = []
+        self._children: List[Tuple[int, ...]] = []
+        self._parents: List[List[int]] = []
+        self._leaves: Dict[str, List[int]] = {name: []
+                                              for name in self.variables}
+        self._values: List[Any] = []
+        self._valid = False
+        self._build()
+
+    def evaluate(self, **kwargs) -> Any:
+        """
+        Evaluate the whole expression.
+
+        Parameters
+        ----------
+        **kwargs
+            Values of the variables. Variables that are not given keep the
+            value they had in the previous evaluation.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value.
+        """
+        bindings = {**self.bindings, **kwargs}
+        missing = [name for name in self.variables if name not in bindings]
+
+        if missing:
+            raise KeyError(missing[0])
+
+        self.bindings = bindings
+        self._valid = False
+        self._recompute(range(len(self._computes)))
+        self._valid = True
+
+        return self._values[-1]
+
+    def update(self, **kwargs) -> Any:
+        """
+        Change some variables and recompute the affected subexpressions.
+
+        Parameters
+        ----------
+        **kwargs
+            The new values of the variables that changed.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+
+        Raises
+        ------
+        KeyError
+            If a variable of the expression has no value.
+        """
+        if not self._valid:
+            return self.evaluate(**kwargs)
+
+        dirty: set = set()
+        pending: List[int] = []
+
+        for name, value in kwargs.items():
+            previous = self.bindings.get(name)
+            self.bindings[name] = value
+
+            if type(previous) is type(value) and previous == value:
+                continue
+
+            pending.extend(self._leaves.get(name, ()))
+
+        parents = self._parents
+
+        while pending:
+            index = pending.pop()
+
+            if index not in dirty:
+                dirty.add(index)
+                pending.extend(parents[index])
+
+        self._valid = False
+        # Node indices follow the evaluation order, so children are
+        # recomputed before their parents.
+        self._recompute(sorted(dirty))
+        self._valid = True
+
+        return self._values[-1]
+
+    @property
+    def value(self) -> Any:
+        """
+        Get the value computed by the last evaluation.
+
+        Returns
+        -------
+        Any
+            The value of the expression.
+
+        Raises
+        ------
+        RuntimeError
+            If the expression has not been evaluated, or if the last
+            evaluation failed.
+        """
+        if not self._valid:
+            raise RuntimeError('the expression has not been evaluated')
+
+        return self._values[-1]
+
+    def _recompute(self, indices: Sequence[int]) -> None:
+        computes = self._computes
+        children = self._children
+        values = self._values
+
+        for index in indices:
+            values[index] = computes[index]([values[child]
+                                             for child in children[index]])
+
+        self.recomputed = len(indices)
+
+    def _add(self, compute: Compute, children: Sequence[int]) -> int:
+        index = len(self._computes)
+        self._computes.append(compute)
+        self._children.append(tuple(children))
+        self._parents.append([])
+        self._values.append(None)
+
+        for child in set(children):
+            self._parents[child].append(index)
+
+        return index
+
+    def _build(self) -> None:
+        # Equal subtrees can only share a node when no variable is assigned,
+        # otherwise a variable may have different values at different places.
+        share = not any(isinstance(node, Assignment)
+                        for node in self.tree.walk())
+        indices: Dict[Node, int] = {}
+        definitions: Dict[str, int] = {}
+        results: List[int] = []
+        stack: List[Tuple[Node, Any]] = [(self.tree, None)]
+
+        while stack:
+            node, expansion = stack.pop()
+
+            if expansion is None:
+                if share and node in indices:
+                    results.append(indices[node])
+                    continue
+
+                expansion = _operands(node)
+                stack.append((node, expansion))
+
+                for child in reversed(expansion[1]):
+                    stack.append((child, None))
+
+                continue
+
+            compute, operands, operators = expansion
+
+            if operands:
+                children = results[-len(operands):]
+                del results[-len(operands):]
+            else:
+                children = []
+
+            match node:
+                case Variable() if node.name in definitions:
+                    index = self._add(_first, [definitions[node.name]])
+                case Variable():
+                    index = self._add(self._reader(node.name), [])
+                    self._leaves[node.name].append(index)
+                case Assignment():
+                    index = self._add(_first, children)
+                    definitions[node.name] = index
+                case _ if len(children) > CHAIN_BLOCK:
+                    index = self._add_chain(operators, children)
+                case _:
+                    index = self._add(compute, children)
+
+            if share:
+                indices[node] = index
+
+            results.append(index)
+
+    def _add_chain(self, operators: List[str], children: List[int]) -> int:
+        # The first block is evaluated from left to right. Every other block
+        # gives the sum, or product, of its operands that follow the direct
+        # operator and of those that follow the inverse one, and these pairs
+        # are merged two by two up to the root of the chain.
+        direct = '+' if operators[0] in ('+', '-') else '*'
+        operations = [BinaryOperation.operations[operator]
+                      for operator in operators[:CHAIN_BLOCK - 1]]
+        first = self._add(_chain(operations), children[:CHAIN_BLOCK])
+        level = []
+
+        for start in range(CHAIN_BLOCK, len(children), CHAIN_BLOCK):
+            block = operators[start - 1:start + CHAIN_BLOCK - 1]
+            level.append(self._add(_part(direct, block),
+                                   children[start:start + CHAIN_BLOCK]))
+
+        merge = _merge(direct)
+
+        while len(level) > 1:
+            merged = [self._add(merge, level[index:index + 2])
+                      for index in range(0, len(level) - 1, 2)]
+
+            if len(level) % 2:
+                merged.append(level[-1])
+
+            level = merged
+
+        return self._add(_apply(direct), [first, level[0]])
+
+    def _reader(self, name: str) -> Compute:
+        return lambda _: self.bindings[name]
+
+def _first(values: List[Any]) -> Any:
+    return values[0]
+
+def _chain(operations: List[Callable[[Any, Any], Any]]) -> Compute:
+    def compute(values: List[Any]) -> Any:
+        accumulator = values[0]
+
+        for operation, value in zip(operations, values[1:]):
+            accumulator = operation(accumulator, value)
+
+        return accumulator
+
+    return compute
+
+def _part(direct: str, operators: List[str]) -> Compute:
+    operation = BinaryOperation.operations[direct]
+
+    def compute(values: List[Any]) -> Any:
+        parts: List[Any] = [None, None]
+
+        for operator, value in zip(operators, values):
+            side = operator != direct
+            parts[side] = value if parts[side] is None else \
+                operation(parts[side], value)
+
+        return parts
+
+    return compute
+
+def _merge(direct: str) -> Compute:
+    operation = BinaryOperation.operations[direct]
+
+    def compute(values: List[Any]) -> Any:
+        return [right if left is None else left if right is None else
+                operation(left, right) for left, right in zip(*values)]
+
+    return compute
+
+def _apply(direct: str) -> Compute:
+    operation = BinaryOperation.operations[direct]
+    inverse = BinaryOperation.operations['-' if direct == '+' else '/']
+
+    def compute(values: List[Any]) -> Any:
+        accumulator, (forward, backward) = values
+
+        if forward is not None:
+            accumulator = operation(accumulator, forward)
+
+        if backward is not None:
+            accumulator = inverse(accumulator, backward)
+
+        return accumulator
+
+    return compute
+
+def _operands(node: Node) -> Tuple[Compute, List[Node], List[str]]:
+    match node:
+        case Number():
+            value = node.value
+
+            return (lambda _: value), [], []
+        case BinaryOperation() if node.operator != '**':
+            precedence = node.precedence
+            operators: List[str] = []
+            operands: List[Node] = []
+            first: Node = node
+
+            while isinstance(first, BinaryOperation) and \
+                  first.precedence == precedence:
+                operators.append(first.operator)
+                operands.append(first.right)
+                first = first.left
+
+            operators.reverse()
+            operands.append(first)
+            operands.reverse()
+
+            return _chain([BinaryOperation.operations[operator]
+                           for operator in operators]), operands, operators
+        case BinaryOperation():
+            return (lambda values: values[0] ** values[1]), \
+                [node.left, node.right], []
+        case Negation():
+            return (lambda values: -values[0]), [node.operand], []
+        case AbsoluteValue():
+            return (lambda values: abs(values[0])), [node.operand], []
+        case Function():
+            function = Function.implementations[node.name]
+
+            return (lambda values: function(values[0])), [node.argument], []
+        case Variable():
+            return _first, [], []
+        case Assignment():
+            return _first, [node.expression], []
+
+    raise TypeError(f'unsupported node: {node!r}')
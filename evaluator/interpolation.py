@@ -0,0 +1,315 @@
+from fractions import Fraction
+from itertools import combinations_with_replacement
+from math import frexp, ldexp, sqrt
+from typing import Any, List, Sequence
+
+from evaluator.exact import is_rational, normalize
+from evaluator.nodes import BinaryOperation, Node, Number, Variable
+from evaluator.polynomial import Monomial, Polynomial
+
+def _check_samples(xs: Sequence[Any], ys: Sequence[Any]) -> None:
+    if len(xs) != len(ys):
+        raise ValueError('xs and ys must have the same length')
+
+    if not xs:
+        raise ValueError('at least one sample is required')
+
+    if len(set(xs)) != len(xs):
+        raise ValueError('the sample abscissas must be distinct')
+
+def divided_differences(xs: Sequence[Any], ys: Sequence[Any]) -> List[Any]:
+    """
+    Compute the coefficients of the Newton form of an interpolating
+    polynomial.
+
+    Integer and fractional samples are interpolated exactly with fractions.
+
+    Parameters
+    ----------
+    xs : Sequence[Any]
+        The distinct sample abscissas.
+    ys : Sequence[Any]
+        The sample values.
+
+    Returns
+    -------
+    List[Any]
+        The divided differences f[x0], f[x0, x1], ..., f[x0, ..., xn].
+
+    Raises
+    ------
+    ValueError
+        If the samples are empty, have different lengths or repeat an
+        abscissa.
+    """
+    _check_samples(xs, ys)
+
+    exact = all(is_rational(value) for value in (*xs, *ys))
+    table = [Fraction(y) if exact else y for y in ys]
+
+    for order in range(1, len(xs)):
+        for index in range(len(xs) - 1, order - 1, -1):
+            table[index] = (table[index] - table[index - 1]) / \
+                (xs[index] - xs[index - order])
+
+    return [normalize(value) for value in table]
+
+def newton_interpolation(xs: Sequence[Any], ys: Sequence[Any],
+                         variable: str = 'x') -> Polynomial:
+    """
+    Build the polynomial of lowest degree through univariate samples.
+
+    The Newton divided differences are converted to the monomial basis, so
+    the result can be compiled, expanded or evaluated like a parsed
+    expression, without going through its textual form.
+
+    Parameters
+    ----------
+    xs : Sequence[Any]
+        The distinct sample abscissas.
+    ys : Sequence[Any]
+        The sample values.
+    variable : str, optional
+        The name of the variable of the polynomial. The default is 'x'.
+
+    Returns
+    -------
+    Polynomial
+        The interpolating polynomial.
+
+    Raises
+    ------
+    ValueError
+        If the samples are empty, have different lengths or repeat an
+        abscissa.
+
+    Examples
+    --------
+    >>> p = newton_interpolation([0, 1, 2], [1, 3, 9])
+    >>> p.to_tree().to_text()
+    '2 * x ** 2 + 1'
+    """
+    differences = divided_differences(xs, ys)
+
+    # Horner's scheme on the Newton form, expanded one factor at a time.
+    coefficients: List[Any] = [differences[-1]]
+
+    for difference, x in zip(reversed(differences[:-1]),
+                             reversed(xs[:len(differences) - 1])):
+        shifted = [0] + coefficients
+        for index, coefficient in enumerate(coefficients):
+            shifted[index] -= coefficient * x
+        shifted[0] += difference
+        coefficients = shifted
+
+    terms = {(power,): normalize(coefficient)
+             for power, coefficient in enumerate(coefficients)}
+
+    return Polynomial((variable,), terms)
+
+def barycentric_interpolation(xs: Sequence[Any], ys: Sequence[Any],
+                              variable: str = 'x') -> Node:
+    """
+    Build the barycentric form of the polynomial through univariate samples.
+
+    The second barycentric formula is numerically stable for high degrees,
+    unlike the monomial basis. It cannot be evaluated exactly at the sample
+    abscissas, where it divides by zero.
+
+    Parameters
+    ----------
+    xs : Sequence[Any]
+        The distinct sample abscissas.
+    ys : Sequence[Any]
+        The sample values.
+    variable : str, optional
+        The name of the variable of the expression. The default is 'x'.
+
+    Returns
+    -------
+    Node
+        An expression tree that can be compiled like a parsed expression.
+
+    Raises
+    ------
+    ValueError
+        If the samples are empty, have different lengths or repeat an
+        abscissa.
+    """
+    _check_samples(xs, ys)
+
+    exact = all(is_rational(value) for value in (*xs, *ys))
+    weights: List[Any] = []
+
+    # The formula is invariant under a common scaling of the weights, so the
+    # differences are scaled by the capacity of the interval, and the floating
+    # point products are kept normalized, to avoid overflow and underflow.
+    scale = 4 / ((max(xs) - min(xs)) or 1)
+
+    for j, xj in enumerate(xs):
+        if exact:
+            product = Fraction(1)
+
+            for k, xk in enumerate(xs):
+                if k != j:
+                    product *= xj - xk
+
+            weights.append(1 / product)
+            continue
+
+        mantissa, exponent = 1.0, 0
+
+        for k, xk in enumerate(xs):
+            if k != j:
+                mantissa, shift = frexp(mantissa * (xj - xk) * scale)
+                exponent += shift
+
+        weights.append(ldexp(1 / mantissa, -exponent))
+
+    x = Variable(variable)
+    numerator: Node | None = None
+    denominator: Node | None = None
+
+    for xj, yj, wj in zip(xs, ys, weights):
+        difference = BinaryOperation('-', x, Number(xj))
+        numerator_term = BinaryOperation('/', Number(wj * yj), difference)
+        denominator_term = BinaryOperation('/', Number(wj), difference)
+
+        if numerator is None or denominator is None:
+            numerator, denominator = numerator_term, denominator_term
+        else:
+            numerator = BinaryOperation('+', numerator, numerator_term)
+            denominator = BinaryOperation('+', denominator, denominator_term)
+
+    return BinaryOperation('/', numerator, denominator)
+
+def monomial_basis(variable_count: int, degree: int) -> List[Monomial]:
+    """
+    Get all the monomials up to a total degree.
+
+    Parameters
+    ----------
+    variable_count : int
+        The number of variables.
+    degree : int
+        The maximum total degree.
+
+    Returns
+    -------
+    List[Monomial]
+        The exponent tuples of the monomials, by increasing degree.
+    """
+    basis: List[Monomial] = []
+
+    for total in range(degree + 1):
+        for choice in combinations_with_replacement(range(variable_count),
+                                                    total):
+            exponents = [0] * variable_count
+
+            for index in choice:
+                exponents[index] += 1
+
+            basis.append(tuple(exponents))
+
+    return basis
+
+def least_squares_fit(points: Sequence[Sequence[float]],
+                      values: Sequence[float], variables: Sequence[str],
+                      basis: Sequence[Monomial]) -> Polynomial:
+    """
+    Fit a multivariate polynomial to samples in the least-squares sense.
+
+    The system is solved with a QR factorization computed by modified
+    Gram-Schmidt orthogonalization, which avoids squaring the condition number
+    like the normal equations do.
+
+    Parameters
+    ----------
+    points : Sequence[Sequence[float]]
+        The sample points, with one coordinate per variable.
+    values : Sequence[float]
+        The sample values.
+    variables : Sequence[str]
+        The names of the variables, in the order of the coordinates.
+    basis : Sequence[Monomial]
+        The exponent tuples of the monomials of the fitted polynomial, with
+        the exponents in the order of the coordinates.
+
+    Returns
+    -------
+    Polynomial
+        The fitted polynomial, whose variables and exponents are sorted by
+        variable name.
+
+    Raises
+    ------
+    ValueError
+        If the samples do not determine the coefficients of the basis.
+
+    Examples
+    --------
+    >>> points = [(0, 0), (1, 0), (0, 1), (1, 1), (2, 1)]
+    >>> values = [1, 3, 2, 4, 6]
+    >>> p = least_squares_fit(points, values, ('x', 'y'),
+    ...                       monomial_basis(2, 1))
+    >>> round(p.terms[(1, 0)], 6), round(p.terms[(0, 1)], 6)
+    (2.0, 1.0)
+    """
+    if len(points) != len(values):
+        raise ValueError('points and values must have the same length')
+
+    if len(points) < len(basis):
+        raise ValueError('fewer samples than basis monomials')
+
+    columns: List[List[float]] = []
+
+    for monomial in basis:
+        column = []
+
+        for point in points:
+            product = 1.0
+
+            for coordinate, exponent in zip(point, monomial):
+                product *= float(coordinate) ** exponent
+
+            column.append(product)
+
+        columns.append(column)
+
+    rhs = [float(value) for value in values]
+    size = len(basis)
+    r = [[0.0] * size for _ in range(size)]
+
+    for j in range(size):
+        column = columns[j]
+
+        for i in range(j):
+            q = columns[i]
+            projection = sum(a * b for a, b in zip(q, column))
+            r[i][j] = projection
+            column = [a - projection * b for a, b in zip(column, q)]
+
+        norm = sqrt(sum(a * a for a in column))
+
+        if norm <= 1e-12 * max(1.0, sqrt(sum(a * a for a in columns[j]))):
+            raise ValueError('the samples do not determine the basis \
+coefficients')
+
+        r[j][j] = norm
+        columns[j] = [a / norm for a in column]
+
+    qty = [sum(a * b for a, b in zip(q, rhs)) for q in columns]
+    coefficients = [0.0] * size
+
+    for i in range(size - 1, -1, -1):
+        total = qty[i] - sum(r[i][k] * coefficients[k]
+                             for k in range(i + 1, size))
+        coefficients[i] = total / r[i][i]
+
+    # The variables of a polynomial are sorted, so the exponents are permuted
+    # along with them.
+    order = sorted(range(len(variables)), key=lambda index: variables[index])
+    terms = {tuple(monomial[index] for index in order): coefficient
+             for monomial, coefficient in zip(basis, coefficients)}
+
+    return Polynomial([variables[index] for index in order], terms)
@@ -0,0 +1,152 @@
+import math
+from fractions import Fraction
+from typing import Any, List, Sequence
+
+def modular_inverse(value: int, modulus: int) -> int:
+    """
+    Get the inverse of an integer modulo another.
+
+    Parameters
+    ----------
+    value : int
+        The integer to be inverted.
+    modulus : int
+        The modulus.
+
+    Returns
+    -------
+    int
+        The integer in [0, modulus) whose product with `value` is 1 modulo
+        `modulus`.
+
+    Raises
+    ------
+    ZeroDivisionError
+        If `value` is not invertible, which for a prime modulus means that
+        it is a multiple of the modulus.
+
+    Examples
+    --------
+    >>> modular_inverse(3, 7)
+    5
+    """
+    try:
+        return pow(value, -1, modulus)
+    except ValueError:
+        raise ZeroDivisionError(f'{value} is not invertible modulo \
+{modulus}') from None
+
+def residue(value: Any, modulus: int) -> int:
+    """
+    Reduce an exact rational number modulo an integer.
+
+    Parameters
+    ----------
+    value : Any
+        An int or a Fraction.
+    modulus : int
+        The modulus.
+
+    Returns
+    -------
+    int
+        The residue of the value in [0, modulus).
+
+    Raises
+    ------
+    ValueError
+        If the value is not rational, for example a float.
+    ZeroDivisionError
+        If the denominator of a fraction is not invertible.
+
+    Examples
+    --------
+    >>> residue(Fraction(1, 2), 7)
+    4
+    """
+    if type(value) is int:
+        return value % modulus
+
+    if type(value) is Fraction:
+        return value.numerator * modular_inverse(value.denominator,
+                                                 modulus) % modulus
+
+    raise ValueError(f'{value!r} cannot be reduced modulo an integer')
+
+def product_tree(moduli: Sequence[int]) -> List[List[int]]:
+    """
+    Get the products of pairs of moduli, of pairs of these products, and so
+    on up to the product of all the moduli.
+
+    Parameters
+    ----------
+    moduli : Sequence[int]
+        The moduli.
+
+    Returns
+    -------
+    List[List[int]]
+        The levels of the tree, from the moduli to a list holding the
+        product of all of them. The node `index` of a level is the product
+        of the nodes `2 * index` and `2 * index + 1` of the previous level,
+        or a copy of the node `2 * index` if it is the last one.
+
+    Examples
+    --------
+    >>> product_tree([2, 3, 5])
+    [[2, 3, 5], [6, 5], [30]]
+    """
+    levels = [list(moduli)]
+
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([math.prod(level[index:index + 2])
+                       for index in range(0, len(level), 2)])
+
+    return levels
+
+def reduce_many(values: Sequence[int],
+                moduli: Sequence[int]) -> List[List[int]]:
+    """
+    Reduce integers modulo several moduli.
+
+    Large integers are reduced along a remainder tree: each integer is
+    reduced modulo the product of all the moduli, then modulo the products
+    of each half of them, and so on down to the moduli, so the divisions
+    by most of the moduli have small dividends instead of the whole
+    integer.
+
+    Parameters
+    ----------
+    values : Sequence[int]
+        The integers to be reduced.
+    moduli : Sequence[int]
+        The moduli.
+
+    Returns
+    -------
+    List[List[int]]
+        For every modulus, the residues of all the integers in [0, modulus).
+
+    Examples
+    --------
+    >>> reduce_many([10, -1], [3, 7])
+    [[1, 2], [3, 6]]
+    """
+    size = max((abs(value).bit_length() for value in values), default=0)
+
+    if len(moduli) < 2 or size <= 2 * max(moduli).bit_length():
+        return [[value % modulus for value in values] for modulus in moduli]
+
+    # The absolute values are reduced, so that the remainders of negative
+    # integers do not grow to the size of the products.
+    levels = product_tree(moduli)
+    columns = [[abs(value) % levels[-1][0] for value in values]]
+
+    for level in reversed(levels[:-1]):
+        columns = [[remainder % node for remainder in columns[index // 2]]
+                   for index, node in enumerate(level)]
+
+    return [[(remainder if value >= 0 else -remainder) % modulus
+             for remainder, value in zip(column, values)]
+            for column, modulus in zip(columns, moduli)]
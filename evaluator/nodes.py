@@ -0,0 +1,441 @@
+import math
+import operator
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+class Node(ABC):
+    """
+    Abstract base class for the nodes of a parsed polynomial expression.
+
+    Nodes are immutable and compare equal when they have the same type, the
+    same attributes and equal children, so they can be used as dictionary
+    keys. Hashes are computed once when a node is created, and every traversal
+    is iterative, so trees with hundreds of thousands of terms are supported.
+
+    Attributes
+    ----------
+    precedence : int
+        The binding strength of the node when rendered as text. Nodes with a
+        higher precedence bind tighter.
+    """
+    __slots__ = ('_hash',)
+
+    precedence: int = 5
+
+    def _initialize(self, **fields: Any) -> None:
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, '_hash', hash(
+            (type(self).__name__, self.attributes(),
+             tuple(child._hash for child in self.children()))))
+
+    def attributes(self) -> Tuple[Any, ...]:
+        """
+        Get the attributes of the node that are not subexpressions.
+
+        Returns
+        -------
+        Tuple[Any, ...]
+            The attributes identifying the node besides its children.
+        """
+        return ()
+
+    def children(self) -> Tuple['Node', ...]:
+        """
+        Get the direct subexpressions of the node.
+
+        Returns
+        -------
+        Tuple[Node, ...]
+            The child nodes in evaluation order.
+        """
+        return ()
+
+    @abstractmethod
+    def rebuild(self, children: Sequence['Node']) -> 'Node':
+        """
+        Build a node of the same kind with different children.
+
+        Parameters
+        ----------
+        children : Sequence[Node]
+            The new children, in the order returned by `children`.
+
+        Returns
+        -------
+        Node
+            The new node.
+        """
+        ...
+
+    def walk(self) -> Iterator['Node']:
+        """
+        Iterate over the node and all of its descendants in post-order.
+
+        Yields
+        ------
+        Node
+            Every node of the tree, children before their parents and left
+            subexpressions before right ones, which is the evaluation order.
+        """
+        stack: List[Tuple[Node, bool]] = [(self, False)]
+
+        while stack:
+            node, expanded = stack.pop()
+
+            if expanded:
+                yield node
+                continue
+
+            stack.append((node, True))
+
+            for child in reversed(node.children()):
+                stack.append((child, False))
+
+    def fold(self, function: Callable[['Node', List[Any]], Any]) -> Any:
+        """
+        Combine the values computed for the children of every node.
+
+        Parameters
+        ----------
+        function : Callable[[Node, List[Any]], Any]
+            A function called in post-order with each node and the values it
+            returned for the children of the node.
+
+        Returns
+        -------
+        Any
+            The value returned for the root node.
+        """
+        values: List[Any] = []
+
+        for node in self.walk():
+            count = len(node.children())
+
+            if count:
+                arguments = values[-count:]
+                del values[-count:]
+            else:
+                arguments = []
+
+            values.append(function(node, arguments))
+
+        return values[0]
+
+    def variables(self) -> Tuple[str, ...]:
+        """
+        Get the names of the variables read by the expression.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The sorted names of all variables referenced by the expression.
+        """
+        return tuple(sorted({node.name for node in self.walk()
+                             if isinstance(node, Variable)}))
+
+    def to_text(self) -> str:
+        """
+        Render the node as text accepted by the polynomial parser.
+
+        Returns
+        -------
+        str
+            The textual form of the expression.
+        """
+        parts: List[str] = []
+        stack: List[Any] = [self]
+
+        while stack:
+            item = stack.pop()
+
+            if isinstance(item, str):
+                parts.append(item)
+            else:
+                stack.extend(reversed(item._text_parts()))
+
+        return ''.join(parts)
+
+    @abstractmethod
+    def _text_parts(self) -> List[Any]:
+        ...
+
+    def _operand(self, operand: 'Node', tighter: bool) -> List[Any]:
+        if operand.precedence < self.precedence or \
+           (tighter and operand.precedence == self.precedence):
+            return ['(', operand, ')']
+
+        return [operand]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Node):
+            return NotImplemented
+
+        pairs: List[Tuple[Node, Node]] = [(self, other)]
+
+        while pairs:
+            a, b = pairs.pop()
+
+            if a is b:
+                continue
+
+            if a._hash != b._hash or type(a) is not type(b) or \
+               a.attributes() != b.attributes():
+                return False
+
+            pairs.extend(zip(a.children(), b.children()))
+
+        return True
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        return self.to_text()
+
+    def __repr__(self) -> str:
+        arguments = ', '.join(repr(value) for value in
+                              self.attributes() + self.children())
+
+        return f'{type(self).__name__}({arguments})'
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' nodes are immutable")
+
+class Number(Node):
+    """
+    A numeric literal.
+
+    Attributes
+    ----------
+    value : Any
+        The value of the literal.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self._initialize(value=value)
+
+    def attributes(self) -> Tuple[Any, ...]:
+        return (type(self.value).__name__, self.value)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return self
+
+    def _text_parts(self) -> List[Any]:
+        if self.value < 0:
+            return ['(-', Number(-self.value), ')']
+
+        if isinstance(self.value, float) and math.isfinite(self.value):
+            text = format(Decimal(repr(self.value)), 'f')
+
+            return [text if '.' in text else f'{text}.0']
+
+        if isinstance(self.value, Fraction) and self.value.denominator != 1:
+            return [f'({self.value.numerator} / {self.value.denominator})']
+
+        return [str(self.value)]
+
+    def __repr__(self) -> str:
+        return f'Number({self.value!r})'
+
+class Variable(Node):
+    """
+    A reference to a variable.
+
+    Attributes
+    ----------
+    name : str
+        The name of the variable.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self._initialize(name=name)
+
+    def attributes(self) -> Tuple[Any, ...]:
+        return (self.name,)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return self
+
+    def _text_parts(self) -> List[Any]:
+        return [self.name]
+
+class Assignment(Node):
+    """
+    An assignment of an expression to a variable.
+
+    Attributes
+    ----------
+    name : str
+        The name of the assigned variable.
+    expression : Node
+        The assigned expression.
+    """
+    __slots__ = ('name', 'expression')
+
+    precedence = 0
+
+    def __init__(self, name: str, expression: Node) -> None:
+        self._initialize(name=name, expression=expression)
+
+    def attributes(self) -> Tuple[Any, ...]:
+        return (self.name,)
+
+    def children(self) -> Tuple[Node, ...]:
+        return (self.expression,)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return Assignment(self.name, children[0])
+
+    def _text_parts(self) -> List[Any]:
+        return [f'{self.name} = ', self.expression]
+
+class BinaryOperation(Node):
+    """
+    An arithmetic operation with two operands.
+
+    Attributes
+    ----------
+    operator : str
+        One of '+', '-', '*', '/' or '**'.
+    left : Node
+        The left operand.
+    right : Node
+        The right operand.
+    operations : Dict[str, Callable[[Any, Any], Any]]
+        A dictionary mapping operators to the functions implementing them.
+    """
+    __slots__ = ('operator', 'left', 'right')
+
+    precedences: Dict[str, int] = {'+': 1, '-': 1, '*': 2, '/': 2, '**': 3}
+
+    operations: Dict[str, Callable[[Any, Any], Any]] = {
+        '+'  : operator.add,
+        '-'  : operator.sub,
+        '*'  : operator.mul,
+        '/'  : operator.truediv,
+        '**' : operator.pow,
+    }
+
+    def __init__(self, operator: str, left: Node, right: Node) -> None:
+        self._initialize(operator=operator, left=left, right=right)
+
+    @property
+    def precedence(self) -> int:
+        return self.precedences[self.operator]
+
+    def attributes(self) -> Tuple[Any, ...]:
+        return (self.operator,)
+
+    def children(self) -> Tuple[Node, ...]:
+        return (self.left, self.right)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return BinaryOperation(self.operator, children[0], children[1])
+
+    def _text_parts(self) -> List[Any]:
+        right_associative = self.operator == '**'
+
+        return self._operand(self.left, right_associative) + \
+            [f' {self.operator} '] + \
+            self._operand(self.right, not right_associative)
+
+class Negation(Node):
+    """
+    An arithmetic negation.
+
+    Attributes
+    ----------
+    operand : Node
+        The negated expression.
+    """
+    __slots__ = ('operand',)
+
+    precedence = 1
+
+    def __init__(self, operand: Node) -> None:
+        self._initialize(operand=operand)
+
+    def children(self) -> Tuple[Node, ...]:
+        return (self.operand,)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return Negation(children[0])
+
+    def _text_parts(self) -> List[Any]:
+        if self.operand.precedence < 5:
+            return ['-(', self.operand, ')']
+
+        return ['-', self.operand]
+
+class AbsoluteValue(Node):
+    """
+    The absolute value of an expression, written as `|x|`.
+
+    Attributes
+    ----------
+    operand : Node
+        The expression inside the vertical bars.
+    """
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Node) -> None:
+        self._initialize(operand=operand)
+
+    def children(self) -> Tuple[Node, ...]:
+        return (self.operand,)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return AbsoluteValue(children[0])
+
+    def _text_parts(self) -> List[Any]:
+        return ['|', self.operand, '|']
+
+class Function(Node):
+    """
+    A call to one of the built-in functions such as `sin` or `sqrt`.
+
+    Attributes
+    ----------
+    name : str
+        The name of the function as written in the expression.
+    argument : Node
+        The argument of the function.
+    implementations : Dict[str, Callable[[Any], Any]]
+        A dictionary mapping function names to their implementations.
+    """
+    __slots__ = ('name', 'argument')
+
+    implementations: Dict[str, Callable[[Any], Any]] = {
+        'sin'   : math.sin,
+        'cos'   : math.cos,
+        'tan'   : math.tan,
+        'asin'  : math.asin,
+        'acos'  : math.acos,
+        'atan'  : math.atan,
+        'exp'   : math.exp,
+        'ln'    : math.log,
+        'log2'  : math.log2,
+        'log10' : math.log10,
+        'sqrt'  : math.sqrt,
+    }
+
+    def __init__(self, name: str, argument: Node) -> None:
+        self._initialize(name=name, argument=argument)
+
+    def attributes(self) -> Tuple[Any, ...]:
+        return (self.name,)
+
+    def children(self) -> Tuple[Node, ...]:
+        return (self.argument,)
+
+    def rebuild(self, children: Sequence[Node]) -> Node:
+        return Function(self.name, children[0])
+
+    def _text_parts(self) -> List[Any]:
+        return [f'{self.name}(', self.argument, ')']
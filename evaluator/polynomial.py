@@ -0,0 +1,323 @@
+import operator as operator_module
+from typing import Any, Dict, List, Sequence, Tuple
+
+from evaluator.exact import exact_divide, exact_power
+from evaluator.multipoint import evaluate_univariate
+from evaluator.nodes import (BinaryOperation, Negation, Node, Number,
+                             Variable)
+
+Monomial = Tuple[int, ...]
+
+class Polynomial:
+    """
+    A sparse multivariate polynomial.
+
+    Attributes
+    ----------
+    variables : Tuple[str, ...]
+        The sorted names of the variables of the polynomial.
+    terms : Dict[Monomial, Any]
+        A dictionary mapping exponent tuples, with one exponent per variable,
+        to the non-zero coefficients of the polynomial.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('(x + 1)**2 - y')
+    >>> p = Polynomial.from_tree(tree)
+    >>> p.terms
+    {(2, 0): 1, (1, 0): 2, (0, 0): 1, (0, 1): -1}
+    >>> p.degree()
+    2
+    """
+
+    def __init__(self, variables: Sequence[str],
+                 terms: Dict[Monomial, Any]) -> None:
+        """
+        Initialize a Polynomial instance.
+
+        Parameters
+        ----------
+        variables : Sequence[str]
+            The sorted names of the variables of the polynomial.
+        terms : Dict[Monomial, Any]
+            A dictionary mapping exponent tuples to coefficients. Terms with a
+            zero coefficient are dropped.
+        """
+        self.variables: Tuple[str, ...] = tuple(variables)
+        self.terms: Dict[Monomial, Any] = {monomial: coefficient
+                                           for monomial, coefficient
+                                           in terms.items() if coefficient}
+
+    @classmethod
+    def from_tree(cls, tree: Node, exact: bool = False) -> 'Polynomial':
+        """
+        Expand an expression tree into a polynomial.
+
+        Parameters
+        ----------
+        tree : Node
+            The root of the expression tree.
+        exact : bool, optional
+            If True, divisions and negative powers of rational constants give
+            fractions instead of floats. The default is False.
+
+        Returns
+        -------
+        Polynomial
+            The expanded polynomial.
+
+        Raises
+        ------
+        ValueError
+            If the expression is not a polynomial, for example because it
+            contains a function call, a division by a non-constant expression
+            or a power with an exponent that is not a non-negative integer.
+        """
+        variables = tree.variables()
+        index = {name: position for position, name in enumerate(variables)}
+        zero: Monomial = (0,) * len(variables)
+
+        def step(node: Node, children: List[Dict[Monomial, Any]]) \
+                -> Dict[Monomial, Any]:
+            match node:
+                case Number():
+                    return {zero: node.value}
+                case Variable():
+                    exponents = [0] * len(variables)
+                    exponents[index[node.name]] = 1
+
+                    return {tuple(exponents): 1}
+                case Negation():
+                    return _scale(children[0], -1)
+                case BinaryOperation():
+                    return _expand(node.operator, children[0], children[1],
+                                   zero, exact)
+
+            raise ValueError(f'not a polynomial: {node.to_text()}')
+
+        return cls(variables, tree.fold(step))
+
+    def degree(self) -> int:
+        """
+        Get the total degree of the polynomial.
+
+        Returns
+        -------
+        int
+            The largest sum of exponents of a term, or -1 for the zero
+            polynomial.
+        """
+        return max((sum(monomial) for monomial in self.terms), default=-1)
+
+    def coefficients(self) -> List[Any]:
+        """
+        Get the dense coefficients of a univariate polynomial.
+
+        Returns
+        -------
+        List[Any]
+            The coefficients ordered from the constant term to the leading
+            term.
+
+        Raises
+        ------
+        ValueError
+            If the polynomial has more than one variable.
+        """
+        if len(self.variables) > 1:
+            raise ValueError('the polynomial is not univariate')
+
+        coefficients: List[Any] = [0] * (self.degree() + 1)
+
+        for monomial, coefficient in self.terms.items():
+            coefficients[sum(monomial)] = coefficient
+
+        return coefficients
+
+    def evaluate_many(self, points: Sequence[Any],
+                      modulus: int | None = None) -> List[Any]:
+        """
+        Evaluate a univariate polynomial at many points.
+
+        Modulo an integer, large polynomials are evaluated at many points
+        with the subproduct tree algorithm, as selected by
+        `evaluate_univariate`. Otherwise Horner's method is used.
+
+        Parameters
+        ----------
+        points : Sequence[Any]
+            The evaluation points.
+        modulus : int | None, optional
+            If given, the coefficients and points must be ints or Fractions,
+            and the values are computed modulo this integer.
+
+        Returns
+        -------
+        List[Any]
+            The values of the polynomial, one per point.
+
+        Raises
+        ------
+        ValueError
+            If the polynomial has more than one variable, or if a modulus is
+            given with coefficients or points that are not rational.
+
+        Examples
+        --------
+        >>> p = Polynomial(('x',), {(2,): Fraction(1, 2), (0,): 1})
+        >>> p.evaluate_many([1, 3])
+        [Fraction(3, 2), Fraction(11, 2)]
+        >>> p.evaluate_many([1, 3], modulus=7)
+        [5, 2]
+        """
+        return evaluate_univariate(self.coefficients(), points, modulus)
+
+    def to_tree(self) -> Node:
+        """
+        Build an expression tree computing the polynomial.
+
+        Returns
+        -------
+        Node
+            A sum of monomials, ordered by decreasing degree.
+        """
+        tree: Node | None = None
+
+        for monomial in sorted(self.terms, key=lambda m: (-sum(m), m)):
+            coefficient = self.terms[monomial]
+            term: Node | None = None
+
+            for name, exponent in zip(self.variables, monomial):
+                if exponent == 0:
+                    continue
+
+                factor: Node = Variable(name)
+
+                if exponent > 1:
+                    factor = BinaryOperation('**', factor, Number(exponent))
+
+                term = factor if term is None else \
+                    BinaryOperation('*', term, factor)
+
+            negative = not isinstance(coefficient, complex) and \
+                coefficient < 0
+            magnitude = -coefficient if negative else coefficient
+
+            if term is None:
+                term = Number(magnitude)
+            elif magnitude != 1:
+                term = BinaryOperation('*', Number(magnitude), term)
+
+            if tree is None:
+                tree = Negation(term) if negative else term
+            else:
+                tree = BinaryOperation('-' if negative else '+', tree, term)
+
+        return tree if tree is not None else Number(0)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Polynomial) and \
+            self.variables == other.variables and self.terms == other.terms
+
+    def __repr__(self) -> str:
+        return f'Polynomial({self.variables!r}, {self.terms!r})'
+
+def _scale(terms: Dict[Monomial, Any], factor: Any) -> Dict[Monomial, Any]:
+    for monomial in terms:
+        terms[monomial] *= factor
+
+    return terms
+
+def _add(left: Dict[Monomial, Any], right: Dict[Monomial, Any],
+         sign: int) -> Dict[Monomial, Any]:
+    # The values built while folding a tree are never shared, so the left
+    # operand is updated in place to keep long sums linear.
+    for monomial, coefficient in right.items():
+        total = left.get(monomial, 0) + sign * coefficient
+
+        if total:
+            left[monomial] = total
+        else:
+            left.pop(monomial, None)
+
+    return left
+
+def _multiply(left: Dict[Monomial, Any],
+              right: Dict[Monomial, Any]) -> Dict[Monomial, Any]:
+    if len(left) == 1 and len(right) > 1:
+        left, right = right, left
+
+    if len(right) == 1:
+        ((monomial, factor),) = right.items()
+
+        return {tuple(a + b for a, b in zip(key, monomial)): value * factor
+                for key, value in left.items() if value * factor}
+
+    product: Dict[Monomial, Any] = {}
+
+    for a, x in left.items():
+        for b, y in right.items():
+            monomial = tuple(i + j for i, j in zip(a, b))
+            product[monomial] = product.get(monomial, 0) + x * y
+
+    return {monomial: value for monomial, value in product.items() if value}
+
+def _constant(terms: Dict[Monomial, Any], zero: Monomial) -> Any:
+    if not terms:
+        return 0
+
+    if len(terms) == 1 and zero in terms:
+        return terms[zero]
+
+    return None
+
+def _expand(operator: str, left: Dict[Monomial, Any],
+            right: Dict[Monomial, Any], zero: Monomial,
+            exact: bool) -> Dict[Monomial, Any]:
+    match operator:
+        case '+':
+            return _add(left, right, 1)
+        case '-':
+            return _add(left, right, -1)
+        case '*':
+            return _multiply(left, right)
+        case '/':
+            divisor = _constant(right, zero)
+
+            if divisor is None:
+                raise ValueError('division by a non-constant expression')
+
+            if divisor == 0:
+                raise ZeroDivisionError('division by zero')
+
+            divide = exact_divide if exact else operator_module.truediv
+
+            return {monomial: divide(value, divisor)
+                    for monomial, value in left.items()}
+
+    exponent = _constant(right, zero)
+    base = _constant(left, zero)
+
+    if base is not None and exponent is not None:
+        power = exact_power(base, exponent) if exact else base ** exponent
+
+        return {zero: power} if power else {}
+
+    if isinstance(exponent, float) and exponent.is_integer():
+        exponent = int(exponent)
+
+    if not isinstance(exponent, int) or exponent < 0:
+        raise ValueError('exponents must be non-negative integer constants')
+
+    result: Dict[Monomial, Any] = {zero: 1}
+
+    while exponent:
+        if exponent & 1:
+            result = _multiply(result, left)
+
+        exponent >>= 1
+
+        if exponent:
+            left = _multiply(left, left)
+
+    return result
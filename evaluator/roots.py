@@ -0,0 +1,185 @@
+from typing import Any, Iterable, List
+
+from evaluator.compiler import compile_tree, free_variables
+from evaluator.derivative import differentiate
+from evaluator.nodes import BinaryOperation, Node, Number, Variable
+from evaluator.simplify import substitute
+
+class RootRefinement:
+    """
+    The result of refining a batch of starting points.
+
+    Attributes
+    ----------
+    roots : List[Any]
+        The last iterate of every starting point.
+    converged : List[bool]
+        Whether the iteration of each starting point converged.
+    iterations : List[int]
+        The number of iterations performed for each starting point.
+    """
+
+    def __init__(self, roots: List[Any], converged: List[bool],
+                 iterations: List[int]) -> None:
+        """
+        Initialize a RootRefinement instance.
+
+        Parameters
+        ----------
+        roots : List[Any]
+            The last iterate of every starting point.
+        converged : List[bool]
+            Whether the iteration of each starting point converged.
+        iterations : List[int]
+            The number of iterations performed for each starting point.
+        """
+        self.roots = roots
+        self.converged = converged
+        self.iterations = iterations
+
+    def __len__(self) -> int:
+        return len(self.roots)
+
+    def __repr__(self) -> str:
+        return f'RootRefinement({sum(self.converged)}/{len(self)} converged)'
+
+def step_tree(tree: Node, variable: str, method: str = 'newton') -> Node:
+    """
+    Build the expression of one Newton or Halley iteration.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the expression whose roots are searched.
+    variable : str
+        The name of the variable that is iterated.
+    method : str, optional
+        Either 'newton' or 'halley'. The default is 'newton'.
+
+    Returns
+    -------
+    Node
+        An expression computing the next iterate from the current value of
+        the variable.
+
+    Raises
+    ------
+    ValueError
+        If the method is unknown.
+    """
+    x = Variable(variable)
+    f = tree
+    df = differentiate(f, variable)
+
+    match method:
+        case 'newton':
+            correction = BinaryOperation('/', f, df)
+        case 'halley':
+            d2f = differentiate(df, variable)
+            two = Number(2)
+            numerator = BinaryOperation('*', BinaryOperation('*', two, f), df)
+            denominator = BinaryOperation(
+                '-',
+                BinaryOperation('*', two, BinaryOperation('*', df, df)),
+                BinaryOperation('*', f, d2f))
+            correction = BinaryOperation('/', numerator, denominator)
+        case _:
+            raise ValueError(f"unknown method '{method}'")
+
+    return BinaryOperation('-', x, correction)
+
+def refine_roots(tree: Node, seeds: Iterable[Any], variable: str | None = None,
+                 method: str = 'newton', tolerance: float = 1e-12,
+                 max_iterations: int = 50, **kwargs) -> RootRefinement:
+    """
+    Refine many approximations of the roots of an expression at once.
+
+    The derivatives are computed symbolically and the iteration step is
+    compiled once into a single function. Every starting point is iterated
+    until its update falls below the tolerance, after which it is removed from
+    the active set and costs no more work.
+
+    Parameters
+    ----------
+    tree : Node
+        The root of the parsed expression whose roots are searched.
+    seeds : Iterable[Any]
+        The starting points.
+    variable : str | None, optional
+        The name of the variable that is iterated. It may be omitted if the
+        expression has a single free variable.
+    method : str, optional
+        Either 'newton' or 'halley'. The default is 'newton'.
+    tolerance : float, optional
+        The iteration of a point stops when its update is smaller than
+        `tolerance * max(1, |x|)`. The default is 1e-12.
+    max_iterations : int, optional
+        The maximum number of iterations per point. The default is 50.
+    **kwargs
+        Values of the other variables of the expression.
+
+    Returns
+    -------
+    RootRefinement
+        The refined points along with their convergence status. Points at
+        which the step cannot be computed, for example because the derivative
+        vanishes, are reported as not converged.
+
+    Raises
+    ------
+    ValueError
+        If the variable cannot be determined or the method is unknown.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x**2 - 2')
+    >>> refine_roots(tree, [1.0, -3.0]).roots
+    [1.414213562373095, -1.414213562373095]
+    """
+    tree = substitute(tree, kwargs)
+
+    if variable is None:
+        names = free_variables(tree)
+
+        if len(names) != 1:
+            raise ValueError('the variable to iterate must be given for \
+expressions without exactly one free variable')
+
+        variable = names[0]
+
+    step = compile_tree(step_tree(tree, variable, method))
+
+    if step.variables != (variable,):
+        raise ValueError(f'unbound variables: {step.variables}')
+
+    function = step.function
+    roots = list(seeds)
+    converged = [False] * len(roots)
+    iterations = [0] * len(roots)
+    active = list(range(len(roots)))
+
+    for _ in range(max_iterations):
+        if not active:
+            break
+
+        remaining = []
+
+        for index in active:
+            x = roots[index]
+            iterations[index] += 1
+
+            try:
+                y = function(x)
+            except (ArithmeticError, ValueError):
+                continue
+
+            roots[index] = y
+
+            if abs(y - x) <= tolerance * max(1.0, abs(x)):
+                converged[index] = True
+            else:
+                remaining.append(index)
+
+        active = remaining
+
+    return RootRefinement(roots, converged, iterations)
@@ -0,0 +1,220 @@
+from typing import Any, Dict, List
+
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Node, Number, Variable)
+from evaluator.polynomial import Polynomial
+
+def is_constant(node: Node, value: Any = None) -> bool:
+    """
+    Check whether a node is a numeric literal.
+
+    Parameters
+    ----------
+    node : Node
+        The node to be checked.
+    value : Any, optional
+        If given, the literal must also be equal to this value.
+
+    Returns
+    -------
+    bool
+        True if the node is a literal (with the given value), False otherwise.
+    """
+    if not isinstance(node, Number):
+        return False
+
+    return value is None or node.value == value
+
+def negate(operand: Node) -> Node:
+    """
+    Build the negation of a node, folding literals and double negations.
+
+    Parameters
+    ----------
+    operand : Node
+        The node to be negated.
+
+    Returns
+    -------
+    Node
+        The simplified negation.
+    """
+    if isinstance(operand, Number):
+        return Number(-operand.value)
+
+    if isinstance(operand, Negation):
+        return operand.operand
+
+    return Negation(operand)
+
+def combine(operator: str, left: Node, right: Node) -> Node:
+    """
+    Build a binary operation, folding literals and neutral elements.
+
+    Operations whose literal result cannot be computed, such as a division by
+    zero, are kept as they are so the error is raised when the expression is
+    evaluated.
+
+    Parameters
+    ----------
+    operator : str
+        One of '+', '-', '*', '/' or '**'.
+    left : Node
+        The left operand.
+    right : Node
+        The right operand.
+
+    Returns
+    -------
+    Node
+        The simplified operation.
+    """
+    if isinstance(left, Number) and isinstance(right, Number):
+        try:
+            return Number(BinaryOperation.operations[operator](left.value,
+                                                               right.value))
+        except (ArithmeticError, ValueError, TypeError):
+            return BinaryOperation(operator, left, right)
+
+    match operator:
+        case '+':
+            if is_constant(left, 0):
+                return right
+            if is_constant(right, 0):
+                return left
+        case '-':
+            if is_constant(right, 0):
+                return left
+            if is_constant(left, 0):
+                return negate(right)
+        case '*':
+            if is_constant(left, 0) or is_constant(right, 0):
+                return Number(0)
+            if is_constant(left, 1):
+                return right
+            if is_constant(right, 1):
+                return left
+            if is_constant(left, -1):
+                return negate(right)
+            if is_constant(right, -1):
+                return negate(left)
+        case '/':
+            if is_constant(right, 1):
+                return left
+        case '**':
+            if is_constant(right, 0):
+                return Number(1)
+            if is_constant(right, 1):
+                return left
+
+    return BinaryOperation(operator, left, right)
+
+def simplify(node: Node) -> Node:
+    """
+    Fold the constant subexpressions of a tree and remove neutral elements.
+
+    Parameters
+    ----------
+    node : Node
+        The root of the tree to be simplified.
+
+    Returns
+    -------
+    Node
+        The root of the simplified tree.
+    """
+    return node.fold(_simplify)
+
+def _simplify(node: Node, children: List[Node]) -> Node:
+    match node:
+        case BinaryOperation():
+            return combine(node.operator, children[0], children[1])
+        case Negation():
+            return negate(children[0])
+        case AbsoluteValue():
+            if isinstance(children[0], Number):
+                return Number(abs(children[0].value))
+        case Function():
+            if isinstance(children[0], Number):
+                try:
+                    return Number(Function.implementations[node.name](
+                        children[0].value))
+                except (ArithmeticError, ValueError, TypeError):
+                    pass
+
+    return node.rebuild(children)
+
+def substitute(node: Node, bindings: Dict[str, Any]) -> Node:
+    """
+    Replace variables by literal values and simplify the resulting tree.
+
+    Parameters
+    ----------
+    node : Node
+        The root of the expression tree.
+    bindings : Dict[str, Any]
+        A dictionary mapping variable names to their values.
+
+    Returns
+    -------
+    Node
+        The root of the simplified tree.
+    """
+    def step(node: Node, children: List[Node]) -> Node:
+        if isinstance(node, Variable) and node.name in bindings:
+            return Number(bindings[node.name])
+
+        return _simplify(node, children)
+
+    return node.fold(step)
+
+def specialize(node: Node, bindings: Dict[str, Any]) -> Node:
+    """
+    Bind some variables of an expression and fold the resulting constants.
+
+    When the residual expression is a polynomial, it is also expanded so the
+    terms that only differed in the bound variables are collected into a
+    single coefficient, unless the expanded form is larger than the
+    substituted tree.
+
+    Parameters
+    ----------
+    node : Node
+        The root of the expression tree.
+    bindings : Dict[str, Any]
+        A dictionary mapping the names of the bound variables to their
+        values.
+
+    Returns
+    -------
+    Node
+        The root of the specialized tree.
+
+    Raises
+    ------
+    ValueError
+        If a bound variable is assigned by the expression.
+
+    Examples
+    --------
+    >>> tree = PolynomialTreeParser.build().parse('x*y + x*z**2 + y*z')
+    >>> specialize(tree, {'y': 1, 'z': 2}).to_text()
+    '5 * x + 2'
+    """
+    for descendant in node.walk():
+        if isinstance(descendant, Assignment) and \
+           descendant.name in bindings:
+            raise ValueError(f"cannot bind the assigned variable \
+'{descendant.name}'")
+
+    residual = substitute(node, bindings)
+
+    try:
+        expanded = Polynomial.from_tree(residual).to_tree()
+    except (ArithmeticError, ValueError):
+        return residual
+
+    if sum(1 for _ in expanded.walk()) <= sum(1 for _ in residual.walk()):
+        return expanded
+
+    return residual
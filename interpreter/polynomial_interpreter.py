@@ -1,6 +1,10 @@
-from sys import stderr
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
+from evaluator.cache import expression_cache
+from evaluator.compiler import CompiledExpression, compile_tree
+from evaluator.simplify import specialize
+from lexer.diagnostics import Diagnostic
 from parser.polynomial_parser import PolynomialParser
 
 class PolynomialInterpreter:
@@ -11,17 +15,49 @@ class PolynomialInterpreter:
     ----------
     text : str
         The polynomial expression to be interpreted.
+    ids : Dict[str, Any]
+        The values of the variables, kept between evaluations.
+    use_cache : bool
+        Whether the expression is evaluated through the process-level
+        `expression_cache`.
+    memoize : int
+        The maximum number of results remembered by `evaulate`, or 0 if
+        results are not memoized.
+    memo_hits : int
+        The number of evaluations answered from the memoized results.
+    memo_misses : int
+        The number of memoizable evaluations that computed their result.
+    diagnostics : List[Diagnostic]
+        The errors of the last evaluation if it failed: the lexical and
+        syntax errors of the expression, or the evaluation error.
     parser : PolynomialParser
-        The parser used to parse and evaluate the polynomial expression.
+        The parser used to parse and evaluate the polynomial expression. It
+        is only built when the expression cannot be evaluated from the cache.
 
     Examples
     --------
     >>> p = PolynomialInterpreter('3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3')
     >>> p.evaulate(x=2, y=1, z=0.5)
     130.37
+
+    Results can be memoized for callers that repeat the same bindings:
+
+    >>> p = PolynomialInterpreter('x**2 + y', memoize=128)
+    >>> p.evaulate(x=3, y=1), p.evaulate(x=3, y=1)
+    (10, 10)
+    >>> p.memo_hits
+    1
+
+    Errors are collected instead of being printed:
+
+    >>> p = PolynomialInterpreter('1 / x')
+    >>> p.evaulate(x=0)
+    >>> p.diagnostics
+    [Diagnostic('Division by zero', None, None)]
     """
 
-    def __init__(self, text: str) -> None:
+    def __init__(self, text: str, use_cache: bool = True,
+                 memoize: int = 0) -> None:
         """
         Initialize a PolynomialInterpreter instance.
 
@@ -29,10 +65,42 @@ class PolynomialInterpreter:
         ----------
         text : str
             The polynomial expression to be interpreted.
+        use_cache : bool, optional
+            Whether the compiled form of the expression is looked up in the
+            process-level `expression_cache`. The default is True.
+        memoize : int, optional
+            The maximum number of results remembered by `evaulate`, keyed on
+            the values of the variables the expression reads. The default is
+            0, which disables memoization. Expressions that assign variables
+            are never memoized.
         """
 
         self.text = text
-        self.parser = PolynomialParser.build()
+        self.ids: Dict[str, Any] = {}
+        self.use_cache = use_cache
+        self.memoize = memoize
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.diagnostics: List[Diagnostic] = []
+        self._parser: PolynomialParser | None = None
+        self._results: OrderedDict[Tuple[Any, ...], Any] = OrderedDict()
+        self._memo_variables: Tuple[str, ...] | None = None
+
+    @property
+    def parser(self) -> PolynomialParser:
+        """
+        Get the evaluating parser, building it on first use.
+
+        Returns
+        -------
+        PolynomialParser
+            The parser, sharing the variable values of the interpreter.
+        """
+        if self._parser is None:
+            self._parser = PolynomialParser.build()
+            self._parser.ids = self.ids
+
+        return self._parser
 
     def get_text(self) -> str:
         """
@@ -58,18 +126,130 @@ class PolynomialInterpreter:
         Returns
         -------
         Any | None
-            The result of the evaluation, or None if an error occurred.
+            The result of the evaluation, or None if an error occurred, in
+            which case the error is described in `diagnostics`.
         """
         for key, value in kwargs.items():
-            self.parser.ids[key] = value
+            self.ids[key] = value
+
+        self.diagnostics = []
+
+        memo_key = self._memo_key() if self.memoize > 0 else None
+
+        if memo_key is not None:
+            try:
+                cached = self._results[memo_key]
+            except KeyError:
+                self.memo_misses += 1
+            else:
+                self.memo_hits += 1
+                self._results.move_to_end(memo_key)
+
+                return cached
 
         result: Any | None = None
 
         try:
-            result = self.parser.parse(self.text)
+            if self.use_cache:
+                result = expression_cache.evaluate(self.text, self.ids,
+                                                   self._parse)
+            else:
+                result = self.parser.parse(self.text)
         except ZeroDivisionError:
-            print('Error: division by zero', file=stderr)
+            self.diagnostics.append(Diagnostic('Division by zero'))
+
+            return None
         except ValueError:
-            print('Error: undefined result', file=stderr)
+            self.diagnostics.append(Diagnostic('Undefined result'))
+
+            return None
+
+        if result is None:
+            # The parsers only give no result for invalid texts.
+            if self.use_cache:
+                self.diagnostics = expression_cache.diagnose(self.text)
+            else:
+                self.diagnostics = list(self.parser.diagnostics)
+
+            return None
+
+        if memo_key is not None:
+            self._results[memo_key] = result
+
+            if len(self._results) > self.memoize:
+                self._results.popitem(last=False)
 
         return result
+
+    def specialize(self, **kwargs) -> CompiledExpression | None:
+        """
+        Bind some variables and compile the residual expression.
+
+        The bound values are substituted, constants are folded and, for
+        polynomials, terms are collected, so evaluating the result in the
+        remaining variables is much cheaper than evaluating the whole
+        expression with all the bindings.
+
+        Parameters
+        ----------
+        **kwargs
+            Values of the variables to be bound. The values stored by
+            `evaulate` are not used.
+
+        Returns
+        -------
+        CompiledExpression | None
+            The compiled residual expression, whose `variables` are the
+            remaining variables, or None if the expression could not be
+            parsed.
+
+        Raises
+        ------
+        ValueError
+            If a bound variable is assigned by the expression.
+
+        Examples
+        --------
+        >>> p = PolynomialInterpreter('x*y + x*z**2 + y*z')
+        >>> f = p.specialize(y=1, z=2)
+        >>> f.tree.to_text()
+        '5 * x + 2'
+        >>> f.evaluate(x=3)
+        17
+        """
+        tree = expression_cache.parse(self.text)
+
+        if tree is None:
+            return None
+
+        return compile_tree(specialize(tree, kwargs))
+
+    def _memo_key(self) -> Tuple[Any, ...] | None:
+        if self._memo_variables is None:
+            if self.use_cache and expression_cache.enabled:
+                program = expression_cache.get(self.text)
+            else:
+                program = expression_cache.compile(self.text)
+
+            if program is None or program.assigns:
+                self.memoize = 0
+
+                return None
+
+            self._memo_variables = program.variables
+
+        ids = self.ids
+
+        try:
+            values = tuple([ids[name] for name in self._memo_variables])
+            # Equal values of different types, such as 2 and 2.0, can give
+            # results of different types.
+            key = values + tuple(map(type, values))
+            hash(key)
+        except (KeyError, TypeError):
+            return None
+
+        return key
+
+    def _parse(self, text: str) -> Any:
+        return self.parser.parse(text)
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from sys import stderr
-from typing import Tuple
+from typing import List, Tuple
 
 import ply.lex as lex
+from lexer.diagnostics import Diagnostic
 
 class AbstractLexer(ABC):
     """
@@ -14,6 +14,10 @@ class AbstractLexer(ABC):
         A string containing characters to be ignored by the lexer.
     lexer : lex.Lexer | None
         The PLY lexer instance used by the AbstractLexer.
+    diagnostics : List[Diagnostic]
+        The errors found in the last input text, which are collected here
+        instead of being printed. The list is cleared when tokenizing starts,
+        and by the parsers sharing it before each text.
     """
     t_ignore = ' \t'
 
@@ -24,6 +28,7 @@ class AbstractLexer(ABC):
         super().__init__()
 
         self.lexer: lex.Lexer | None = None
+        self.diagnostics: List[Diagnostic] = []
 
     def t_error(self, t: lex.LexToken) -> None:
         """
@@ -34,7 +39,8 @@ class AbstractLexer(ABC):
         t : lex.LexToken
             The token that caused the error.
         """
-        print(f"Illegal character '{t.value[0]}'", file=stderr)
+        self.diagnostics.append(Diagnostic(
+            f"Illegal character '{t.value[0]}'", t.lexpos, t.value[0]))
         t.lexer.skip(1)
 
     def get_lexer(self) -> lex.Lexer:
@@ -0,0 +1,89 @@
+from typing import Any
+
+class Diagnostic:
+    """
+    An error found in an input text.
+
+    Lexers, parsers and interpreters collect diagnostics in lists instead of
+    printing their errors, so callers can inspect, count or report them.
+
+    Attributes
+    ----------
+    message : str
+        The description of the error.
+    position : int | None
+        The position of the error in the input text, or None if it is not
+        known, for example at the end of the input.
+    token : Any
+        The value of the token or the character where the error was found,
+        or None.
+
+    Examples
+    --------
+    >>> parser = PolynomialParser.build()
+    >>> parser.parse('1 + )')
+    >>> parser.diagnostics
+    [Diagnostic("Syntax error at ')'", 4, ')')]
+    >>> print(parser.diagnostics[0])
+    Syntax error at ')' (position 4)
+    """
+    __slots__ = ('message', 'position', 'token')
+
+    def __init__(self, message: str, position: int | None = None,
+                 token: Any = None) -> None:
+        """
+        Initialize a Diagnostic instance.
+
+        Parameters
+        ----------
+        message : str
+            The description of the error.
+        position : int | None, optional
+            The position of the error in the input text. The default is None.
+        token : Any, optional
+            The value of the token or the character where the error was
+            found. The default is None.
+        """
+        self.message = message
+        self.position = position
+        self.token = token
+
+    def moved(self, offset: int) -> 'Diagnostic':
+        """
+        Get the same diagnostic at a position moved by an offset.
+
+        Parameters
+        ----------
+        offset : int
+            The number of characters to add to the position.
+
+        Returns
+        -------
+        Diagnostic
+            The moved diagnostic, or the diagnostic itself if its position is
+            not known.
+        """
+        if self.position is None:
+            return self
+
+        return Diagnostic(self.message, self.position + offset, self.token)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Diagnostic):
+            return NotImplemented
+
+        return (self.message, self.position, self.token) == \
+            (other.message, other.position, other.token)
+
+    def __hash__(self) -> int:
+        return hash((self.message, self.position))
+
+    def __repr__(self) -> str:
+        return f'Diagnostic({self.message!r}, {self.position!r}, \
+{self.token!r})'
+
+    def __str__(self) -> str:
+        if self.position is None:
+            return self.message
+
+        return f'{self.message} (position {self.position})'
@@ -1,8 +1,11 @@
-from sys import stderr
-from typing import Dict, List, Tuple
+from fractions import Fraction
+from typing import Any, Dict, List, TextIO, Tuple
 
 import ply.lex as lex
 from lexer.abstract_lexer import AbstractLexer
+from lexer.diagnostics import Diagnostic
+from lexer.polynomial_scanner import PolynomialScanner, Text
+from lexer.token_stream import TokenStream
 
 class PolynomialLexer(AbstractLexer):
     """
@@ -14,6 +17,11 @@ class PolynomialLexer(AbstractLexer):
         A dictionary mapping reserved keywords to their token types.
     tokens : List[str]
         A list of names of all token types.
+    separators : str
+        The characters that never occur inside a token, where streamed input
+        can be cut.
+    exact : bool
+        Whether decimal literals are read as `Fraction` instead of `float`.
 
     Notes
     -----
@@ -53,8 +61,14 @@ class PolynomialLexer(AbstractLexer):
         'LPAREN',
         'RPAREN',
         'VERT',
+        'SEPARATOR',
     ] + list(reserved.values())
 
+    separators: str = ' \t\n;=+-/()|'
+
+    # The PLY lexer built without validation, cloned by later builds.
+    _trusted_lexer: lex.Lexer | None = None
+
     t_POWER  = r'\*\*'
     t_EQUALS = r'\='
     t_PLUS   = r'\+'
@@ -64,6 +78,7 @@ class PolynomialLexer(AbstractLexer):
     t_LPAREN = r'\('
     t_RPAREN = r'\)'
     t_VERT   = r'\|'
+    t_SEPARATOR = r'[;\n]'
 
     def __init__(self) -> None:
         """
@@ -80,6 +95,8 @@ class PolynomialLexer(AbstractLexer):
         """
         super().__init__()
 
+        self.exact = False
+
     def t_ID(self, t: lex.LexToken) -> lex.LexToken:
         r'[a-zA-Z_][a-zA-Z0-9_]*'
 
@@ -90,21 +107,79 @@ class PolynomialLexer(AbstractLexer):
     def t_NUMBER(self, t: lex.LexToken) -> lex.LexToken:
         r'\d+(\.\d+)?'
 
+        t.value = self.convert_number(t.value)
+
+        return t
+
+    def convert_number(self, text: str) -> Any:
+        """
+        Convert the text of a number token to its value.
+
+        Parameters
+        ----------
+        text : str
+            The digits of the number, with an optional decimal part.
+
+        Returns
+        -------
+        Any
+            An int if there is no decimal part, otherwise a Fraction in
+            exact mode and a float if not. The text itself is returned if it
+            cannot be converted.
+        """
         try:
-            t.value = float(t.value) if '.' in t.value else int(t.value)
+            if '.' not in text:
+                return int(text)
+            elif self.exact:
+                return Fraction(text)
+            else:
+                return float(text)
         except ValueError as e:
-            print(e, file=stderr)
+            self.diagnostics.append(Diagnostic(str(e), token=text))
 
-        return t
+        return text
 
-    def tokenize(self, text: str) -> Tuple[lex.LexToken, ...]:
+    def tokenize(self, text: Text) -> Tuple[lex.LexToken, ...]:
         lexer: lex.Lexer = self.get_lexer()
+        self.diagnostics.clear()
         lexer.input(text)
 
         return tuple(token for token in lexer)
 
+    def stream(self, source: Text | TextIO,
+               chunk_size: int = 1 << 16) -> TokenStream:
+        """
+        Tokenize a text or a text file lazily.
+
+        Unlike `tokenize`, tokens are produced one at a time, and files are
+        read in chunks, so the memory used does not grow with the input. The
+        errors of the previous input are cleared, and the errors of the
+        source are collected as its tokens are read.
+
+        Parameters
+        ----------
+        source : Text | TextIO
+            The text, a text file read from its current position, or a
+            buffer of ASCII text, like a `bytes` or `mmap` object, which is
+            lexed in place and needs the scanner.
+        chunk_size : int, optional
+            The number of characters read from a file at once. The default
+            is 65536.
+
+        Returns
+        -------
+        TokenStream
+            An iterator over the tokens, which can also be given to a parser
+            as its lexer.
+        """
+        self.diagnostics.clear()
+
+        return TokenStream(self.get_lexer(), source, self.separators,
+                           chunk_size, self.diagnostics)
+
     @classmethod
-    def build(cls, **kwargs) -> 'PolynomialLexer':
+    def build(cls, exact: bool = False, scanner: bool = False,
+              validate: bool = True, **kwargs) -> 'PolynomialLexer':
         """
         Build and return an instance of the PolynomialLexer.
 
@@ -113,9 +188,22 @@ class PolynomialLexer(AbstractLexer):
 
         Parameters
         ----------
+        exact : bool, optional
+            If True, decimal literals are read as `Fraction` instead of
+            `float`. The default is False.
+        scanner : bool, optional
+            If True, tokens are produced by the hand-written
+            `PolynomialScanner` instead of a PLY lexer, which is faster and
+            skips the construction of the master regular expression. The
+            default is False.
+        validate : bool, optional
+            If False, the token rules are trusted: the PLY lexer is built
+            without validating them or reading their source file, and later
+            builds without keyword arguments clone it instead of building
+            their own. The default is True.
         **kwargs
             Additional keyword arguments to pass to the PLY lexer used by the
-            PolynomialLexer.
+            PolynomialLexer. They are ignored by the scanner.
     
         Returns
         -------
@@ -123,6 +211,24 @@ class PolynomialLexer(AbstractLexer):
             An instance of PolynomialLexer.
         """
         polynomial_lexer = PolynomialLexer()
-        polynomial_lexer.lexer = lex.lex(module=polynomial_lexer, **kwargs)
+        polynomial_lexer.exact = exact
+
+        if scanner:
+            polynomial_lexer.lexer = PolynomialScanner(
+                polynomial_lexer.reserved, polynomial_lexer.convert_number,
+                polynomial_lexer.t_error)
+        elif validate:
+            polynomial_lexer.lexer = lex.lex(module=polynomial_lexer, **kwargs)
+        elif kwargs:
+            polynomial_lexer.lexer = lex.lex(module=polynomial_lexer,
+                                             validate=False, **kwargs)
+        else:
+            if PolynomialLexer._trusted_lexer is None:
+                PolynomialLexer._trusted_lexer = lex.lex(
+                    module=PolynomialLexer(), validate=False)
+
+            # The rules of the clone are the methods of the new instance.
+            polynomial_lexer.lexer = \
+                PolynomialLexer._trusted_lexer.clone(polynomial_lexer)
 
         return polynomial_lexer
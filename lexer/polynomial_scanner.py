@@ -0,0 +1,382 @@
+import re
+from array import array
+from mmap import mmap
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import ply.lex as lex
+
+_IGNORE, _OPERATOR, _STAR, _LETTER, _DIGIT = range(5)
+
+_OPERATORS: Dict[str, str] = {
+    '=': 'EQUALS',
+    '+': 'PLUS',
+    '-': 'MINUS',
+    '/': 'DIVIDE',
+    '(': 'LPAREN',
+    ')': 'RPAREN',
+    '|': 'VERT',
+    ';': 'SEPARATOR',
+    '\n': 'SEPARATOR',
+}
+
+_CLASSES: Dict[str, int] = {
+    ' ': _IGNORE,
+    '\t': _IGNORE,
+    **{character: _OPERATOR for character in _OPERATORS},
+    '*': _STAR,
+    **{character: _LETTER for character in
+       'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_'},
+    **{character: _DIGIT for character in '0123456789'},
+}
+
+_IDENTIFIER = re.compile(r'[a-zA-Z0-9_]*')
+_NUMBER = re.compile(r'\d+(\.\d+)?')
+
+# Binary input is read as ASCII, with one class per byte.
+_BYTE_CLASSES: List[int | None] = [_CLASSES.get(chr(byte))
+                                   for byte in range(256)]
+_BYTE_OPERATORS: Dict[int, Tuple[str, str]] = {
+    ord(character): (kind, character)
+    for character, kind in _OPERATORS.items()
+}
+
+_BYTE_STAR = ord('*')
+_BYTE_IDENTIFIER = re.compile(rb'[a-zA-Z0-9_]*')
+_BYTE_NUMBER = re.compile(rb'[0-9]+(\.[0-9]+)?')
+
+Text = Union[str, bytes, bytearray, memoryview, mmap]
+"""
+An input text: a string, or any buffer of ASCII text.
+"""
+
+class PolynomialScanner:
+    """
+    Hand-written scanner for the tokens of polynomial expressions.
+
+    The scanner dispatches on the class of the current character instead of
+    trying a master regular expression, converts numbers directly and looks
+    identifiers up in the reserved word table, without calling any token
+    rule. It produces the same tokens as the PLY lexer of `PolynomialLexer`
+    and implements the part of the `lex.Lexer` interface used by the PLY
+    parser, so it can replace it anywhere.
+
+    Tokens are stored as parallel arrays of types, values and positions, and
+    `LexToken` objects are only created when `token` is called. Parsers that
+    read the arrays directly, like `PrattParser`, allocate no token at all.
+
+    The input can also be ASCII text in a `bytes`, `bytearray`, `memoryview`
+    or `mmap` object, which is scanned in place with bytes regular
+    expressions: only the names and numbers are decoded, and positions are
+    byte offsets. The value of the error tokens of binary input is the
+    illegal byte alone, as a character, instead of the rest of the input.
+
+    Attributes
+    ----------
+    lexdata : Text | None
+        The input text.
+    lexpos : int
+        The position where scanning stopped, which is the end of the input
+        text once it has been scanned.
+    lexlen : int
+        The length of the input text.
+    lineno : int
+        The current line number.
+    types : List[str]
+        The types of the scanned tokens.
+    values : List[Any]
+        The values of the scanned tokens.
+    positions : array
+        The positions of the scanned tokens in the input text.
+    """
+
+    def __init__(self, reserved: Dict[str, str],
+                 convert_number: Callable[[str], Any],
+                 error: Callable[[lex.LexToken], Any]) -> None:
+        """
+        Initialize a PolynomialScanner instance.
+
+        Parameters
+        ----------
+        reserved : Dict[str, str]
+            A dictionary mapping reserved keywords to their token types.
+        convert_number : Callable[[str], Any]
+            A function converting the text of a number to its value.
+        error : Callable[[lex.LexToken], Any]
+            The error handling rule, called with an 'error' token holding the
+            rest of the input when an illegal character is found. It must
+            move the position forward, usually with `skip`.
+        """
+        self.reserved = reserved
+        self.convert_number = convert_number
+        self.error = error
+
+        self.lexdata: Text | None = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+
+        self.types: List[str] = []
+        self.values: List[Any] = []
+        self.positions = array('q')
+
+        self._index = 0
+
+    def input(self, s: Text) -> None:
+        """
+        Set the input text and scan all of its tokens.
+
+        The whole text is scanned in a single pass, so illegal characters are
+        reported before any token is returned.
+
+        Parameters
+        ----------
+        s : Text
+            The input text, as a string or as a buffer of ASCII text.
+
+        Raises
+        ------
+        lex.LexError
+            If the error handling rule does not move the position forward.
+        """
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+        self.types, self.values, self.positions = \
+            self._scan(s) if isinstance(s, str) else self._scan_bytes(s)
+        self._index = 0
+
+    def skip(self, n: int) -> None:
+        """
+        Skip characters of the input text.
+
+        Parameters
+        ----------
+        n : int
+            The number of characters to skip.
+        """
+        self.lexpos += n
+
+    def token(self) -> lex.LexToken | None:
+        """
+        Get the next token.
+
+        Returns
+        -------
+        lex.LexToken | None
+            The next token, or None at the end of the input text.
+
+        Raises
+        ------
+        RuntimeError
+            If no input text was given.
+        """
+        index = self._index
+
+        if index < len(self.types):
+            self._index = index + 1
+
+            return self.make_token(index)
+
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+
+        return None
+
+    def make_token(self, index: int) -> lex.LexToken:
+        """
+        Create the token object of a scanned token.
+
+        Parameters
+        ----------
+        index : int
+            The index of the token in the arrays.
+
+        Returns
+        -------
+        lex.LexToken
+            The token.
+        """
+        token = lex.LexToken()
+        token.type = self.types[index]
+        token.value = self.values[index]
+        token.lineno = self.lineno
+        token.lexpos = self.positions[index]
+
+        return token
+
+    def remaining(self) -> int:
+        """
+        Consume the tokens that have not been returned by `token`.
+
+        Returns
+        -------
+        int
+            The index of the first of those tokens in the arrays.
+        """
+        index = self._index
+        self._index = len(self.types)
+
+        return index
+
+    def _scan(self, text: str) -> Tuple[List[str], List[Any], array]:
+        types: List[str] = []
+        values: List[Any] = []
+        positions = array('q')
+        add_type = types.append
+        add_value = values.append
+        add_position = positions.append
+        classes = _CLASSES
+        operators = _OPERATORS
+        reserved = self.reserved
+        convert_number = self.convert_number
+        identifier = _IDENTIFIER.match
+        number = _NUMBER.match
+        # Repeated names share a single string.
+        names: Dict[str, str] = {}
+        position = 0
+        length = len(text)
+
+        while position < length:
+            character = text[position]
+            kind = classes.get(character)
+
+            if kind == _IGNORE:
+                position += 1
+                continue
+
+            add_position(position)
+
+            if kind == _OPERATOR:
+                add_type(operators[character])
+                add_value(character)
+                position += 1
+            elif kind == _STAR:
+                if text.startswith('*', position + 1):
+                    add_type('POWER')
+                    add_value('**')
+                    position += 2
+                else:
+                    add_type('TIMES')
+                    add_value('*')
+                    position += 1
+            elif kind == _LETTER:
+                end = identifier(text, position + 1).end()
+                value = text[position:end]
+                value = names.setdefault(value, value)
+                add_type(reserved.get(value, 'ID'))
+                add_value(value)
+                position = end
+            else:
+                # Other decimal digits than the ASCII ones are numbers too.
+                match = number(text, position)
+
+                if match is None:
+                    positions.pop()
+                    position = self._error(position)
+                    continue
+
+                add_type('NUMBER')
+                add_value(convert_number(match.group()))
+                position = match.end()
+
+        self.lexpos = position
+
+        return types, values, positions
+
+    def _scan_bytes(self, text: Text) -> Tuple[List[str], List[Any], array]:
+        types: List[str] = []
+        values: List[Any] = []
+        positions = array('q')
+        add_type = types.append
+        add_value = values.append
+        add_position = positions.append
+        classes = _BYTE_CLASSES
+        operators = _BYTE_OPERATORS
+        reserved = self.reserved
+        convert_number = self.convert_number
+        identifier = _BYTE_IDENTIFIER.match
+        number = _BYTE_NUMBER.match
+        names: Dict[bytes, str] = {}
+        position = 0
+        length = len(text)
+
+        while position < length:
+            byte = text[position]
+            kind = classes[byte]
+
+            if kind == _IGNORE:
+                position += 1
+                continue
+
+            add_position(position)
+
+            if kind == _OPERATOR:
+                kind, value = operators[byte]
+                add_type(kind)
+                add_value(value)
+                position += 1
+            elif kind == _STAR:
+                if position + 1 < length and text[position + 1] == _BYTE_STAR:
+                    add_type('POWER')
+                    add_value('**')
+                    position += 2
+                else:
+                    add_type('TIMES')
+                    add_value('*')
+                    position += 1
+            elif kind == _LETTER:
+                match = identifier(text, position)
+                end = match.end()
+                key = match.group()
+                value = names.get(key)
+
+                if value is None:
+                    value = names[key] = str(key, 'ascii')
+
+                add_type(reserved.get(value, 'ID'))
+                add_value(value)
+                position = end
+            elif kind == _DIGIT:
+                match = number(text, position)
+                add_type('NUMBER')
+                add_value(convert_number(str(match.group(), 'ascii')))
+                position = match.end()
+            else:
+                positions.pop()
+                position = self._error(position)
+
+        self.lexpos = position
+
+        return types, values, positions
+
+    def _error(self, position: int) -> int:
+        if isinstance(self.lexdata, str):
+            value = self.lexdata[position:]
+        else:
+            value = chr(self.lexdata[position])
+
+        token = lex.LexToken()
+        token.type = 'error'
+        token.value = value
+        token.lineno = self.lineno
+        token.lexpos = position
+        token.lexer = self
+        self.lexpos = position
+        self.error(token)
+
+        if self.lexpos == position:
+            raise lex.LexError(f'Scanning error. Illegal character \
+{value[0]!r}', value)
+
+        return self.lexpos
+
+    def __iter__(self) -> 'PolynomialScanner':
+        return self
+
+    def __next__(self) -> lex.LexToken:
+        token = self.token()
+
+        if token is None:
+            raise StopIteration
+
+        return token
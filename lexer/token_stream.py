@@ -0,0 +1,193 @@
+import re
+from mmap import mmap
+from typing import Any, Iterator, List, TextIO
+
+import ply.lex as lex
+from lexer.diagnostics import Diagnostic
+from lexer.polynomial_scanner import Text
+
+class TokenStream:
+    """
+    Lazy stream of the tokens of a text or of a text file.
+
+    Files are read in chunks, and each chunk is cut after its last separator
+    character, which no token can contain, before being passed to the
+    underlying lexer. The rest of the chunk is kept for the next one, so
+    tokens split across chunks are lexed whole, and only one chunk and the
+    pending tokens are held in memory. Token positions are counted from the
+    start of the stream.
+
+    Buffers of ASCII text, like `bytes` or `mmap` objects, are cut the same
+    way into `memoryview` windows, so they are lexed in place without being
+    read or decoded. Their lexer must accept buffers, like
+    `PolynomialScanner`.
+
+    The stream implements the `token` method of the `lex.Lexer` interface,
+    so it can be given to a parser as its lexer, with no input text.
+
+    Attributes
+    ----------
+    lexer : Any
+        The underlying lexer, a `lex.Lexer` or any object with `input` and
+        `token` methods.
+    separators : str
+        The characters that never occur inside a token.
+    chunk_size : int
+        The number of characters read from a file at once.
+    diagnostics : List[Diagnostic] | None
+        The list where the lexer collects its errors, if any. The positions
+        of the errors found in a chunk are moved to count from the start of
+        the stream, like the positions of the tokens.
+
+    Examples
+    --------
+    >>> stream = TokenStream(PolynomialLexer.build().get_lexer(),
+    ...                      io.StringIO('x1 + 2'), ' +', chunk_size=2)
+    >>> [token.value for token in stream]
+    ['x1', '+', 2]
+    """
+
+    def __init__(self, lexer: Any, source: Text | TextIO,
+                 separators: str, chunk_size: int = 1 << 16,
+                 diagnostics: List[Diagnostic] | None = None) -> None:
+        """
+        Initialize a TokenStream instance.
+
+        Parameters
+        ----------
+        lexer : Any
+            The underlying lexer, a `lex.Lexer` or any object with `input`
+            and `token` methods.
+        source : Text | TextIO
+            The text, a text file read from its current position, or a
+            buffer of ASCII text.
+        separators : str
+            The characters that never occur inside a token.
+        chunk_size : int, optional
+            The number of characters read from a file at once. The default
+            is 65536.
+        diagnostics : List[Diagnostic] | None, optional
+            The list where the lexer collects its errors. The default is
+            None.
+        """
+        self.lexer = lexer
+        self.separators = separators
+        self.chunk_size = chunk_size
+        self.diagnostics = diagnostics
+
+        self._tokens = self._lex(source)
+
+    def token(self) -> lex.LexToken | None:
+        """
+        Get the next token.
+
+        Returns
+        -------
+        lex.LexToken | None
+            The next token, or None at the end of the stream.
+        """
+        return next(self._tokens, None)
+
+    def _lex(self, source: Text | TextIO) -> Iterator[lex.LexToken]:
+        lexer = self.lexer
+
+        if isinstance(source, str):
+            lexer.input(source)
+            yield from iter(lexer.token, None)
+
+            return
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+            yield from self._lex_buffer(source)
+
+            return
+
+        offset = 0
+        rest = ''
+
+        while True:
+            chunk = source.read(self.chunk_size)
+            text = rest + chunk
+
+            if chunk:
+                # Characters after the last separator may belong to a token
+                # that continues in the next chunk.
+                end = max(map(text.rfind, self.separators)) + 1
+            else:
+                end = len(text)
+
+            if end:
+                yield from self._lex_chunk(text[:end], offset)
+                offset += end
+
+            if not chunk:
+                return
+
+            rest = text[end:]
+
+    def _lex_buffer(self, source: Text) -> Iterator[lex.LexToken]:
+        chunk_size = self.chunk_size
+        separators = re.escape(self.separators.encode('ascii'))
+        last_separator = re.compile(b'[%s][^%s]*\\Z' % (separators,
+                                                        separators))
+
+        with memoryview(source) as view:
+            length = len(view)
+            start = 0
+
+            while start < length:
+                end = start + chunk_size
+                cut = length
+
+                # Extend the window until it holds a separator.
+                while end < length:
+                    match = last_separator.search(view, end - chunk_size, end)
+
+                    if match is not None:
+                        cut = match.start() + 1
+                        break
+
+                    end += chunk_size
+
+                with view[start:cut] as window:
+                    yield from self._lex_chunk(window, start)
+
+                start = cut
+
+    def _lex_chunk(self, chunk: Text,
+                   offset: int) -> Iterator[lex.LexToken]:
+        lexer = self.lexer
+        diagnostics = self.diagnostics
+
+        if diagnostics is None:
+            lexer.input(chunk)
+
+            for token in iter(lexer.token, None):
+                token.lexpos += offset
+                yield token
+
+            return
+
+        # Errors are reported by the lexer while it scans, either in `input`
+        # or in `token`, and other errors may be collected in the list while
+        # the tokens are being used.
+        count = len(diagnostics)
+        lexer.input(chunk)
+
+        while True:
+            token = lexer.token()
+            diagnostics[count:] = [diagnostic.moved(offset)
+                                   for diagnostic in diagnostics[count:]]
+
+            if token is None:
+                return
+
+            token.lexpos += offset
+            yield token
+            count = len(diagnostics)
+
+    def __iter__(self) -> 'TokenStream':
+        return self
+
+    def __next__(self) -> lex.LexToken:
+        return next(self._tokens)
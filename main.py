@@ -1,5 +1,7 @@
+from sys import stderr
 from typing import Any
 
+from evaluator.cache import expression_cache
 from parser.polynomial_parser import PolynomialParser
 
 def main() -> None:
@@ -21,7 +23,7 @@ def main() -> None:
             break
 
         try:
-            result = parser.parse(text)
+            result = expression_cache.evaluate(text, parser.ids, parser.parse)
         except ValueError:
             print('Undefined')
             continue
@@ -29,6 +31,12 @@ def main() -> None:
             print('Division by zero')
             continue
 
+        if result is None:
+            for diagnostic in expression_cache.diagnose(text):
+                print(diagnostic, file=stderr)
+
+            continue
+
         print(result)
 
 if __name__ == '__main__':
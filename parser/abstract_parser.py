@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from sys import stderr
 from typing import Any, Dict, List
 
 import ply.yacc as yacc
 import ply.lex as lex
+from lexer.diagnostics import Diagnostic
 
 class AbstractParser(ABC):
     """
@@ -19,6 +19,11 @@ class AbstractParser(ABC):
         The PLY parser instance used by the AbstractParser.
     ids : Dict[str, Any]
         A dictionary for storing identifiers and their associated values.
+    syntax_errors : int
+        The number of syntax errors reported so far.
+    diagnostics : List[Diagnostic]
+        The errors found in the last input text parsed, which are collected
+        here instead of being printed.
     """
 
     def __init__(self, lexer: lex.Lexer, tokens: List[str]) -> None:
@@ -39,12 +44,25 @@ class AbstractParser(ABC):
 
         self.parser: yacc.LRParser | None = None
         self.ids: Dict[str, Any] = {}
+        self.syntax_errors = 0
+        self.diagnostics: List[Diagnostic] = []
 
-    def p_error(self, _) -> None:
+    def p_error(self, p: lex.LexToken | None) -> None:
         """
         Error handling rule for syntax errors.
+
+        Parameters
+        ----------
+        p : lex.LexToken | None
+            The unexpected token, or None at the end of the input.
         """
-        print(f"Syntax error", file=stderr)
+        self.syntax_errors += 1
+
+        if p is None:
+            self.diagnostics.append(Diagnostic('Syntax error at end of input'))
+        else:
+            self.diagnostics.append(Diagnostic(
+                f'Syntax error at {p.value!r}', p.lexpos, p.value))
 
     def get_parser(self) -> yacc.LRParser:
         """
@@ -0,0 +1,195 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List
+
+import ply.lex as lex
+from evaluator.nodes import Node
+from lexer.diagnostics import Diagnostic
+from lexer.polynomial_lexer import PolynomialLexer
+from lexer.polynomial_scanner import PolynomialScanner
+from parser.polynomial_tree_parser import PolynomialTreeParser
+from parser.pratt_parser import Group, PrattParser
+
+class IncrementalParser:
+    """
+    Parser of expression trees for texts that are edited and parsed again.
+
+    The tokens and the trees of the groups, the parenthesized expressions,
+    absolute values and function calls, of the previous text are kept. When
+    a new text is parsed, only the characters between the common prefix and
+    the common suffix of the two texts are scanned again, from the start of
+    the last token that cannot be changed by the edit to the first separator
+    after it, and the trees of the groups whose tokens are all outside of
+    this region are reused as they are instead of being parsed again.
+
+    Trees are immutable, so the result is always the tree that
+    `PolynomialTreeParser.parse` would build, and reused groups are shared
+    between the trees of successive texts. Texts containing illegal
+    characters are always scanned whole again, so that `diagnostics` holds
+    all the errors of the last text, like after a full parse.
+
+    Attributes
+    ----------
+    parser : PolynomialTreeParser
+        The underlying parser, built with the scanner and the Pratt parser.
+    diagnostics : List[Diagnostic]
+        The errors found in the last text.
+    text : str
+        The last text parsed.
+    tree : Node | None
+        The tree of the last text, or None if it could not be parsed.
+    scanned : int
+        The number of characters scanned for the last text.
+    reused_tokens : int
+        The number of tokens of the previous text reused for the last text.
+    reused_groups : int
+        The number of groups of the previous text that could be reused for
+        the last text.
+
+    Examples
+    --------
+    >>> parser = IncrementalParser()
+    >>> parser.parse('sin(x) + (y - 1)').to_text()
+    'sin(x) + (y - 1)'
+    >>> parser.parse('sin(x) + (y - 2)').to_text()
+    'sin(x) + (y - 2)'
+    >>> parser.scanned, parser.reused_groups
+    (4, 1)
+    """
+
+    def __init__(self, exact: bool = False) -> None:
+        """
+        Initialize an IncrementalParser instance.
+
+        Parameters
+        ----------
+        exact : bool, optional
+            If True, numbers are parsed as exact rationals. The default is
+            False.
+        """
+        self.parser = PolynomialTreeParser.build(exact, scanner=True,
+                                                 pratt=True)
+        self.text = ''
+        self.tree: Node | None = None
+        self.scanned = 0
+        self.reused_tokens = 0
+        self.reused_groups = 0
+        self.diagnostics: List[Diagnostic] = self.parser.diagnostics
+
+        self._scanner: PolynomialScanner = self.parser.lexer
+        self._pratt: PrattParser = self.parser.get_parser()
+        self._types: List[str] = []
+        self._values: List[Any] = []
+        self._positions = array('q')
+        self._groups: Dict[int, Group] = {}
+        # The previous text is scanned whole again if it had illegal
+        # characters, which are not tokens and would not be reported again.
+        self._clean = False
+
+    def parse(self, text: str) -> Node | None:
+        """
+        Parse a new version of the text.
+
+        Parameters
+        ----------
+        text : str
+            The new text.
+
+        Returns
+        -------
+        Node | None
+            The tree of the text, the tree of its last statement if there are
+            several, or None if it could not be parsed.
+        """
+        old = self.text
+        types, values, positions = self._types, self._values, self._positions
+        groups = self._groups
+
+        if not self._clean:
+            old, types, values, positions, groups = '', [], [], array('q'), {}
+
+        # The common prefix and suffix of the texts, which do not overlap.
+        prefix = _common_length(old, text, lambda length: slice(length))
+        suffix = _common_length(old[prefix:], text[prefix:],
+                                lambda length: slice(-length, None))
+
+        # A token is kept if the characters read to scan it, up to one
+        # character after its end, are in the prefix: the token that follows
+        # it must start at least two characters before the end of the prefix.
+        kept = max(bisect_right(positions, prefix - 2) - 1, 0)
+        start = positions[kept] if kept else 0
+
+        # Scanning stops after the first separator in the suffix, where no
+        # token can continue and the old tokens start again.
+        end = min((index + 1 for index in
+                   map(text.find, PolynomialLexer.separators,
+                       [len(text) - suffix] * len(PolynomialLexer.separators))
+                   if index >= 0), default=len(text))
+        shift = len(text) - len(old)
+        resumed = bisect_left(positions, end - shift)
+
+        parser = self.parser
+        diagnostics = parser.diagnostics
+        diagnostics.clear()
+        scanner = self._scanner
+        scanner.input(text[start:end])
+        self._clean = not diagnostics
+        diagnostics[:] = [diagnostic.moved(start)
+                          for diagnostic in diagnostics]
+        self.scanned = end - start
+        self.reused_tokens = kept + len(types) - resumed
+
+        self._types = types[:kept] + scanner.types + types[resumed:]
+        self._values = values[:kept] + scanner.values + values[resumed:]
+        self._positions = positions[:kept]
+        self._positions.extend(map(start.__add__, scanner.positions))
+        self._positions.extend(map(shift.__add__, positions[resumed:]))
+
+        # Groups are reused if all of their tokens were kept, with their
+        # indices moved after the scanned tokens.
+        moved = kept + len(scanner.types) - resumed
+        reuse: Dict[int, Group] = {}
+
+        for first, (tree, after) in groups.items():
+            if after <= kept:
+                reuse[first] = (tree, after)
+            elif first >= resumed:
+                reuse[first + moved] = (tree, after + moved)
+
+        self.reused_groups = len(reuse)
+        self._groups = dict(reuse)
+
+        errors = parser.syntax_errors
+        results = self._pratt.parse_tokens(self._types, self._values,
+                                           self._make_token, self._groups,
+                                           reuse)
+
+        self.text = text
+        self.tree = parser._last_result(results, errors)
+
+        return self.tree
+
+    def _make_token(self, index: int) -> lex.LexToken:
+        token = lex.LexToken()
+        token.type = self._types[index]
+        token.value = self._values[index]
+        token.lineno = self._scanner.lineno
+        token.lexpos = self._positions[index]
+
+        return token
+
+def _common_length(first: str, second: str,
+                   part: Callable[[int], slice]) -> int:
+    # Binary search of the length of the longest common part, with string
+    # comparisons instead of a loop over the characters.
+    low, high = 0, min(len(first), len(second))
+
+    while low < high:
+        middle = (low + high + 1) // 2
+
+        if first[part(middle)] == second[part(middle)]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
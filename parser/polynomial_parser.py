@@ -1,10 +1,14 @@
 import math
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, TextIO, Tuple
 
 import ply.lex as lex
 import ply.yacc as yacc
+from evaluator.exact import exact_divide, exact_power
 from parser.abstract_parser import AbstractParser
+from parser.pratt_parser import PrattParser
 from lexer.polynomial_lexer import PolynomialLexer
+from lexer.polynomial_scanner import Text
+from lexer.token_stream import TokenStream
 
 class PolynomialParser(AbstractParser):
     """
@@ -12,9 +16,16 @@ class PolynomialParser(AbstractParser):
 
     Attributes
     ----------
+    start : str
+        The start symbol of the grammar: a document of statements separated
+        by newlines or semicolons.
     precedence : Tuple[Tuple[str, ...], ...]
         A tuple defining the precedence and associativity of operators.
         Operators with the highest precedence are evaluated first.
+    exact : bool
+        Whether the parser evaluates in exact rational mode: decimal literals
+        are fractions, and divisions and negative powers of rational numbers
+        give fractions instead of floats.
 
     Notes
     -----
@@ -28,8 +39,28 @@ class PolynomialParser(AbstractParser):
     5
     >>> parser.parse('x * x')
     25
+
+    In exact mode, polynomial expressions are evaluated without rounding:
+
+    >>> parser = PolynomialParser.build(exact=True)
+    >>> parser.parse('0.1 + 0.2 - 1/3')
+    Fraction(-1, 30)
+
+    Documents of many statements are parsed in a single pass:
+
+    >>> parser.parse_document('a = 2; b = a * 3\\n\\na + b')
+    [2, 6, 8]
+
+    Errors are not printed but collected, for the last text parsed:
+
+    >>> parser.parse('2 + $')
+    >>> parser.diagnostics
+    [Diagnostic("Illegal character '$'", 4, '$'), \
+Diagnostic('Syntax error at end of input', None, None)]
     """
 
+    start: str = 'document'
+
     precedence: Tuple[Tuple[str, ...], ...] = (
         ('right', 'EQUALS'),         # associativity right, precedence = 0
         ('left', 'PLUS', 'MINUS'),   # associativity left,  precedence = 1
@@ -37,6 +68,10 @@ class PolynomialParser(AbstractParser):
         ('right', 'POWER'),          # associativity right, precedence = 3
     )
 
+    # The PLY parsers built without validation, by class, cloned by later
+    # builds.
+    _trusted_parsers: Dict[type, yacc.LRParser] = {}
+
     def __init__(self, lexer: lex.Lexer, tokens: List[str]) -> None:
         """
         Initialize a PolynomialParser instance.
@@ -59,6 +94,28 @@ class PolynomialParser(AbstractParser):
         """
         super().__init__(lexer, tokens)
 
+        self.exact = False
+
+    def p_document(self, p: yacc.YaccProduction) -> None:
+        '''document : statements'''
+        p[0] = p[1]
+
+    def p_statements(self, p: yacc.YaccProduction) -> None:
+        '''statements : statements SEPARATOR expression
+                      | expression
+        '''
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
+
+    def p_empty_statement(self, p: yacc.YaccProduction) -> None:
+        '''statements : statements SEPARATOR
+                      |
+        '''
+        p[0] = p[1] if len(p) == 3 else []
+
     def p_assignment_expression(self, p: yacc.YaccProduction) -> None:
         '''expression : ID EQUALS expression'''
         result = p[3]
@@ -121,9 +178,9 @@ class PolynomialParser(AbstractParser):
             case '*':
                 p[0] = p[1] * p[3]
             case '/':
-                p[0] = p[1] / p[3]
+                p[0] = exact_divide(p[1], p[3]) if self.exact else p[1] / p[3]
             case '**':
-                p[0] = p[1] ** p[3]
+                p[0] = exact_power(p[1], p[3]) if self.exact else p[1] ** p[3]
 
     def p_group_expression(self, p: yacc.YaccProduction) -> None:
         '''expression : LPAREN expression RPAREN
@@ -142,9 +199,10 @@ class PolynomialParser(AbstractParser):
         except:
             text: str = input(f'{p[1]} = ')
 
-            sub_parser = PolynomialParser.build()
+            sub_parser = PolynomialParser.build(exact=self.exact)
             sub_parser.ids = self.ids
             p[0] = sub_parser.parse(text)
+            self.diagnostics.extend(sub_parser.diagnostics)
 
             self.ids[p[1]] = p[0]
 
@@ -152,14 +210,19 @@ class PolynomialParser(AbstractParser):
         '''expression : NUMBER'''
         p[0] = p[1]
 
-    def parse(self, text: str) -> Any:
+    def parse(self, text: Text) -> Any:
         """
         Parse the input text.
 
+        If the text holds several statements, they are all evaluated and the
+        result of the last one is returned.
+
         Parameters
         ----------
-        text : str
-            The input text to be parsed.
+        text : Text
+            The input text to be parsed, as a string, or as a buffer of ASCII
+            text, like a `bytes` or `mmap` object, if the parser was built
+            with the scanner.
 
         Returns
         -------
@@ -174,11 +237,91 @@ class PolynomialParser(AbstractParser):
             If a division by zero occurs in the parsed expression.
         """
         parser = self.get_parser()
+        errors = self.syntax_errors
+        self.diagnostics.clear()
+
+        return self._last_result(parser.parse(input=text, lexer=self.lexer),
+                                 errors)
+
+    def parse_document(self, source: Text | TextIO) -> List[Any] | None:
+        """
+        Parse a document of statements separated by newlines or semicolons.
+
+        All statements are parsed in a single run of the lexer and the
+        parser, in order, so assignments are visible to the statements that
+        follow them. Empty statements are skipped.
+
+        Parameters
+        ----------
+        source : Text | TextIO
+            The document, as text, or as a text file that is read lazily.
+
+        Returns
+        -------
+        List[Any] | None
+            The results of the statements, or None if the document could not
+            be parsed. Syntax errors are reported to `p_error`, and counted in
+            `syntax_errors`, even when the LALR parser recovers from them.
+        """
+        parser = self.get_parser()
+        self.diagnostics.clear()
+
+        if isinstance(source, Text):
+            return parser.parse(input=source, lexer=self.lexer)
+
+        stream = TokenStream(self.lexer, source, PolynomialLexer.separators,
+                             diagnostics=self.diagnostics)
+
+        return parser.parse(lexer=stream)
+
+    def parse_stream(self, source: Text | TextIO,
+                     chunk_size: int = 1 << 16) -> Any:
+        """
+        Parse a text or a text file, reading and tokenizing it lazily.
+
+        Files are read in chunks and their tokens are passed to the parser as
+        they are produced, so that long expressions are parsed without
+        holding their text or their tokens in memory.
+
+        Parameters
+        ----------
+        source : Text | TextIO
+            The text, a text file read from its current position, or a
+            buffer of ASCII text, like a `bytes` or `mmap` object, which is
+            lexed in place and needs the scanner.
+        chunk_size : int, optional
+            The number of characters read from a file at once. The default
+            is 65536.
+
+        Returns
+        -------
+        Any
+            The result of parsing the input, the result of its last
+            statement if there are several.
+        """
+        parser = self.get_parser()
+        stream = TokenStream(self.lexer, source, PolynomialLexer.separators,
+                             chunk_size, self.diagnostics)
+        errors = self.syntax_errors
+        self.diagnostics.clear()
+
+        return self._last_result(parser.parse(lexer=stream), errors)
+
+    def _last_result(self, results: List[Any] | None, errors: int) -> Any:
+        if not results:
+            # A text without any statement is not an expression, which is a
+            # syntax error unless the parser already reported one.
+            if results is not None and self.syntax_errors == errors:
+                self.p_error(None)
 
-        return parser.parse(input=text, lexer=self.lexer)
+            return None
+
+        return results[-1]
 
     @classmethod
-    def build(cls, **kwargs) -> 'PolynomialParser':
+    def build(cls, exact: bool = False, scanner: bool = False,
+              pratt: bool = False, validate: bool = True,
+              **kwargs) -> 'PolynomialParser':
         """
         Build and return an instance of the PolynomialParser.
 
@@ -187,6 +330,22 @@ class PolynomialParser(AbstractParser):
 
         Parameters
         ----------
+        exact : bool, optional
+            If True, the parser evaluates in exact rational mode. The default
+            is False.
+        scanner : bool, optional
+            If True, the input is tokenized by the hand-written
+            `PolynomialScanner` instead of a PLY lexer. The default is False.
+        pratt : bool, optional
+            If True, the input is parsed by a `PrattParser` calling the same
+            production rules, which needs no LALR table and starts instantly,
+            instead of a PLY parser. The default is False.
+        validate : bool, optional
+            If False, the grammar is trusted: the PLY parser and lexer are
+            built without validating the rules or reading their source files,
+            and the LALR tables are only built once per class, by the first
+            such build, and shared by the parsers of later ones. The default
+            is True.
         **kwargs
             Additional keyword arguments to pass to the PLY lexer used by the
             PolynomialParser
@@ -196,12 +355,30 @@ class PolynomialParser(AbstractParser):
         PolynomialParser
             An instance of PolynomialParser.
         """
-        polynomial_lexer = PolynomialLexer.build(**kwargs)
+        polynomial_lexer = PolynomialLexer.build(exact, scanner, validate,
+                                                 **kwargs)
 
         lexer: lex.Lexer = polynomial_lexer.get_lexer()
         tokens: List[str] = polynomial_lexer.tokens
 
-        polynomial_parser = PolynomialParser(lexer, tokens)
-        polynomial_parser.parser = yacc.yacc(module=polynomial_parser)
+        polynomial_parser = cls(lexer, tokens)
+        polynomial_parser.exact = exact
+        # Lexical and syntax errors are collected in the same list.
+        polynomial_parser.diagnostics = polynomial_lexer.diagnostics
+
+        if pratt:
+            polynomial_parser.parser = PrattParser(
+                polynomial_parser, polynomial_lexer.reserved.values())
+        elif validate:
+            polynomial_parser.parser = yacc.yacc(module=polynomial_parser,
+                                                 optimize=True)
+        else:
+            if cls not in PolynomialParser._trusted_parsers:
+                PolynomialParser._trusted_parsers[cls] = yacc.yacc(
+                    module=cls(lexer, tokens), optimize=True, validate=False)
+
+            # The rules of the clone are the methods of the new instance.
+            polynomial_parser.parser = \
+                PolynomialParser._trusted_parsers[cls].clone(polynomial_parser)
 
         return polynomial_parser
@@ -0,0 +1,100 @@
+import ply.yacc as yacc
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Node, Number, Variable)
+from lexer.polynomial_scanner import Text
+from parser.polynomial_parser import PolynomialParser
+
+class PolynomialTreeParser(PolynomialParser):
+    """
+    Parser that builds an expression tree instead of evaluating the input.
+
+    The grammar is the same as the one of `PolynomialParser`, but every
+    production returns a `Node` so the expression can be analysed, compiled and
+    evaluated many times without parsing the text again.
+
+    Examples
+    --------
+    >>> parser = PolynomialTreeParser.build()
+    >>> tree = parser.parse('2*x**2 + 1')
+    >>> tree
+    BinaryOperation('+', BinaryOperation('*', Number(2), ...), Number(1))
+    >>> tree.to_text()
+    '2 * x ** 2 + 1'
+    """
+
+    def p_assignment_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : ID EQUALS expression'''
+        p[0] = Assignment(p[1], p[3])
+
+    def p_function_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : SINE LPAREN expression RPAREN
+                      | COSINE LPAREN expression RPAREN
+                      | TANGENT LPAREN expression RPAREN
+                      | ARCSINE LPAREN expression RPAREN
+                      | ARCCOSINE LPAREN expression RPAREN
+                      | ARCTANGENT LPAREN expression RPAREN
+                      | EXPONENTIAL LPAREN expression RPAREN
+                      | NATURAL_LOG LPAREN expression RPAREN
+                      | LOG_BASE_2 LPAREN expression RPAREN
+                      | LOG_BASE_10 LPAREN expression RPAREN
+                      | SQUARE_ROOT LPAREN expression RPAREN
+        '''
+        p[0] = Function(p[1], p[3])
+
+    def p_unary_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : MINUS expression'''
+        p[0] = Negation(p[2])
+
+    def p_binary_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : expression PLUS expression
+                      | expression MINUS expression
+                      | expression TIMES expression
+                      | expression DIVIDE expression
+                      | expression POWER expression
+        '''
+        p[0] = BinaryOperation(p[2], p[1], p[3])
+
+    def p_group_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : LPAREN expression RPAREN
+                      | VERT expression VERT
+        '''
+        match p[1]:
+            case '(':
+                p[0] = p[2]
+            case '|':
+                p[0] = AbsoluteValue(p[2])
+
+    def p_id_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : ID'''
+        p[0] = Variable(p[1])
+
+    def p_number_expression(self, p: yacc.YaccProduction) -> None:
+        '''expression : NUMBER'''
+        p[0] = Number(p[1])
+
+    def parse(self, text: Text) -> Node | None:
+        """
+        Parse the input text into an expression tree.
+
+        If the text holds several statements, the tree of the last one is
+        returned. Use `parse_document` to get the trees of all statements.
+
+        Parameters
+        ----------
+        text : Text
+            The input text to be parsed, as a string, or as a buffer of ASCII
+            text, like a `bytes` or `mmap` object, if the parser was built
+            with the scanner.
+
+        Returns
+        -------
+        Node | None
+            The root of the expression tree, or None if the text could not be
+            parsed.
+        """
+        parser = self.get_parser()
+        errors = self.syntax_errors
+        self.diagnostics.clear()
+
+        return self._last_result(parser.parse(input=text, lexer=self.lexer),
+                                 errors)
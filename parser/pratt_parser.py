@@ -0,0 +1,381 @@
+import sys
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, Sequence,
+                    Tuple)
+
+from lexer.polynomial_scanner import PolynomialScanner
+
+Group = Tuple[Any, int]
+"""
+The result of a group of tokens and the index following its last token.
+"""
+
+_PAREN, _ABSOLUTE, _FUNCTION, _BINARY, _NEGATION, _ASSIGNMENT = range(6)
+
+class _SyntaxError(Exception):
+    def __init__(self, index: int) -> None:
+        super().__init__()
+
+        self.index = index
+
+class _TokenWindow:
+    # Tokens of a lexer read as the parser asks for them. The parser never
+    # looks back further than the token before the last one it read, so
+    # older tokens are dropped and memory does not grow with the input.
+    def __init__(self, lexer: Any) -> None:
+        self.lexer = lexer
+        self.tokens: List[Any] = []
+        self.start = 0
+        self.done = False
+        self.types = _Column(self, 'type')
+        self.values = _Column(self, 'value')
+
+    def token(self, index: int) -> Any:
+        position = index - self.start
+        tokens = self.tokens
+
+        while position >= len(tokens):
+            if self.done:
+                return None
+
+            if position > 16:
+                del tokens[:position - 1]
+                self.start += position - 1
+                position = 1
+
+            token = self.lexer.token()
+
+            if token is None:
+                self.done = True
+
+                return None
+
+            tokens.append(token)
+
+        return tokens[position]
+
+class _Column:
+    # The types or the values of the tokens of a window, as a sequence whose
+    # length is unknown: it has no end, and reads None past the last token.
+    def __init__(self, window: _TokenWindow, attribute: str) -> None:
+        self.window = window
+        self.attribute = attribute
+
+    def __getitem__(self, index: int) -> Any:
+        window = self.window
+        position = index - window.start
+
+        if position < len(window.tokens):
+            return getattr(window.tokens[position], self.attribute)
+
+        token = window.token(index)
+
+        return None if token is None else getattr(token, self.attribute)
+
+    def __len__(self) -> int:
+        return sys.maxsize
+
+class PrattParser:
+    """
+    Operator-precedence parser for the grammar of `PolynomialParser`.
+
+    The parser reads the precedence table of a parser module and calls its
+    `p_` production rules with plain lists in place of PLY productions, so
+    it produces exactly the results of the LALR parser built by
+    `yacc.yacc`, without building any table. Statements are parsed one
+    after the other, each with the operator-precedence algorithm. Operators
+    and groups are kept on explicit stacks instead of the call stack, so
+    nesting depth is not limited by the recursion limit. With a
+    `PolynomialScanner`, the token arrays are read directly and no token
+    object is created. Other lexers, like a `TokenStream`, are read lazily,
+    one token ahead, and the tokens that were parsed are dropped.
+
+    Production rules only get the values of the symbols: `p.lineno`,
+    `p.lexpos` and the other methods of `yacc.YaccProduction` are not
+    available. Syntax errors are reported once to `p_error` and the parse
+    returns None, without the error recovery of PLY.
+
+    Examples
+    --------
+    >>> parser = PolynomialParser.build(pratt=True)
+    >>> parser.parse_document('x = 3 + 1; 2 * x')
+    [4, 8]
+    """
+
+    def __init__(self, module: Any, functions: Iterable[str]) -> None:
+        """
+        Initialize a PrattParser instance.
+
+        Parameters
+        ----------
+        module : Any
+            The parser module, with a `precedence` table, the production
+            rules of `PolynomialParser` and a `p_error` method.
+        functions : Iterable[str]
+            The token types of the function names.
+        """
+        self.module = module
+        self.functions = frozenset(functions)
+
+        self.levels: Dict[str, Tuple[int, bool]] = {}
+
+        for level, (associativity, *names) in enumerate(module.precedence):
+            for name in names:
+                self.levels[name] = (level, associativity == 'left')
+
+        self._binary = {name: level for name, level in self.levels.items()
+                        if name != 'EQUALS'}
+
+    def parse(self, input: str | None = None, lexer: Any = None,
+              debug: bool = False, tracking: bool = False) -> Any:
+        """
+        Parse the input text.
+
+        Parameters
+        ----------
+        input : str | None, optional
+            The input text, or None to continue with the input of the lexer.
+        lexer : Any, optional
+            The lexer, a `lex.Lexer` or any object with `input` and `token`
+            methods.
+        debug : bool, optional
+            Ignored, for compatibility with `yacc.LRParser.parse`.
+        tracking : bool, optional
+            Ignored, for compatibility with `yacc.LRParser.parse`.
+
+        Returns
+        -------
+        Any
+            The result of the production rule of the whole input, or None if
+            there is a syntax error.
+        """
+        if input is not None:
+            lexer.input(input)
+
+        if isinstance(lexer, PolynomialScanner):
+            # The token arrays of the scanner are read directly.
+            return self.parse_tokens(lexer.types, lexer.values,
+                                     lexer.make_token, start=lexer.remaining())
+
+        window = _TokenWindow(lexer)
+
+        return self.parse_tokens(window.types, window.values, window.token)
+
+    def parse_tokens(self, types: Sequence[str], values: Sequence[Any],
+                     make_token: Callable[[int], Any] | None = None,
+                     groups: Dict[int, Group] | None = None,
+                     reuse: Mapping[int, Group] | None = None,
+                     start: int = 0) -> Any:
+        """
+        Parse token arrays.
+
+        Groups are the parenthesized expressions, absolute values and
+        function calls. Their result only depends on their own tokens, so
+        the result of a group parsed before can be reused as long as its
+        tokens are unchanged.
+
+        The sequences may also be endless, with None as the type of every
+        token past the last one.
+
+        Parameters
+        ----------
+        types : Sequence[str]
+            The types of the tokens.
+        values : Sequence[Any]
+            The values of the tokens.
+        make_token : Callable[[int], Any] | None, optional
+            A function creating the token passed to `p_error` from its index.
+            The error token is None if not given.
+        groups : Dict[int, Group] | None, optional
+            A dictionary where the result and the end index of every group
+            parsed is stored, by the index of its first token.
+        reuse : Mapping[int, Group] | None, optional
+            Results and end indices of groups, by the index of their first
+            token, used instead of parsing groups starting at these indices.
+        start : int, optional
+            The index of the first token to parse. The default is 0.
+
+        Returns
+        -------
+        Any
+            The result of the production rule of the tokens, or None if
+            there is a syntax error.
+        """
+        try:
+            return self._parse(types, values, start, groups, reuse)
+        except _SyntaxError as error:
+            self.module.p_error(make_token(error.index) if make_token and
+                                error.index < len(types) else None)
+
+            return None
+
+    def _parse(self, types: Sequence[str], values: Sequence[Any], index: int,
+               groups: Dict[int, Group] | None,
+               reuse: Mapping[int, Group] | None) -> Any:
+        module = self.module
+        count = len(types)
+
+        # The rules of the document are called as the LALR parser reduces
+        # them: an empty statement is only reduced before a separator or at
+        # the end of the input.
+        if index == count or types[index] in (None, 'SEPARATOR'):
+            p = [None]
+            module.p_empty_statement(p)
+        else:
+            expression, index = self._parse_expression(types, values, index,
+                                                       groups, reuse)
+            p = [None, expression]
+            module.p_statements(p)
+
+        while index < count and types[index] is not None:
+            separator = values[index]
+            index += 1
+
+            if index == count or types[index] in (None, 'SEPARATOR'):
+                p = [None, p[0], separator]
+                module.p_empty_statement(p)
+            else:
+                expression, index = self._parse_expression(types, values,
+                                                           index, groups,
+                                                           reuse)
+                p = [None, p[0], separator, expression]
+                module.p_statements(p)
+
+        p = [None, p[0]]
+        module.p_document(p)
+
+        return p[0]
+
+    def _parse_expression(self, types: Sequence[str], values: Sequence[Any],
+                          index: int, groups: Dict[int, Group] | None,
+                          reuse: Mapping[int, Group] | None
+                          ) -> Tuple[Any, int]:
+        module = self.module
+        binary = self._binary
+        functions = self.functions
+        negation_level = self.levels['MINUS'][0]
+        assignment_level = self.levels['EQUALS'][0]
+        count = len(types)
+        # Every entry is (kind, level, symbol), where the symbol is the
+        # operator or the assigned name, or the index of the first token of a
+        # group, along with the name of a function, so no token is read
+        # again. Groups have a negative level so that operators are never
+        # reduced past them.
+        operators: List[Tuple[int, int, Any]] = []
+        results: List[Any] = []
+
+        while True:
+            # An operand is expected: push the prefix operators and the
+            # opening groups up to the first number or name.
+            while True:
+                if index == count:
+                    raise _SyntaxError(index)
+
+                kind = types[index]
+
+                if kind == 'NUMBER':
+                    p = [None, values[index]]
+                    module.p_number_expression(p)
+                    results.append(p[0])
+                    index += 1
+                    break
+
+                if kind == 'ID':
+                    if index + 1 == count or types[index + 1] != 'EQUALS':
+                        p = [None, values[index]]
+                        module.p_id_expression(p)
+                        results.append(p[0])
+                        index += 1
+                        break
+
+                    operators.append((_ASSIGNMENT, assignment_level,
+                                      values[index]))
+                    index += 1
+                elif kind == 'MINUS':
+                    operators.append((_NEGATION, negation_level, None))
+                elif reuse is not None and index in reuse:
+                    value, index = reuse[index]
+                    results.append(value)
+                    break
+                elif kind == 'LPAREN':
+                    operators.append((_PAREN, -1, index))
+                elif kind == 'VERT':
+                    operators.append((_ABSOLUTE, -1, index))
+                elif kind in functions:
+                    if index + 1 == count or types[index + 1] != 'LPAREN':
+                        raise _SyntaxError(index + 1)
+
+                    operators.append((_FUNCTION, -1, (index, values[index])))
+                    index += 1
+                else:
+                    raise _SyntaxError(index)
+
+                index += 1
+
+            # An operator is expected: reduce what binds tighter than the next
+            # binary operator, or close groups.
+            while True:
+                kind = types[index] if index < count else None
+                binding = binary.get(kind)
+
+                if binding is not None:
+                    level, left = binding
+
+                    while operators and (operators[-1][1] > level or
+                                         (left and
+                                          operators[-1][1] == level)):
+                        self._reduce(operators.pop(), results)
+
+                    operators.append((_BINARY, level, values[index]))
+                    index += 1
+                    break
+
+                if kind not in (None, 'SEPARATOR', 'RPAREN', 'VERT'):
+                    raise _SyntaxError(index)
+
+                while operators and operators[-1][1] >= 0:
+                    self._reduce(operators.pop(), results)
+
+                if kind is None or kind == 'SEPARATOR':
+                    if operators:
+                        raise _SyntaxError(index)
+
+                    return results[0], index
+
+                group, _, first = operators.pop() if operators else \
+                    (None, -1, None)
+
+                if kind == 'RPAREN' and group == _PAREN:
+                    p = [None, '(', results[-1], ')']
+                    module.p_group_expression(p)
+                elif kind == 'RPAREN' and group == _FUNCTION:
+                    first, name = first
+                    p = [None, name, '(', results[-1], ')']
+                    module.p_function_expression(p)
+                elif kind == 'VERT' and group == _ABSOLUTE:
+                    p = [None, '|', results[-1], '|']
+                    module.p_group_expression(p)
+                else:
+                    raise _SyntaxError(index)
+
+                results[-1] = p[0]
+                index += 1
+
+                if groups is not None:
+                    groups[first] = (p[0], index)
+
+    def _reduce(self, operator: Tuple[int, int, Any],
+                results: List[Any]) -> None:
+        kind, _, symbol = operator
+
+        if kind == _BINARY:
+            right = results.pop()
+            p = [None, results[-1], symbol, right]
+            self.module.p_binary_expression(p)
+        elif kind == _NEGATION:
+            p = [None, '-', results[-1]]
+            self.module.p_unary_expression(p)
+        else:
+            p = [None, symbol, '=', results[-1]]
+            self.module.p_assignment_expression(p)
+
+        results[-1] = p[0]
@@ -55,8 +55,13 @@ class LexError(Exception):
         self.args = (message,)
         self.text = s
 
-# Token class.  This class is used to represent the tokens produced.
+# Token class.  This class is used to represent the tokens produced.  Tokens
+# are slotted, so they have no per-instance __dict__; the end positions are
+# only set by the parser when tracking positions.
 class LexToken(object):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer', 'endlineno',
+                 'endlexpos')
+
     type: str
     value: Any
     lineno: int
@@ -152,6 +157,8 @@ class Lexer:
             for key, ef in self.lexstateerrorf.items():
                 c.lexstateerrorf[key] = getattr(object, ef.__name__)
             c.lexmodule = object
+            # Use the rebound rules of the current state
+            c.begin(c.lexstate)
         return c
 
     # ------------------------------------------------------------
@@ -723,7 +730,7 @@ class LexerReflect(object):
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
 def lex(*, module=None, object=None, debug=False, 
-        reflags=int(re.VERBOSE), debuglog=None, errorlog=None):
+        reflags=int(re.VERBOSE), debuglog=None, errorlog=None, validate=True):
 
     global lexer
 
@@ -756,7 +763,10 @@ def lex(*, module=None, object=None, debug=False,
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
-    if linfo.validate_all():
+
+    # A trusted specification is used without checking its rules nor reading
+    # their source files.
+    if validate and linfo.validate_all():
         raise SyntaxError("Can't build lexer")
 
     # Dump some basic debugging information
@@ -64,6 +64,7 @@
 import re
 import types
 import sys
+import copy
 import inspect
 
 from typing import Any
@@ -156,6 +157,9 @@ def format_stack_entry(r):
 #        .endlexpos  = Ending lex position (optional, set automatically)
 
 class YaccSymbol:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'endlineno',
+                 'endlexpos', 'lexer')
+
     def __str__(self):
         return self.type
 
@@ -227,13 +231,15 @@ class YaccProduction:
 # -----------------------------------------------------------------------------
 
 class LRParser:
-    def __init__(self, lrtab, errorf):
+    def __init__(self, lrtab, errorf, optimize=False):
         self.productions = lrtab.lr_productions
         self.action = lrtab.lr_action
         self.goto = lrtab.lr_goto
         self.errorfunc = errorf
+        self.optimize = optimize
         self.set_defaulted_states()
         self.errorok = True
+        self._stacks = None
 
     def errok(self):
         self.errorok = True
@@ -264,15 +270,39 @@ class LRParser:
     def disable_defaulted_states(self):
         self.defaulted_states = {}
 
+    # clone().
+    #
+    # Create a parser sharing the parsing tables of this one.  If a module is
+    # given, its rules and error function, which must define the same grammar,
+    # replace the ones of this parser, like Lexer.clone() does for lexers.
+
+    def clone(self, module=None):
+        c = copy.copy(self)
+        c._stacks = None
+
+        if module:
+            c.productions = []
+            for p in self.productions:
+                p = copy.copy(p)
+                if p.func:
+                    p.callable = getattr(module, p.func)
+                c.productions.append(p)
+            c.errorfunc = getattr(module, 'p_error', None)
+        return c
+
     # parse().
     #
     # This is the core parsing engine.  To operate, it requires a lexer object.
     # Two options are provided.  The debug flag turns on debugging so that you can
     # see the various rule reductions and parsing steps.  tracking turns on position
     # tracking.  In this mode, symbols will record the starting/ending line number and
-    # character index.
+    # character index.  If the parser was built with optimize set and neither flag is
+    # given, the work is done by parseopt() below.
 
     def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        if self.optimize and not debug and not tracking:
+            return self.parseopt(input, lexer)
+
         # If debugging has been specified as a flag, turn it into a logging object
         if isinstance(debug, int) and debug:
             debug = PlyLogger(sys.stderr)
@@ -582,6 +612,218 @@ class LRParser:
             # If we'r here, something really bad happened
             raise RuntimeError('yacc: internal parser error!!!\n')
 
+    # parseopt().
+    #
+    # Optimized version of parse() for production use, without debugging or position
+    # tracking.  Symbol types and values are kept on two flat stacks instead of
+    # YaccSymbol objects, so a reduction creates no symbol.  Grammar rules get a plain
+    # list of the values of the production, with p[0] set to None, in place of a
+    # YaccProduction: indexing it needs no method call, but p.lineno(), p.lexpos(),
+    # p.lexer, p.parser, p.error() and negative indices into the stack are not
+    # available.  The stacks are kept between calls, unless a grammar rule starts
+    # another parse with the same parser.  Error recovery works as in parse().
+
+    def parseopt(self, input=None, lexer=None):
+        lookahead = None                         # Current lookahead symbol
+        actions = self.action                    # Local reference to action table
+        goto    = self.goto                      # Local reference to goto table
+        prod    = self.productions               # Local reference to production list
+        defaulted_states = self.defaulted_states # Local reference to defaulted states
+        errorcount = 0                           # Used during error recovery
+
+        # If no lexer was given, we will try to use the lex module
+        if not lexer:
+            from . import lex
+            lexer = lex.lexer
+
+        # Take the stacks of the previous parse, or new ones for a nested parse
+        stacks = self._stacks or ([], [], [], [])
+        self._stacks = None
+        statestack, typestack, valuestack, lookaheadstack = stacks
+
+        # If input was supplied, pass to lexer
+        if input is not None:
+            lexer.input(input)
+
+        # Set the token function
+        get_token = self.token = lexer.token
+        self.statestack = statestack
+        errtoken = None
+
+        # The start state is assumed to be (0,$end)
+
+        statestack.append(0)
+        typestack.append('$end')
+        valuestack.append(None)
+        state = 0
+
+        try:
+            while True:
+                if state not in defaulted_states:
+                    if not lookahead:
+                        if not lookaheadstack:
+                            lookahead = get_token()     # Get the next token
+                        else:
+                            lookahead = lookaheadstack.pop()
+                        if not lookahead:
+                            lookahead = YaccSymbol()
+                            lookahead.type = '$end'
+
+                    # Check the action table
+                    t = actions[state].get(lookahead.type)
+                else:
+                    t = defaulted_states[state]
+
+                if t is not None:
+                    if t > 0:
+                        # shift a symbol on the stack
+                        statestack.append(t)
+                        state = t
+                        typestack.append(lookahead.type)
+                        valuestack.append(lookahead.value)
+                        lookahead = None
+
+                        # Decrease error count on successful shift
+                        if errorcount:
+                            errorcount -= 1
+                        continue
+
+                    if t < 0:
+                        # reduce the symbols on top of the stack, emit a production
+                        p = prod[-t]
+                        pname = p.name
+                        plen  = p.len
+
+                        if plen:
+                            targ = valuestack[-plen-1:]
+                            targ[0] = None
+                        else:
+                            targ = [None]
+
+                        try:
+                            # Call the grammar rule with the list of values
+                            self.state = state
+                            p.callable(targ)
+                        except SyntaxError:
+                            # If an error was set. Enter error recovery state
+                            lookaheadstack.append(lookahead)    # Save the current lookahead token
+                            if plen:
+                                typestack.pop()                 # Drop the last symbol of the production
+                                valuestack.pop()
+                            statestack.pop()                    # Pop back one state (before the reduce)
+                            state = statestack[-1]
+                            sym = YaccSymbol()
+                            sym.type = 'error'
+                            sym.value = 'error'
+                            lookahead = sym
+                            errorcount = error_count
+                            self.errorok = False
+                            continue
+
+                        if plen:
+                            del statestack[-plen:]
+                            del typestack[-plen:]
+                            del valuestack[-plen:]
+
+                        typestack.append(pname)
+                        valuestack.append(targ[0])
+                        state = goto[statestack[-1]][pname]
+                        statestack.append(state)
+                        continue
+
+                    if t == 0:
+                        return valuestack[-1]
+
+                if t is None:
+                    # We have some kind of parsing error here, handled as in parse()
+                    if errorcount == 0 or self.errorok:
+                        errorcount = error_count
+                        self.errorok = False
+                        errtoken = lookahead
+                        if errtoken.type == '$end':
+                            errtoken = None               # End of file!
+                        if self.errorfunc:
+                            if errtoken and not hasattr(errtoken, 'lexer'):
+                                errtoken.lexer = lexer
+                            self.state = state
+                            tok = self.errorfunc(errtoken)
+                            if self.errorok:
+                                # User must have done some kind of panic
+                                # mode recovery on their own.  The
+                                # returned token is the next lookahead
+                                lookahead = tok
+                                errtoken = None
+                                continue
+                        else:
+                            if errtoken:
+                                if hasattr(errtoken, 'lineno'):
+                                    lineno = lookahead.lineno
+                                else:
+                                    lineno = 0
+                                if lineno:
+                                    sys.stderr.write('yacc: Syntax error at line %d, token=%s\n' % (lineno, errtoken.type))
+                                else:
+                                    sys.stderr.write('yacc: Syntax error, token=%s' % errtoken.type)
+                            else:
+                                sys.stderr.write('yacc: Parse error in input. EOF\n')
+                                return
+
+                    else:
+                        errorcount = error_count
+
+                    # case 1:  the statestack only has 1 entry on it.  The token is
+                    # discarded and we just keep going.
+
+                    if len(statestack) <= 1 and lookahead.type != '$end':
+                        lookahead = None
+                        errtoken = None
+                        state = 0
+                        # Nuke the pushback stack
+                        del lookaheadstack[:]
+                        continue
+
+                    # case 2: the statestack has a couple of entries on it, but we're
+                    # at the end of the file. nuke the top entry and generate an error token
+
+                    if lookahead.type == '$end':
+                        return
+
+                    if lookahead.type != 'error':
+                        if typestack[-1] == 'error':
+                            # Error is on top of stack, we'll just nuke input
+                            # symbol and continue
+                            lookahead = None
+                            continue
+
+                        # Create the error symbol for the first time and make it the new lookahead symbol
+                        t = YaccSymbol()
+                        t.type = 'error'
+
+                        if hasattr(lookahead, 'lineno'):
+                            t.lineno = t.endlineno = lookahead.lineno
+                        if hasattr(lookahead, 'lexpos'):
+                            t.lexpos = t.endlexpos = lookahead.lexpos
+                        t.value = lookahead
+                        lookaheadstack.append(lookahead)
+                        lookahead = t
+                    else:
+                        typestack.pop()
+                        valuestack.pop()
+                        statestack.pop()
+                        state = statestack[-1]
+
+                    continue
+
+                # If we'r here, something really bad happened
+                raise RuntimeError('yacc: internal parser error!!!\n')
+        finally:
+            # Clear the stacks for the next parse
+            del statestack[:]
+            del typestack[:]
+            del valuestack[:]
+            del lookaheadstack[:]
+            self._stacks = stacks
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -2203,6 +2445,21 @@ class ParserReflect(object):
             p_function[3]))
         self.pfuncs = p_functions
 
+    # Get the precedence list and the grammar rules of the p_functions
+    # without validating them
+    def get_rules(self):
+        self.preclist = [(term, p[0], level+1)
+                         for level, p in enumerate(self.prec or ())
+                         for term in p[1:]]
+
+        grammar = []
+        for line, module, name, doc in self.pfuncs:
+            if doc:
+                file = self.pdict[name].__code__.co_filename
+                for g in parse_grammar(doc, file, line):
+                    grammar.append((name, g))
+        self.grammar = grammar
+
     # Validate all of the p_functions
     def validate_pfunctions(self):
         grammar = []
@@ -2264,6 +2521,90 @@ class ParserReflect(object):
 
         self.grammar = grammar
 
+# -----------------------------------------------------------------------------
+# _check_grammar()
+#
+# Verify the structure of a grammar, logging its unused or undefined symbols
+# and rules.  Raises YaccError if the grammar is invalid.
+# -----------------------------------------------------------------------------
+
+def _check_grammar(grammar, errorlog, debuglog, debug, check_recursion):
+    errors = False
+
+    # Verify the grammar structure
+    undefined_symbols = grammar.undefined_symbols()
+    for sym, prod in undefined_symbols:
+        errorlog.error('%s:%d: Symbol %r used, but not defined as a token or a rule', prod.file, prod.line, sym)
+        errors = True
+
+    unused_terminals = grammar.unused_terminals()
+    if unused_terminals:
+        debuglog.info('')
+        debuglog.info('Unused terminals:')
+        debuglog.info('')
+        for term in unused_terminals:
+            errorlog.warning('Token %r defined, but not used', term)
+            debuglog.info('    %s', term)
+
+    # Print out all productions to the debug log
+    if debug:
+        debuglog.info('')
+        debuglog.info('Grammar')
+        debuglog.info('')
+        for n, p in enumerate(grammar.Productions):
+            debuglog.info('Rule %-5d %s', n, p)
+
+    # Find unused non-terminals
+    unused_rules = grammar.unused_rules()
+    for prod in unused_rules:
+        errorlog.warning('%s:%d: Rule %r defined, but not used', prod.file, prod.line, prod.name)
+
+    if len(unused_terminals) == 1:
+        errorlog.warning('There is 1 unused token')
+    if len(unused_terminals) > 1:
+        errorlog.warning('There are %d unused tokens', len(unused_terminals))
+
+    if len(unused_rules) == 1:
+        errorlog.warning('There is 1 unused rule')
+    if len(unused_rules) > 1:
+        errorlog.warning('There are %d unused rules', len(unused_rules))
+
+    if debug:
+        debuglog.info('')
+        debuglog.info('Terminals, with rules where they appear')
+        debuglog.info('')
+        terms = list(grammar.Terminals)
+        terms.sort()
+        for term in terms:
+            debuglog.info('%-20s : %s', term, ' '.join([str(s) for s in grammar.Terminals[term]]))
+
+        debuglog.info('')
+        debuglog.info('Nonterminals, with rules where they appear')
+        debuglog.info('')
+        nonterms = list(grammar.Nonterminals)
+        nonterms.sort()
+        for nonterm in nonterms:
+            debuglog.info('%-20s : %s', nonterm, ' '.join([str(s) for s in grammar.Nonterminals[nonterm]]))
+        debuglog.info('')
+
+    if check_recursion:
+        unreachable = grammar.find_unreachable()
+        for u in unreachable:
+            errorlog.warning('Symbol %r is unreachable', u)
+
+        infinite = grammar.infinite_cycles()
+        for inf in infinite:
+            errorlog.error('Infinite recursion detected for symbol %r', inf)
+            errors = True
+
+    unused_prec = grammar.unused_precedence()
+    for term, assoc in unused_prec:
+        errorlog.error('Precedence rule %r defined for unknown symbol %r', assoc, term)
+        errors = True
+
+    if errors:
+        raise YaccError('Unable to build parser')
+
 # -----------------------------------------------------------------------------
 # yacc(module)
 #
@@ -2272,7 +2613,7 @@ class ParserReflect(object):
 
 def yacc(*, debug=yaccdebug, module=None, start=None,
          check_recursion=True, optimize=False, debugfile=debug_file,
-         debuglog=None, errorlog=None) -> LRParser:
+         debuglog=None, errorlog=None, validate=True) -> LRParser:
 
     # Reference to the parsing method of the last built parser
     global parse
@@ -2319,11 +2660,14 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
 
     errors = False
 
-    # Validate the parser information
-    if pinfo.validate_all():
+    # Validate the parser information.  A trusted grammar is only read,
+    # without the checks of the rules nor of their source files.
+    if not validate:
+        pinfo.get_rules()
+    elif pinfo.validate_all():
         raise YaccError('Unable to build parser')
 
-    if not pinfo.error_func:
+    if validate and not pinfo.error_func:
         errorlog.warning('no p_error() function is defined')
 
     # Create a grammar object
@@ -2358,79 +2702,8 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     if errors:
         raise YaccError('Unable to build parser')
 
-    # Verify the grammar structure
-    undefined_symbols = grammar.undefined_symbols()
-    for sym, prod in undefined_symbols:
-        errorlog.error('%s:%d: Symbol %r used, but not defined as a token or a rule', prod.file, prod.line, sym)
-        errors = True
-
-    unused_terminals = grammar.unused_terminals()
-    if unused_terminals:
-        debuglog.info('')
-        debuglog.info('Unused terminals:')
-        debuglog.info('')
-        for term in unused_terminals:
-            errorlog.warning('Token %r defined, but not used', term)
-            debuglog.info('    %s', term)
-
-    # Print out all productions to the debug log
-    if debug:
-        debuglog.info('')
-        debuglog.info('Grammar')
-        debuglog.info('')
-        for n, p in enumerate(grammar.Productions):
-            debuglog.info('Rule %-5d %s', n, p)
-
-    # Find unused non-terminals
-    unused_rules = grammar.unused_rules()
-    for prod in unused_rules:
-        errorlog.warning('%s:%d: Rule %r defined, but not used', prod.file, prod.line, prod.name)
-
-    if len(unused_terminals) == 1:
-        errorlog.warning('There is 1 unused token')
-    if len(unused_terminals) > 1:
-        errorlog.warning('There are %d unused tokens', len(unused_terminals))
-
-    if len(unused_rules) == 1:
-        errorlog.warning('There is 1 unused rule')
-    if len(unused_rules) > 1:
-        errorlog.warning('There are %d unused rules', len(unused_rules))
-
-    if debug:
-        debuglog.info('')
-        debuglog.info('Terminals, with rules where they appear')
-        debuglog.info('')
-        terms = list(grammar.Terminals)
-        terms.sort()
-        for term in terms:
-            debuglog.info('%-20s : %s', term, ' '.join([str(s) for s in grammar.Terminals[term]]))
-
-        debuglog.info('')
-        debuglog.info('Nonterminals, with rules where they appear')
-        debuglog.info('')
-        nonterms = list(grammar.Nonterminals)
-        nonterms.sort()
-        for nonterm in nonterms:
-            debuglog.info('%-20s : %s', nonterm, ' '.join([str(s) for s in grammar.Nonterminals[nonterm]]))
-        debuglog.info('')
-
-    if check_recursion:
-        unreachable = grammar.find_unreachable()
-        for u in unreachable:
-            errorlog.warning('Symbol %r is unreachable', u)
-
-        infinite = grammar.infinite_cycles()
-        for inf in infinite:
-            errorlog.error('Infinite recursion detected for symbol %r', inf)
-            errors = True
-
-    unused_prec = grammar.unused_precedence()
-    for term, assoc in unused_prec:
-        errorlog.error('Precedence rule %r defined for unknown symbol %r', assoc, term)
-        errors = True
-
-    if errors:
-        raise YaccError('Unable to build parser')
+    if validate:
+        _check_grammar(grammar, errorlog, debuglog, debug, check_recursion)
 
     # Run the LRTable on the grammar
     lr = LRTable(grammar, debuglog)
@@ -2478,7 +2751,7 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
 
     # Build the parser
     lr.bind_callables(pinfo.pdict)
-    parser = LRParser(lr, pinfo.error_func)
+    parser = LRParser(lr, pinfo.error_func, optimize)
 
     parse = parser.parse
     return parser
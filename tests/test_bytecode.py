@@ -0,0 +1,82 @@
+import unittest
+
+from evaluator.bytecode import compile_bytecode
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestBytecodeEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+        self.parser = PolynomialParser.build()
+
+    def assertSameResult(self, text, **kwargs):
+        program = compile_bytecode(self.tree_parser.parse(text))
+        self.parser.ids.update(kwargs)
+        self.assertEqual(program.evaluate(**kwargs), self.parser.parse(text))
+
+    def test_polynomial(self):
+        self.assertSameResult('3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3',
+                              x=2, y=1, z=0.5)
+
+    def test_operator_precedence(self):
+        self.assertSameResult('10 - 3 - 2 * 4 / 8 ** 2 ** 0.5 + -x', x=3)
+
+    def test_functions(self):
+        self.assertSameResult('sin(x) + |cos(x) - 2| * sqrt(ln(x + 1))', x=2)
+
+    def test_assignment(self):
+        program = compile_bytecode(self.tree_parser.parse('(y = x + 1) * y'))
+        self.assertEqual(program.variables, ('x',))
+        self.assertEqual(program.slots, ('x', 'y'))
+        self.assertEqual(program.evaluate(x=2), 9)
+
+    def test_statements(self):
+        trees = self.tree_parser.parse_document('y = x + 1; z = y * 2; y + z')
+        program = compile_bytecode(trees)
+        self.assertEqual(program.variables, ('x',))
+        self.assertEqual(program.stack_size, 2)
+        self.assertEqual(program.evaluate(x=2), 9)
+
+    def test_long_sum(self):
+        text = ' + '.join(f'{i}*x**{i % 7}*y' for i in range(3000))
+        self.assertSameResult(text, x=0.5, y=2)
+
+    def test_missing_variable(self):
+        program = compile_bytecode(self.tree_parser.parse('x + y'))
+        self.assertRaises(KeyError, program.evaluate, x=1)
+
+    def test_division_by_zero(self):
+        program = compile_bytecode(self.tree_parser.parse('1 / x'))
+        self.assertRaises(ZeroDivisionError, program.evaluate, x=0)
+
+    def test_evaluate_many(self):
+        program = compile_bytecode(self.tree_parser.parse('x**2 + y'))
+        self.assertEqual(program.evaluate_many(x=[1, 2, 3], y=1), [2, 5, 10])
+        self.assertEqual(program.evaluate_many(x=2, y=1), [5])
+
+    def test_constant_expression(self):
+        program = compile_bytecode(self.tree_parser.parse('2 ** 10'))
+        self.assertEqual(program.evaluate_many(), [1024])
+
+class TestBytecodeLayout(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+
+    def test_constant_pool(self):
+        program = compile_bytecode(self.tree_parser.parse('x*2 + x*2.0 + 2'))
+        self.assertEqual(program.constants, (2, 2.0))
+        self.assertEqual([type(value) for value in program.constants],
+                         [int, float])
+
+    def test_disassemble(self):
+        program = compile_bytecode(self.tree_parser.parse('-|x| * 3'))
+        self.assertEqual(program.disassemble(),
+                         [('LOAD_VARIABLE', 'x'), ('ABSOLUTE', None),
+                          ('LOAD_CONSTANT', 3), ('MULTIPLY', None),
+                          ('NEGATE', None)])
+
+    def test_compact_code(self):
+        program = compile_bytecode(self.tree_parser.parse('x**2 + 3*x + 1'))
+        self.assertEqual(len(program.code), 9)
+        self.assertEqual(program.nbytes, 9 * program.code.itemsize)
+        self.assertEqual(program.stack_size, 3)
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from evaluator.corpus import CorpusIndex, analyze
+
+class TestCorpusIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = CorpusIndex()
+        self.counts = self.index.ingest([
+            'x*(y + 1)', 'x*y + x', '  ', 'x**5', '1 +', '(x - 1)**2',
+            'x**2 - 2*x + 1', 'z + x - x', 'sin(x)', '1 / x', '3',
+        ])
+
+    def tearDown(self):
+        self.index.close()
+
+    def test_counts(self):
+        self.assertEqual(self.counts, (6, 2, 2))
+        self.assertEqual(len(self.index), 6)
+
+    def test_membership(self):
+        self.assertIn('x + x*y', self.index)
+        self.assertIn('z', self.index)
+        self.assertNotIn('x*y', self.index)
+        self.assertNotIn('1 +', self.index)
+        self.assertEqual(self.index.find('(1 - x)**2'), '(x - 1)**2')
+        self.assertIsNone(self.index.find('x**4'))
+
+    def test_occurrences(self):
+        self.assertEqual(self.index.occurrences('x*y + x'), 2)
+        self.assertEqual(self.index.occurrences('x**4'), 0)
+
+    def test_add(self):
+        self.assertTrue(self.index.add('x**4'))
+        self.assertFalse(self.index.add('x*x*x*x'))
+        self.assertRaises(ValueError, self.index.add, 'x +')
+
+    def test_decimal_coefficients(self):
+        self.assertTrue(self.index.add('3.58*x**5 + 0.5*y'))
+        self.assertFalse(self.index.add('y/2 + 3.58*x**5'))
+        self.assertTrue(self.index.add('3.59*x**5 + 0.5*y'))
+        self.assertEqual(self.index.find('0.5*y + x**5*3.58'),
+                         '3.58*x**5 + 0.5*y')
+        self.assertEqual(self.index.query(['x', 'y'], max_degree=5)[-2:],
+                         ['3.58*x**5 + 0.5*y', '3.59*x**5 + 0.5*y'])
+
+    def test_high_degree(self):
+        self.assertTrue(self.index.add('(x + 1)**2000 - x**2000'))
+        self.assertEqual(len(self.index.query(max_degree=1998)), 5)
+        self.assertEqual(self.index.query(max_degree=1999)[-1],
+                         '(x + 1)**2000 - x**2000')
+
+    def test_queries(self):
+        self.assertEqual(self.index.query(['x', 'y'], max_degree=4),
+                         ['x*(y + 1)', '(x - 1)**2', '3'])
+        self.assertEqual(self.index.query(['x']),
+                         ['x**5', '(x - 1)**2', '1 / x', '3'])
+        self.assertEqual(self.index.query(max_degree=0), ['3'])
+        self.assertEqual(self.index.query(['z'], max_degree=1), ['z + x - x',
+                                                                 '3'])
+        self.assertEqual(len(self.index.query()), 6)
+
+class TestCorpusFiles(unittest.TestCase):
+    def test_persistence_and_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = os.path.join(directory, 'corpus.txt')
+            path = os.path.join(directory, 'index.db')
+
+            with open(corpus, 'w', encoding='utf-8') as file:
+                file.write('\n'.join(f'(x + {i % 7})**2 * y'
+                                     for i in range(100)))
+
+            with CorpusIndex(path) as index:
+                self.assertEqual(index.ingest_file(corpus, workers=2,
+                                                   chunk_size=16), (7, 93, 0))
+
+            with CorpusIndex(path) as index:
+                self.assertIn('y*(x + 3)**2', index)
+                self.assertEqual(index.query(['x', 'y'], max_degree=3),
+                                 [f'(x + {i})**2 * y' for i in range(7)])
+
+    def test_analyze(self):
+        text, key, variables, degree = analyze('x*y - y*x + z**3')
+        self.assertEqual((text, variables, degree),
+                         ('x*y - y*x + z**3', ('z',), 3))
+        self.assertEqual(int(key, 16), int(analyze('z**3')[1], 16))
@@ -0,0 +1,58 @@
+import math
+import unittest
+
+from evaluator.compiler import compile_tree
+from evaluator.derivative import differentiate
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestSymbolicDerivatives(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def derivative(self, text, variable='x'):
+        return differentiate(self.parser.parse(text), variable)
+
+    def test_constant(self):
+        self.assertEqual(self.derivative('3 + y').to_text(), '0')
+
+    def test_polynomial(self):
+        self.assertEqual(self.derivative('x**3 + 2*x').to_text(),
+                         '3 * x ** 2 + 2')
+
+    def test_product_rule(self):
+        self.assertEqual(self.derivative('sin(x)*x').to_text(),
+                         'cos(x) * x + sin(x)')
+
+    def test_partial_derivative(self):
+        self.assertEqual(self.derivative('x**2*y + y**3', 'y').to_text(),
+                         'x ** 2 + 3 * y ** 2')
+
+class TestNumericalAgreement(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def assertMatchesDifference(self, text, x):
+        tree = self.parser.parse(text)
+        f = compile_tree(tree)
+        df = compile_tree(differentiate(tree, 'x'))
+        h = 1e-6
+        estimate = (f.evaluate(x=x + h) - f.evaluate(x=x - h)) / (2 * h)
+        self.assertTrue(math.isclose(df.evaluate(x=x), estimate,
+                                     rel_tol=1e-6))
+
+    def test_quotient(self):
+        self.assertMatchesDifference('(x**2 + 1) / (x - 3)', 1.5)
+
+    def test_variable_exponent(self):
+        self.assertMatchesDifference('x ** x', 1.7)
+
+    def test_trigonometric_functions(self):
+        self.assertMatchesDifference('tan(x) + asin(x / 2) + acos(x / 3) + \
+atan(x)', 0.4)
+
+    def test_exponential_and_logarithms(self):
+        self.assertMatchesDifference('exp(x) * ln(x) + log2(x) + log10(x)',
+                                     2.5)
+
+    def test_square_root_and_absolute_value(self):
+        self.assertMatchesDifference('sqrt(x**2 + 1) + |x - 4|', 1.2)
@@ -0,0 +1,50 @@
+import unittest
+
+from lexer.diagnostics import Diagnostic
+from lexer.polynomial_lexer import PolynomialLexer
+
+class TestDiagnostic(unittest.TestCase):
+    def test_text(self):
+        self.assertEqual(str(Diagnostic("Syntax error at ')'", 4, ')')),
+                         "Syntax error at ')' (position 4)")
+        self.assertEqual(str(Diagnostic('Division by zero')),
+                         'Division by zero')
+
+    def test_moved(self):
+        diagnostic = Diagnostic("Illegal character '$'", 2, '$')
+        self.assertEqual(diagnostic.moved(10),
+                         Diagnostic("Illegal character '$'", 12, '$'))
+        self.assertEqual(diagnostic.position, 2)
+
+        unknown = Diagnostic('Syntax error at end of input')
+        self.assertIs(unknown.moved(10), unknown)
+
+    def test_lexer_collects_errors(self):
+        for scanner in (False, True):
+            with self.subTest(scanner=scanner):
+                lexer = PolynomialLexer.build(scanner=scanner)
+                lexer.tokenize('x # y $')
+                self.assertEqual(lexer.diagnostics, [
+                    Diagnostic("Illegal character '#'", 2, '#'),
+                    Diagnostic("Illegal character '$'", 6, '$'),
+                ])
+
+    def test_lexer_clears_errors(self):
+        for scanner in (False, True):
+            with self.subTest(scanner=scanner):
+                lexer = PolynomialLexer.build(scanner=scanner)
+                lexer.tokenize('x $')
+                lexer.tokenize('x + 1')
+                self.assertEqual(lexer.diagnostics, [])
+
+                lexer.tokenize('#')
+                list(lexer.stream('y $ 2'))
+                self.assertEqual(lexer.diagnostics, [
+                    Diagnostic("Illegal character '$'", 2, '$'),
+                ])
+
+                lexer.stream('x + 1')
+                self.assertEqual(lexer.diagnostics, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+
+from evaluator.equivalence import (FIELD_PRIME, HASH_POINTS, canonical_form,
+                                   canonical_hash, degree_bound, equivalent,
+                                   essential_variables, evaluate_points,
+                                   total_degree)
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestDegreeBound(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def assertBound(self, text, expected):
+        self.assertEqual(degree_bound(self.parser.parse(text)), expected)
+
+    def test_polynomials(self):
+        self.assertBound('3', (0, 0))
+        self.assertBound('(x + y)**3 - x*y', (3, 0))
+        self.assertBound('(a = x*y) * a', (4, 0))
+
+    def test_rational_functions(self):
+        self.assertBound('x**2 / (x*y + 1)', (2, 2))
+        self.assertBound('1 / x + 1 / y', (1, 2))
+        self.assertBound('x**-3', (0, 3))
+
+    def test_unsupported_expressions(self):
+        for text in ('|x|', 'sin(x)', 'x ** y', 'x ** 0.5'):
+            self.assertRaises(ValueError, degree_bound, self.parser.parse(text))
+
+class TestModularPoints(unittest.TestCase):
+    def test_evaluate_points(self):
+        tree = PolynomialTreeParser.build().parse('x**2 / 2 - y')
+        self.assertEqual(evaluate_points(tree, {'x': [4, 2], 'y': [1, 1]}, 2,
+                                         7), [0, 1])
+
+    def test_constant(self):
+        tree = PolynomialTreeParser.build().parse('2 + 3')
+        self.assertEqual(evaluate_points(tree, {}, 3), [5, 5, 5])
+
+    def test_vanishing_denominator(self):
+        tree = PolynomialTreeParser.build().parse('1 / (x - 1)')
+        self.assertRaises(ZeroDivisionError, evaluate_points, tree,
+                          {'x': [1]}, 1)
+
+class TestEquivalence(unittest.TestCase):
+    def test_equivalent(self):
+        self.assertTrue(equivalent('(x + y)**2', 'x**2 + 2*x*y + y**2'))
+        self.assertTrue(equivalent('(x + 1) / (x**2 - 1)', '1 / (x - 1)'))
+        self.assertTrue(equivalent('x - x + y', 'y'))
+        self.assertTrue(equivalent('2', '1 + 1'))
+        self.assertTrue(equivalent('(a = x) * a', 'x**2'))
+        self.assertTrue(equivalent('x / 3', '(1 / 3) * x'))
+
+    def test_not_equivalent(self):
+        self.assertFalse(equivalent('x**2', 'x**3'))
+        self.assertFalse(equivalent('(x + y)**2', 'x**2 + y**2'))
+        self.assertFalse(equivalent('x', 'y'))
+        self.assertFalse(equivalent('1', '2'))
+
+    def test_trees(self):
+        parser = PolynomialTreeParser.build()
+        self.assertTrue(equivalent(parser.parse('x*(x - 1)'), 'x**2 - x'))
+
+    def test_error_bound(self):
+        self.assertTrue(equivalent('(x - 1)**50', '(1 - x)**50', error=1e-100))
+
+    def test_invalid_expressions(self):
+        self.assertRaises(ValueError, equivalent, 'x +', 'x')
+        self.assertRaises(ValueError, equivalent, '', 'x')
+        self.assertRaises(ValueError, equivalent, 'y = x; y', 'x')
+        self.assertRaises(ValueError, equivalent, 'sin(x)', 'x')
+        # Trees of inexact parsers hold floats, which have no residue.
+        tree = PolynomialTreeParser.build().parse('0.5')
+        self.assertRaises(ValueError, equivalent, tree, '1 / 2')
+
+    def test_decimal_coefficients(self):
+        self.assertTrue(equivalent('0.5', '1 / 2'))
+        self.assertTrue(equivalent('0.5*x', 'x/2'))
+        self.assertTrue(equivalent('1.25*(x + 0.2)', '1.25*x + 0.25'))
+        self.assertFalse(equivalent('0.1*x', 'x/9'))
+
+    def test_vanishing_denominator(self):
+        self.assertRaises(ZeroDivisionError, equivalent, '1 / (x - x)', '1')
+
+class TestCanonicalHash(unittest.TestCase):
+    def test_equivalent_expressions(self):
+        self.assertEqual(canonical_hash('(x - 1) * (x + 1)'),
+                         canonical_hash('x**2 - 1'))
+        self.assertEqual(canonical_hash('y + x - x'), canonical_hash('y'))
+        self.assertEqual(canonical_hash('x / 2'), canonical_hash('x * 2**-1'))
+
+    def test_different_expressions(self):
+        hashes = {canonical_hash(text) for text in
+                  ('x', 'y', 'x + 1', 'x*y', 'x**2', '1', '0', '1 / x')}
+        self.assertEqual(len(hashes), 8)
+
+    def test_decimal_coefficients(self):
+        text = '3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3'
+        self.assertEqual(canonical_hash(text),
+                         canonical_hash('(358*x**5 + 628*x**2*y*z) / 100 + \
+x*y*z**3 + 3'))
+        self.assertNotEqual(canonical_hash(text),
+                            canonical_hash(text.replace('3.58', '3.59')))
+
+    def test_range(self):
+        value = canonical_hash('(x + y)**7 - 3')
+        self.assertTrue(0 <= value < FIELD_PRIME**HASH_POINTS)
+
+    def test_dictionary_key(self):
+        index = {canonical_hash('x*(y + 1)'): 'first'}
+        self.assertEqual(index[canonical_hash('x*y + x')], 'first')
+
+class TestCanonicalForm(unittest.TestCase):
+    def test_essential_variables(self):
+        self.assertEqual(essential_variables('x*y - y*x + z'), ('z',))
+        self.assertEqual(essential_variables('(a = x) * y'), ('x', 'y'))
+        self.assertEqual(essential_variables('1 / (x - 1)'), ('x',))
+        self.assertEqual(essential_variables('3'), ())
+        self.assertEqual(essential_variables('z*y + x'), ('x', 'y', 'z'))
+
+    def test_total_degree(self):
+        self.assertEqual(total_degree('(x + y)**2 - x**2 - y**2'), 2)
+        self.assertEqual(total_degree('(x + 1)**5 - x**5'), 4)
+        self.assertEqual(total_degree('x / 2 + 1'), 1)
+        self.assertEqual(total_degree('7'), 0)
+        self.assertEqual(total_degree('x - x'), -1)
+        self.assertIsNone(total_degree('x**2 / x'))
+
+    def test_canonical_form(self):
+        self.assertEqual(canonical_form('x**2 + 0.25')[1:], (('x',), 2))
+
+        for text in ('(x + y)**3 - x*y', '1 / (x - 1) + y', '2', 'x - x'):
+            self.assertEqual(canonical_form(text), (canonical_hash(text),
+                                                    essential_variables(text),
+                                                    total_degree(text)))
@@ -0,0 +1,83 @@
+import unittest
+from fractions import Fraction
+
+from evaluator.compiler import compile_polynomial, compile_tree
+from evaluator.exact import (common_denominator, exact_divide, exact_power,
+                             normalize)
+from evaluator.polynomial import Polynomial
+from lexer.polynomial_lexer import PolynomialLexer
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestExactOperations(unittest.TestCase):
+    def test_divide(self):
+        self.assertEqual(exact_divide(1, 3), Fraction(1, 3))
+        self.assertIsInstance(exact_divide(6, 3), int)
+        self.assertIsInstance(exact_divide(1.0, 3), float)
+
+    def test_power(self):
+        self.assertEqual(exact_power(2, -2), Fraction(1, 4))
+        self.assertEqual(exact_power(Fraction(2, 3), 2), Fraction(4, 9))
+        self.assertIsInstance(exact_power(4, 0.5), float)
+
+    def test_normalize(self):
+        self.assertIsInstance(normalize(Fraction(4, 2)), int)
+
+    def test_common_denominator(self):
+        values = [Fraction(1, 4), 3, Fraction(5, 6)]
+        self.assertEqual(common_denominator(values), 12)
+
+class TestExactParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialParser.build(exact=True)
+
+    def test_decimal_literals(self):
+        lexer = PolynomialLexer.build(exact=True)
+        (token,) = lexer.tokenize('0.1')
+        self.assertEqual(token.value, Fraction(1, 10))
+
+    def test_no_rounding(self):
+        self.assertEqual(self.parser.parse('0.1 + 0.2'), Fraction(3, 10))
+
+    def test_integer_results(self):
+        result = self.parser.parse('6 / 3 + 2 ** 3')
+        self.assertEqual(result, 10)
+        self.assertIsInstance(result, int)
+
+    def test_float_variables(self):
+        self.parser.ids['x'] = 0.5
+        self.assertIsInstance(self.parser.parse('x / 3'), float)
+
+    def test_functions_are_inexact(self):
+        self.assertIsInstance(self.parser.parse('sqrt(4)'), float)
+
+    def test_default_mode(self):
+        self.assertIsInstance(PolynomialParser.build().parse('1 / 3'), float)
+
+class TestExactCompilation(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build(exact=True)
+        self.parser = PolynomialParser.build(exact=True)
+
+    def test_agrees_with_parser(self):
+        text = '0.1*x**3 - x/3 + 2**-3 + y/x/7'
+        compiled = compile_tree(self.tree_parser.parse(text), exact=True)
+
+        for x, y in ((3, 1), (-2, 5), (Fraction(1, 2), 7)):
+            self.parser.ids.update(x=x, y=y)
+            self.assertEqual(compiled.evaluate(x=x, y=y),
+                             self.parser.parse(text))
+
+    def test_long_division_chain(self):
+        text = '1' + ' / x' * 200
+        compiled = compile_tree(self.tree_parser.parse(text), exact=True)
+        self.assertEqual(compiled.evaluate(x=2), Fraction(1, 2**200))
+
+    def test_common_denominator_polynomial(self):
+        tree = self.tree_parser.parse('(x + 1)**3 / 3 + 0.25*y*x - 2**-1')
+        polynomial = Polynomial.from_tree(tree, exact=True)
+        compiled = compile_polynomial(polynomial, exact=True)
+
+        self.assertIn('_divide(', compiled.source)
+        self.assertEqual(compiled.evaluate_many(x=[0, 2, Fraction(1, 3)], y=4),
+                         [Fraction(-1, 6), Fraction(21, 2), Fraction(101, 162)])
@@ -0,0 +1,177 @@
+import unittest
+
+from evaluator.cache import ExpressionCache, expression_cache, normalize
+from interpreter.polynomial_interpreter import PolynomialInterpreter
+from lexer.diagnostics import Diagnostic
+
+class TestNormalize(unittest.TestCase):
+    def test_operator_spaces(self):
+        self.assertEqual(normalize('  x ** 2 +\t3 * y '), 'x**2+3*y')
+
+    def test_token_boundaries(self):
+        self.assertEqual(normalize('2 * * 3'), '2* *3')
+        self.assertEqual(normalize('a   b'), 'a b')
+
+    def test_separators(self):
+        self.assertEqual(normalize(' a \n - b '), 'a\n-b')
+        self.assertEqual(normalize('x\r+1'), 'x\r+1')
+
+class TestExpressionCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = ExpressionCache()
+        program = cache.get('x + 1')
+
+        self.assertIs(cache.get(' x+1 '), program)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIn('x +1', cache)
+
+    def test_entry_limit(self):
+        cache = ExpressionCache(max_entries=2)
+        cache.get('x')
+        cache.get('y')
+        cache.get('x')
+        cache.get('z')
+
+        self.assertIn('x', cache)
+        self.assertNotIn('y', cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_byte_limit(self):
+        cache = ExpressionCache()
+        cache.get('x + 1')
+        size = cache.nbytes
+        cache.resize(max_bytes=size)
+        cache.get('x + 2')
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, size)
+
+    def test_syntax_error_not_cached(self):
+        cache = ExpressionCache()
+        self.assertIsNone(cache.get('x +'))
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled(self):
+        cache = ExpressionCache(enabled=False)
+        self.assertIsNone(cache.get('x + 1'))
+        self.assertEqual(cache.evaluate('x + 1', {'x': 1}, lambda _: 'parsed'),
+                         'parsed')
+
+    def test_evaluate_assignment(self):
+        cache = ExpressionCache()
+        ids = {'x': 2}
+
+        self.assertEqual(cache.evaluate('y = x * 3', ids, None), 6)
+        self.assertEqual(ids, {'x': 2, 'y': 6})
+
+    def test_statements(self):
+        cache = ExpressionCache()
+        ids = {'a': 5}
+
+        self.assertEqual(cache.evaluate('a = 2; a + 1', ids, None), 3)
+        self.assertEqual(ids, {'a': 2})
+        self.assertEqual(cache.get('a = 2; a + 1').variables, ())
+
+    def test_newlines(self):
+        cache = ExpressionCache()
+        ids = {'a': 5, 'b': 1}
+
+        self.assertEqual(cache.evaluate('a-b', ids, None), 4)
+        self.assertEqual(cache.evaluate('a\n-b', ids, None), -1)
+        self.assertEqual(len(cache), 2)
+
+    def test_evaluate_unbound(self):
+        cache = ExpressionCache()
+        self.assertEqual(cache.evaluate('x + 1', {}, lambda _: 'parsed'),
+                         'parsed')
+
+class TestCachedInterpreter(unittest.TestCase):
+    def test_repeated_expression(self):
+        text = '3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3'
+        first = PolynomialInterpreter(text)
+        self.assertEqual(first.evaulate(x=2, y=1, z=0.5), 130.37)
+
+        hits = expression_cache.hits
+        second = PolynomialInterpreter(text)
+        self.assertEqual(second.evaulate(x=2, y=1, z=0.5), 130.37)
+        self.assertEqual(expression_cache.hits, hits + 1)
+        self.assertIsNone(second._parser)
+
+    def test_statements(self):
+        for use_cache in (True, False):
+            with self.subTest(use_cache=use_cache):
+                interpreter = PolynomialInterpreter('a = 2; a + 1',
+                                                    use_cache=use_cache)
+                self.assertEqual(interpreter.evaulate(a=5), 3)
+
+    def test_opt_out(self):
+        interpreter = PolynomialInterpreter('x * 2', use_cache=False)
+        self.assertEqual(interpreter.evaulate(x=4), 8)
+        self.assertIsNotNone(interpreter._parser)
+
+    def test_division_by_zero(self):
+        interpreter = PolynomialInterpreter('1 / x')
+        self.assertIsNone(interpreter.evaulate(x=0))
+        self.assertEqual(interpreter.diagnostics,
+                         [Diagnostic('Division by zero')])
+        self.assertEqual(interpreter.evaulate(x=2), 0.5)
+        self.assertEqual(interpreter.diagnostics, [])
+
+    def test_syntax_errors(self):
+        expected = [Diagnostic("Illegal character '$'", 2, '$'),
+                    Diagnostic('Syntax error at end of input')]
+
+        for use_cache in (True, False):
+            with self.subTest(use_cache=use_cache):
+                interpreter = PolynomialInterpreter('x $ * 1 +',
+                                                    use_cache=use_cache)
+                self.assertIsNone(interpreter.evaulate(x=1))
+                self.assertEqual(interpreter.diagnostics, expected)
+
+        self.assertEqual(expression_cache.diagnose('x $ * 1 +'), expected)
+        self.assertEqual(expression_cache.diagnose('x * 1'), [])
+
+class TestMemoizedInterpreter(unittest.TestCase):
+    def test_repeated_bindings(self):
+        interpreter = PolynomialInterpreter('x**2 + y', memoize=8)
+
+        self.assertEqual(interpreter.evaulate(x=3, y=1), 10)
+        self.assertEqual(interpreter.evaulate(x=3, y=1), 10)
+        self.assertEqual((interpreter.memo_hits, interpreter.memo_misses),
+                         (1, 1))
+
+    def test_value_types(self):
+        interpreter = PolynomialInterpreter('x * 2', memoize=8)
+
+        self.assertIsInstance(interpreter.evaulate(x=1), int)
+        self.assertIsInstance(interpreter.evaulate(x=1.0), float)
+
+    def test_unreferenced_bindings(self):
+        interpreter = PolynomialInterpreter('x + 1', memoize=8)
+        interpreter.evaulate(x=1, y=2)
+        interpreter.evaulate(y=3)
+
+        self.assertEqual(interpreter.memo_hits, 1)
+
+    def test_eviction(self):
+        interpreter = PolynomialInterpreter('x + 1', memoize=2)
+
+        for x in (1, 2, 3, 1):
+            interpreter.evaulate(x=x)
+
+        self.assertEqual(interpreter.memo_hits, 0)
+        self.assertEqual(len(interpreter._results), 2)
+
+    def test_assignment_not_memoized(self):
+        interpreter = PolynomialInterpreter('y = x * 2', memoize=8)
+
+        self.assertEqual(interpreter.evaulate(x=1), 2)
+        interpreter.ids['y'] = 0
+        self.assertEqual(interpreter.evaulate(x=1), 2)
+        self.assertEqual(interpreter.ids['y'], 2)
+
+    def test_errors_not_memoized(self):
+        interpreter = PolynomialInterpreter('1 / x', memoize=8)
+
+        self.assertIsNone(interpreter.evaulate(x=0))
+        self.assertEqual(len(interpreter._results), 0)
@@ -0,0 +1,171 @@
+import unittest
+
+from evaluator.compiler import (addition_chain, compile_polynomial,
+                                compile_tree, free_variables)
+from evaluator.nodes import BinaryOperation, Number, Variable
+from evaluator.polynomial import Polynomial
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestCompiledEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+        self.parser = PolynomialParser.build()
+
+    def assertSameResult(self, text, **kwargs):
+        compiled = compile_tree(self.tree_parser.parse(text))
+        self.parser.ids.update(kwargs)
+        self.assertEqual(compiled.evaluate(**kwargs), self.parser.parse(text))
+
+    def test_polynomial(self):
+        self.assertSameResult('3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3',
+                              x=2, y=1, z=0.5)
+
+    def test_operator_precedence(self):
+        self.assertSameResult('10 - 3 - 2 * 4 / 8 ** 2 ** 0.5 + -x', x=3)
+
+    def test_functions(self):
+        self.assertSameResult('sin(x) + |cos(x) - 2| * sqrt(ln(x + 1))', x=2)
+
+    def test_shared_subexpressions(self):
+        self.assertSameResult('(x*x + 1) * (x*x + 1) + sin(x*x + 1)', x=3)
+
+    def test_assignment(self):
+        compiled = compile_tree(self.tree_parser.parse('(y = x + 1) * y'))
+        self.assertEqual(compiled.variables, ('x',))
+        self.assertEqual(compiled.evaluate(x=2), 9)
+
+    def test_long_sum(self):
+        text = ' + '.join(f'{i}*x**{i % 7}*y' for i in range(20000))
+        self.assertSameResult(text, x=0.5, y=2)
+
+    def test_huge_integers(self):
+        tree = self.tree_parser.parse('x*' + '9' * 400)
+        self.assertEqual(compile_tree(tree).evaluate(x=2), 2 * int('9' * 400))
+        self.assertEqual(compile_tree(tree, exact=True).evaluate(x=-1),
+                         -int('9' * 400))
+
+        tree = BinaryOperation('-', Variable('x'), Number(10**5000))
+        self.assertEqual(compile_tree(tree).evaluate(x=10**5000), 0)
+
+    def test_division_by_zero(self):
+        compiled = compile_tree(self.tree_parser.parse('1 / x'))
+        self.assertRaises(ZeroDivisionError, compiled.evaluate, x=0)
+
+    def test_missing_variable(self):
+        compiled = compile_tree(self.tree_parser.parse('x + y'))
+        self.assertRaises(KeyError, compiled.evaluate, x=1)
+
+class TestPowerLowering(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+        self.parser = PolynomialParser.build()
+
+    def test_addition_chains(self):
+        for exponent in range(1, 257):
+            chain = addition_chain(exponent)
+
+            self.assertEqual((chain[0], chain[-1]), (1, exponent))
+
+            for index in range(1, len(chain)):
+                self.assertIn(chain[index] - chain[index - 1], chain[:index])
+
+        self.assertEqual(len(addition_chain(13)), 6)
+        self.assertEqual(len(addition_chain(64)), 7)
+
+    def test_exact_powers(self):
+        text = 'x**13 + x**5*y**2 - (x + 1)**7 * (x + 1)**3 + x**256'
+        compiled = compile_tree(self.tree_parser.parse(text))
+
+        self.assertNotIn('**', compiled.source)
+
+        for x, y in ((2, 3), (-3, 1), (0, 5)):
+            self.parser.ids.update(x=x, y=y)
+            self.assertEqual(compiled.evaluate(x=x, y=y),
+                             self.parser.parse(text))
+
+    def test_shared_intermediate_powers(self):
+        compiled = compile_tree(self.tree_parser.parse('x**13 + x**10 + x**5'))
+        function = compiled.source.split('\n\n')[0]
+
+        self.assertEqual(function.count('*'), 5)
+
+    def test_other_exponents(self):
+        compiled = compile_tree(self.tree_parser.parse('x**2.0 + x**-2 + x**y'))
+
+        self.assertEqual(compiled.source.count('**'), 6)
+        self.assertEqual(compiled.evaluate(x=2, y=3), 12.25)
+
+    def test_assignment_disables_sharing(self):
+        compiled = compile_tree(self.tree_parser.parse('x**3 + (x = 2) + x**3'))
+        self.assertEqual(compiled.evaluate(x=1), 11)
+
+class TestBatchEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+
+    def test_sequences_and_scalars(self):
+        compiled = compile_tree(self.tree_parser.parse('x**2 + y'))
+        self.assertEqual(compiled.evaluate_many(x=[1, 2, 3], y=1), [2, 5, 10])
+
+    def test_constant_expression(self):
+        compiled = compile_tree(self.tree_parser.parse('2 + 3'))
+        self.assertEqual(compiled.evaluate_many(), [5])
+
+    def test_mismatched_lengths(self):
+        compiled = compile_tree(self.tree_parser.parse('x + y'))
+        self.assertRaises(ValueError, compiled.evaluate_many,
+                          x=[1, 2], y=[1, 2, 3])
+
+class TestFreeVariables(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+
+    def test_assigned_before_read(self):
+        tree = self.tree_parser.parse('(y = 2) * y + x')
+        self.assertEqual(free_variables(tree), ('x',))
+
+    def test_read_before_assigned(self):
+        tree = self.tree_parser.parse('y * (y = 2)')
+        self.assertEqual(free_variables(tree), ('y',))
+
+class TestPolynomialCompilation(unittest.TestCase):
+    def setUp(self):
+        self.tree_parser = PolynomialTreeParser.build()
+
+    def compile(self, text):
+        return compile_polynomial(
+            Polynomial.from_tree(self.tree_parser.parse(text)))
+
+    def test_exact_values(self):
+        compiled = self.compile('3*x**13*y**2 - x**7 + 5*y**4 + 2')
+        expected = compile_tree(self.tree_parser.parse(
+            '3*x**13*y**2 - x**7 + 5*y**4 + 2'))
+
+        for x, y in ((2, 3), (-1, 7), (0, 0), (5, -2)):
+            self.assertEqual(compiled.evaluate(x=x, y=y),
+                             expected.evaluate(x=x, y=y))
+
+    def test_shared_powers(self):
+        compiled = self.compile('x**5 + x**4*y + x**2')
+        function = compiled.source.split('\n\n')[0]
+
+        self.assertEqual(function.count(' * _v0\n'), 4)
+        self.assertNotIn('**', compiled.source)
+
+    def test_evaluate_many(self):
+        compiled = self.compile('x**3*y + 1.5')
+        self.assertEqual(compiled.evaluate_many(x=[1, 2, 3], y=2),
+                         [3.5, 17.5, 55.5])
+
+    def test_many_terms(self):
+        terms = {(i % 9, i // 9): i + 1 for i in range(900)}
+        polynomial = Polynomial(('x', 'y'), terms)
+        compiled = compile_polynomial(polynomial)
+
+        self.assertEqual(compiled.evaluate(x=2, y=-1),
+                         compile_tree(polynomial.to_tree()).evaluate(x=2, y=-1))
+
+    def test_zero_polynomial(self):
+        compiled = compile_polynomial(Polynomial(('x',), {}))
+        self.assertEqual(compiled.evaluate(x=3), 0)
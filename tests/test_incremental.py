@@ -0,0 +1,86 @@
+import unittest
+
+from evaluator.compiler import compile_tree
+from evaluator.incremental import IncrementalEvaluator
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestIncrementalEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def test_matches_compiled(self):
+        tree = self.parser.parse('3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3')
+        evaluator = IncrementalEvaluator(tree)
+        compiled = compile_tree(tree)
+        bindings = {'x': 2, 'y': 1, 'z': 0.5}
+
+        self.assertEqual(evaluator.evaluate(**bindings), 130.37)
+
+        for name, value in (('x', 1.5), ('z', -2), ('y', 4), ('x', 0)):
+            bindings[name] = value
+            self.assertEqual(evaluator.update(**{name: value}),
+                             compiled.evaluate(**bindings))
+
+    def test_only_dirty_paths(self):
+        text = ' + '.join(f'{i}*sin(z{i})' for i in range(200)) + ' + x'
+        evaluator = IncrementalEvaluator(self.parser.parse(text))
+        bindings = {f'z{i}': i / 10 for i in range(200)}
+        evaluator.evaluate(x=1, **bindings)
+
+        evaluator.update(z7=3.0)
+        self.assertEqual(evaluator.recomputed, 5)
+
+        evaluator.update(z7=3.0)
+        self.assertEqual(evaluator.recomputed, 0)
+
+    def test_long_chains(self):
+        for operators in ('+', '+-', '*', '*/'):
+            text = ''.join(f'{operators[i % len(operators)]}(x{i} + 1)'
+                           for i in range(1, 100))
+            tree = self.parser.parse('(x0 + 1)' + text)
+            evaluator = IncrementalEvaluator(tree)
+            compiled = compile_tree(tree)
+            bindings = {f'x{i}': i % 5 + 1 for i in range(100)}
+            evaluator.evaluate(**bindings)
+
+            for name, value in (('x0', 3), ('x50', -7), ('x99', 2)):
+                bindings[name] = value
+                self.assertAlmostEqual(evaluator.update(**{name: value}),
+                                       compiled.evaluate(**bindings))
+
+    def test_balanced_chain_updates(self):
+        text = ' + '.join(f'{i}*sin(z{i})' for i in range(4096))
+        evaluator = IncrementalEvaluator(self.parser.parse(text))
+        evaluator.evaluate(**{f'z{i}': i / 10 for i in range(4096)})
+
+        # The reader, sin and product of the term, its block, the 9 merges
+        # above the 511 other blocks, and the root of the chain.
+        evaluator.update(z3000=1.0)
+        self.assertEqual(evaluator.recomputed, 14)
+
+    def test_shared_subexpressions(self):
+        tree = self.parser.parse('sin(x*y) + cos(x*y) * z')
+        evaluator = IncrementalEvaluator(tree)
+        evaluator.evaluate(x=1, y=2, z=3)
+
+        evaluator.update(z=4)
+        self.assertEqual(evaluator.recomputed, 3)
+
+    def test_assignment(self):
+        tree = self.parser.parse('(y = x + 1) * y + y')
+        evaluator = IncrementalEvaluator(tree)
+
+        self.assertEqual(evaluator.evaluate(x=1), 6)
+        self.assertEqual(evaluator.update(x=2), 12)
+
+    def test_missing_variable(self):
+        evaluator = IncrementalEvaluator(self.parser.parse('x + y'))
+        self.assertRaises(KeyError, evaluator.update, x=1)
+
+    def test_failed_update(self):
+        evaluator = IncrementalEvaluator(self.parser.parse('1 / x + y'))
+        evaluator.evaluate(x=1, y=1)
+
+        self.assertRaises(ZeroDivisionError, evaluator.update, x=0)
+        self.assertRaises(RuntimeError, lambda: evaluator.value)
+        self.assertEqual(evaluator.update(x=2), 1.5)
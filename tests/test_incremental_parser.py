@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from parser.incremental_parser import IncrementalParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+ALPHABET = list('xy12.5 +-*/()|=;\n$') + ['sin(', '**', 'ab', '3.25']
+
+class TestIncrementalParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = IncrementalParser()
+        self.full = PolynomialTreeParser.build(scanner=True, pratt=True)
+
+    def assertParsed(self, text):
+        errors = self.full.syntax_errors
+        expected = self.full.parse(text)
+        expected_errors = self.full.syntax_errors - errors
+
+        errors = self.parser.parser.syntax_errors
+        self.assertEqual(self.parser.parse(text), expected)
+        self.assertEqual(self.parser.parser.syntax_errors - errors,
+                         expected_errors)
+        self.assertEqual(self.parser.diagnostics, self.full.diagnostics)
+
+        scanner = self.full.lexer
+        scanner.input(text)
+        self.assertEqual(self.parser._types, scanner.types)
+        self.assertEqual(self.parser._values, scanner.values)
+        self.assertEqual(self.parser._positions, scanner.positions)
+
+    def test_edits(self):
+        for text in ('x + 2', 'x + 2', '3.5x + 2', '3.25 + 2', '3.25 ** 2',
+                     '3.25 * 2', 'sin(3.25 * 2)', 'sin(3.25 * 2) - |y|',
+                     '|y|', '', 'a = 1; b = 2\n a * b', 'a = 1; b = 22\n'):
+            with self.subTest(text=text):
+                self.assertParsed(text)
+
+    def test_random_edits(self):
+        generator = random.Random(0)
+
+        for _ in range(50):
+            text = ''.join(generator.choice(ALPHABET)
+                           for _ in range(generator.randrange(40)))
+
+            for _ in range(20):
+                start = generator.randrange(len(text) + 1)
+                end = min(len(text), start + generator.randrange(4))
+                text = text[:start] + ''.join(
+                    generator.choice(ALPHABET)
+                    for _ in range(generator.randrange(3))) + text[end:]
+
+                with self.subTest(text=text):
+                    self.assertParsed(text)
+
+    def test_reuse(self):
+        text = ' + '.join(f'{i}.5 * (x ** {i} - sin(y / {i + 1}))'
+                          for i in range(200))
+        tree = self.parser.parse(text)
+        self.assertEqual(self.parser.scanned, len(text))
+
+        edited = text.replace('(y / 100)', '(y / 1000)')
+        edited_tree = self.parser.parse(edited)
+        self.assertEqual(edited_tree, self.full.parse(edited))
+        self.assertLess(self.parser.scanned, 10)
+        # Only the edited number and the parenthesis after it are scanned.
+        self.assertEqual(self.parser.reused_tokens,
+                         len(self.parser._types) - 2)
+        # All groups but the sine and the parentheses around the edit.
+        self.assertEqual(self.parser.reused_groups, 398)
+
+        # Unchanged groups are shared with the previous tree.
+        self.assertIs(edited_tree.right.right, tree.right.right)
+
+    def test_illegal_characters(self):
+        self.parser.parse('1 + $x')
+        self.parser.parse('1 + $x + 2 + $y')
+        self.assertEqual([diagnostic.position
+                          for diagnostic in self.parser.diagnostics], [4, 13])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import math
+import unittest
+from fractions import Fraction
+
+from evaluator.compiler import compile_tree
+from evaluator.interpolation import (barycentric_interpolation,
+                                     divided_differences, least_squares_fit,
+                                     monomial_basis, newton_interpolation)
+
+class TestNewtonInterpolation(unittest.TestCase):
+    def test_divided_differences(self):
+        self.assertEqual(divided_differences([0, 1, 2], [1, 3, 9]), [1, 2, 2])
+
+    def test_exact_coefficients(self):
+        polynomial = newton_interpolation([0, 1, 3], [0, 1, 0])
+
+        self.assertEqual(polynomial.coefficients(),
+                         [0, Fraction(3, 2), Fraction(-1, 2)])
+
+    def test_tree_reproduces_samples(self):
+        xs = [-2.0, -0.5, 0.25, 1.0, 3.0]
+        ys = [x**4 - 2*x + 1 for x in xs]
+        compiled = compile_tree(newton_interpolation(xs, ys).to_tree())
+
+        for x, y in zip(xs, ys):
+            self.assertAlmostEqual(compiled.evaluate(x=x), y)
+
+    def test_variable_name(self):
+        polynomial = newton_interpolation([0, 1], [1, 2], variable='t')
+        self.assertEqual(polynomial.to_tree().to_text(), 't + 1')
+
+    def test_repeated_abscissa(self):
+        self.assertRaises(ValueError, newton_interpolation, [1, 1], [2, 3])
+
+    def test_mismatched_samples(self):
+        self.assertRaises(ValueError, newton_interpolation, [1, 2], [2])
+
+class TestBarycentricInterpolation(unittest.TestCase):
+    def test_exact_samples(self):
+        compiled = compile_tree(barycentric_interpolation([0, 1, 2],
+                                                          [1, 3, 9]))
+        self.assertEqual(compiled.evaluate(x=3), 19)
+
+    def test_high_degree(self):
+        xs = [math.cos(math.pi * (i + 0.5) / 400) for i in range(400)]
+        ys = [1 / (1 + 25 * x * x) for x in xs]
+        compiled = compile_tree(barycentric_interpolation(xs, ys))
+
+        self.assertAlmostEqual(compiled.evaluate(x=0.1234),
+                               1 / (1 + 25 * 0.1234**2))
+
+class TestLeastSquaresFit(unittest.TestCase):
+    def test_monomial_basis(self):
+        self.assertEqual(monomial_basis(2, 2),
+                         [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)])
+
+    def test_recovers_polynomial(self):
+        points = [(x, y) for x in range(-2, 3) for y in range(-2, 3)]
+        values = [3*x*x - x*y + 2*y - 1 for x, y in points]
+        polynomial = least_squares_fit(points, values, ('x', 'y'),
+                                       monomial_basis(2, 2))
+        expected = {(2, 0): 3, (1, 1): -1, (0, 1): 2, (0, 0): -1}
+
+        for monomial, coefficient in polynomial.terms.items():
+            self.assertAlmostEqual(coefficient, expected.get(monomial, 0))
+
+    def test_unsorted_variables(self):
+        points = [(y, x) for x in range(-2, 3) for y in range(-2, 3)]
+        values = [3*x*x - x*y + 2*y - 1 for y, x in points]
+        polynomial = least_squares_fit(points, values, ('y', 'x'),
+                                       monomial_basis(2, 2))
+        expected = {(2, 0): 3, (1, 1): -1, (0, 1): 2, (0, 0): -1}
+
+        self.assertEqual(polynomial.variables, ('x', 'y'))
+
+        for monomial, coefficient in polynomial.terms.items():
+            self.assertAlmostEqual(coefficient, expected.get(monomial, 0))
+
+    def test_overdetermined_line(self):
+        points = [(0,), (1,), (2,), (3,)]
+        values = [1.1, 2.9, 5.1, 6.9]
+        polynomial = least_squares_fit(points, values, ('x',),
+                                       monomial_basis(1, 1))
+
+        self.assertAlmostEqual(polynomial.terms[(1,)], 1.96)
+        self.assertAlmostEqual(polynomial.terms[(0,)], 1.06)
+
+    def test_underdetermined_basis(self):
+        points = [(0, 0), (1, 1), (2, 2)]
+        self.assertRaises(ValueError, least_squares_fit, points, [1, 2, 3],
+                          ('x', 'y'), monomial_basis(2, 1))
@@ -0,0 +1,105 @@
+import random
+import unittest
+from fractions import Fraction
+
+from evaluator.compiler import compile_modular, compile_residues, compile_tree
+from evaluator.modular import (modular_inverse, product_tree, reduce_many,
+                               residue)
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+PRIME = 2**61 - 1
+
+class TestModularArithmetic(unittest.TestCase):
+    def test_inverse(self):
+        self.assertEqual(modular_inverse(3, 7), 5)
+        self.assertEqual(3 * modular_inverse(3, PRIME) % PRIME, 1)
+
+    def test_non_invertible(self):
+        self.assertRaises(ZeroDivisionError, modular_inverse, 14, 7)
+
+    def test_residue(self):
+        self.assertEqual(residue(-1, 7), 6)
+        self.assertEqual(residue(Fraction(1, 2), 7), 4)
+        self.assertRaises(ValueError, residue, 0.5, 7)
+
+    def test_product_tree(self):
+        self.assertEqual(product_tree([2, 3, 5]), [[2, 3, 5], [6, 5], [30]])
+        self.assertEqual(product_tree([7]), [[7]])
+
+    def test_reduce_many(self):
+        random.seed(38)
+        moduli = [PRIME - 2 * index for index in range(37)]
+        values = [random.randrange(-10**500, 10**500) for _ in range(5)]
+        values += [0, -1, PRIME]
+        self.assertEqual(reduce_many(values, moduli),
+                         [[value % modulus for value in values]
+                          for modulus in moduli])
+
+class TestModularCompilation(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def assertAgreesWithExact(self, text, modulus, **kwargs):
+        tree = self.parser.parse(text)
+        exact = compile_tree(tree, exact=True).evaluate(**kwargs)
+        self.assertEqual(compile_modular(tree, modulus).evaluate(**kwargs),
+                         residue(exact, modulus))
+
+    def test_polynomial(self):
+        self.assertAgreesWithExact('(x + y)**40 - (x - y)**40 + 3*x*y - 7',
+                                   PRIME, x=123456789, y=-987654321)
+
+    def test_division(self):
+        self.assertAgreesWithExact('(x*y - 3)**5 / (y + 1) - -x*2', PRIME,
+                                   x=12345, y=678)
+
+    def test_negative_exponent(self):
+        self.assertAgreesWithExact('x**-3 + 1', 1000003, x=17)
+
+    def test_assignment(self):
+        self.assertAgreesWithExact('(z = x*x) * z + z', 101, x=55)
+
+    def test_results_are_reduced(self):
+        compiled = compile_modular(self.parser.parse('x'), 7)
+        self.assertEqual(compiled.evaluate_many(x=[-1, 7, 100]), [6, 0, 2])
+
+    def test_rational_literals(self):
+        tree = PolynomialTreeParser.build(exact=True).parse('0.5 * x')
+        self.assertEqual(compile_modular(tree, 7).evaluate(x=3), 5)
+
+    def test_division_by_zero(self):
+        compiled = compile_modular(self.parser.parse('1 / x + x**-2'), 7)
+        self.assertRaises(ZeroDivisionError, compiled.evaluate, x=14)
+
+    def test_unsupported_expressions(self):
+        for text in ('sin(x)', '|x|', 'x ** y', '1.5 * x'):
+            self.assertRaises(ValueError, compile_modular,
+                              self.parser.parse(text), 7)
+
+class TestResidueCompilation(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build(exact=True)
+
+    def assertAgreesWithModular(self, text, moduli, size, **kwargs):
+        tree = self.parser.parse(text)
+        columns = [kwargs[name] for name in sorted(kwargs)]
+        self.assertEqual(
+            compile_residues(tree)(moduli, size, *columns),
+            [compile_modular(tree, modulus).evaluate_many(**kwargs)
+             for modulus in moduli])
+
+    def test_polynomial(self):
+        self.assertAgreesWithModular('(x + y)**40 / 3 - 0.5*x*y + 7',
+                                     [PRIME, 1000003, 101], 3,
+                                     x=[1, -10**40, 55], y=[2, 3, 10**50])
+
+    def test_constant(self):
+        self.assertAgreesWithModular('2 / 3', [5, 7], 1)
+
+    def test_unsupported_expressions(self):
+        for text in ('sin(x)', '|x|', 'x ** y'):
+            self.assertRaises(ValueError, compile_residues,
+                              self.parser.parse(text))
+
+        tree = PolynomialTreeParser.build().parse('1.5 * x')
+        self.assertRaises(ValueError, compile_residues, tree)
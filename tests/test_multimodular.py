@@ -0,0 +1,109 @@
+import math
+import random
+import unittest
+
+from evaluator.compiler import compile_tree
+from evaluator.multimodular import (chinese_remainder, crt_evaluate_many,
+                                    is_prime, magnitude_bound, primes)
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestPrimes(unittest.TestCase):
+    def test_is_prime(self):
+        self.assertEqual([n for n in range(30) if is_prime(n)],
+                         [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+        self.assertTrue(is_prime(2**61 - 1))
+        self.assertFalse(is_prime(3215031751))
+
+    def test_primes(self):
+        moduli = primes(5)
+        self.assertEqual(primes(3), moduli[:3])
+        self.assertEqual(moduli, sorted(moduli, reverse=True))
+        self.assertTrue(all(is_prime(p) and p < 2**62 for p in moduli))
+
+    def test_chinese_remainder(self):
+        self.assertEqual(chinese_remainder([[2, 1], [3, 4]], [5, 7]), [17, 11])
+        self.assertEqual(chinese_remainder([[4], [1]], [5, 7]), [-6])
+
+    def test_many_moduli(self):
+        random.seed(38)
+        moduli = primes(101)
+        values = [random.randrange(-10**1500, 10**1500) for _ in range(10)]
+        residues = [[value % modulus for value in values]
+                    for modulus in moduli]
+        self.assertEqual(chinese_remainder(residues, moduli), values)
+
+class TestMagnitudeBound(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def test_bound(self):
+        tree = self.parser.parse('(x - 3*y)**4 + x*y')
+        bound = magnitude_bound(tree, {'x': 10, 'y': 20})
+        self.assertAlmostEqual(bound, math.log2(70**4 + 200))
+
+    def test_zero(self):
+        self.assertEqual(magnitude_bound(self.parser.parse('0 * x'),
+                                         {'x': 5}), -math.inf)
+
+    def test_assignment(self):
+        tree = self.parser.parse('(a = x**10) * a')
+        self.assertAlmostEqual(magnitude_bound(tree, {'x': 2}), 20)
+
+    def test_unsupported_expressions(self):
+        for text in ('x / 2', 'x ** y', 'x ** -1', '|x|', 'sin(x)', '0.5'):
+            tree = self.parser.parse(text)
+            self.assertRaises(ValueError, magnitude_bound, tree, {'x': 1,
+                                                                  'y': 1})
+
+class TestCRTEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def assertAgreesWithExact(self, text, **kwargs):
+        tree = self.parser.parse(text)
+        self.assertEqual(crt_evaluate_many(tree, **kwargs),
+                         compile_tree(tree, exact=True).evaluate_many(**kwargs))
+
+    def test_huge_values(self):
+        random.seed(38)
+        xs = [random.randrange(-10**12, 10**12) for _ in range(20)]
+        ys = [random.randrange(-10**12, 10**12) for _ in range(20)]
+        self.assertAgreesWithExact('(123456789*x**7 - 987654321*y**5 + x*y)**20 \
+- (x - y)**60', x=xs, y=ys)
+
+    def test_signs(self):
+        self.assertAgreesWithExact('(x - 10**30)**3', x=[0, 10**30, 10**30 + 1])
+
+    def test_scalars(self):
+        self.assertAgreesWithExact('x**2 * y - y', x=[1, -2, 3], y=-7)
+
+    def test_huge_inputs(self):
+        random.seed(38)
+        xs = [random.randrange(-10**300, 10**300) for _ in range(30)]
+        ys = [random.randrange(-10**300, 10**300) for _ in range(30)]
+        self.assertAgreesWithExact('x*y*(x + y) - 3*y**3', x=xs, y=ys)
+
+    def test_small_values(self):
+        self.assertAgreesWithExact('x - x + 5', x=[1, 2])
+
+    def test_zero_values(self):
+        self.assertAgreesWithExact('x*y', x=[0, 0, 0], y=[1, 2, 3])
+        self.assertAgreesWithExact('0 * x', x=[5, 6])
+        self.assertAgreesWithExact('x', x=[0, 0])
+
+    def test_explicit_bound(self):
+        random.seed(38)
+        xs = [random.randrange(-10**40, 10**40) for _ in range(20)]
+        ys = [random.randrange(-10**40, 10**40) for _ in range(20)]
+        tree = self.parser.parse('(x + y)**400 - (x - y)**400 \
+- ((x + y)**2)**200 + ((x - y)**2)**200 + x*y')
+        self.assertEqual(crt_evaluate_many(tree, 300, x=xs, y=ys),
+                         [x * y for x, y in zip(xs, ys)])
+
+    def test_explicit_bound_with_division(self):
+        tree = self.parser.parse('(x**2 - 1) / (x - 1) - x')
+        self.assertEqual(crt_evaluate_many(tree, 1, x=[10**40, -3]), [1, 1])
+
+    def test_bound_is_positional(self):
+        tree = self.parser.parse('bound + 1')
+        self.assertEqual(crt_evaluate_many(tree, bound=[1, -5]), [2, -4])
@@ -0,0 +1,119 @@
+import random
+import unittest
+from fractions import Fraction
+
+from evaluator.interpolation import newton_interpolation
+from evaluator.modular import residue
+from evaluator.multipoint import (evaluate_univariate, horner, multiply,
+                                  subproduct_evaluate)
+from evaluator.polynomial import Polynomial
+
+PRIME = (1 << 61) - 1
+
+class TestHorner(unittest.TestCase):
+    def test_integer_values(self):
+        self.assertEqual(horner([1, 0, 2], [0, 1, 2, 3]), [1, 3, 9, 19])
+
+    def test_modular_values(self):
+        self.assertEqual(horner([1, 0, 2], [0, 1, 2, 3], 7), [1, 3, 2, 5])
+
+    def test_zero_polynomial(self):
+        self.assertEqual(horner([], [1, 2]), [0, 0])
+
+class TestModularMultiplication(unittest.TestCase):
+    def test_kronecker_product_matches_schoolbook(self):
+        random.seed(1)
+        a = [random.randrange(PRIME) for _ in range(100)]
+        b = [random.randrange(PRIME) for _ in range(70)]
+
+        expected = [0] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                expected[i + j] = (expected[i + j] + x * y) % PRIME
+
+        self.assertEqual(multiply(a, b, PRIME), expected)
+
+class TestSubproductTree(unittest.TestCase):
+    def setUp(self):
+        random.seed(2)
+
+    def assertMatchesHorner(self, degree, count, modulus):
+        coefficients = [random.randint(-10**20, 10**20)
+                        for _ in range(degree + 1)]
+        points = [random.randint(-10**20, 10**20) for _ in range(count)]
+
+        self.assertEqual(subproduct_evaluate(coefficients, points, modulus),
+                         horner(coefficients, points, modulus))
+
+    def test_more_points_than_degree(self):
+        self.assertMatchesHorner(300, 1000, PRIME)
+
+    def test_higher_degree_than_points(self):
+        self.assertMatchesHorner(2000, 70, PRIME)
+
+    def test_small_modulus(self):
+        self.assertMatchesHorner(700, 300, 97)
+
+    def test_no_points(self):
+        self.assertEqual(subproduct_evaluate([1, 2], [], PRIME), [])
+
+class TestMethodSelection(unittest.TestCase):
+    def test_automatic_selection_matches_horner(self):
+        random.seed(3)
+        coefficients = [random.randrange(PRIME) for _ in range(600)]
+        points = [random.randrange(PRIME) for _ in range(600)]
+
+        self.assertEqual(evaluate_univariate(coefficients, points, PRIME),
+                         horner(coefficients, points, PRIME))
+
+    def test_rational_coefficients(self):
+        random.seed(4)
+        coefficients = [Fraction(random.randint(-10**6, 10**6),
+                                 random.randint(1, 100)) for _ in range(600)]
+        points = [Fraction(random.randint(-10**6, 10**6), 7)
+                  for _ in range(600)]
+        expected = [residue(value, PRIME) for value in
+                    horner(coefficients, points[:3])]
+
+        self.assertEqual(evaluate_univariate(coefficients, points, PRIME),
+                         evaluate_univariate(coefficients, points, PRIME,
+                                             method='horner'))
+        self.assertEqual(evaluate_univariate(coefficients, points[:3], PRIME),
+                         expected)
+
+    def test_interpolation_polynomial(self):
+        xs = list(range(20))
+        ys = [x**3 % 11 for x in xs]
+        coefficients = newton_interpolation(xs, ys).coefficients()
+
+        self.assertEqual(evaluate_univariate(coefficients, xs, PRIME,
+                                             method='subproduct'), ys)
+
+    def test_polynomial_evaluation(self):
+        random.seed(5)
+        polynomial = Polynomial(('x',), {
+            (power,): Fraction(random.randint(-10**6, 10**6),
+                               random.randint(1, 100))
+            for power in range(600)})
+        coefficients = polynomial.coefficients()
+        points = list(range(600))
+
+        self.assertEqual(polynomial.evaluate_many(points, PRIME),
+                         evaluate_univariate(coefficients, points, PRIME,
+                                             method='horner'))
+        self.assertEqual(polynomial.evaluate_many(points[:5]),
+                         horner(coefficients, points[:5]))
+
+    def test_real_values_use_horner(self):
+        self.assertEqual(evaluate_univariate([0.5, 1.5], [2.0]), [3.5])
+
+    def test_subproduct_requires_modulus(self):
+        self.assertRaises(ValueError, evaluate_univariate, [1, 2], [1],
+                          method='subproduct')
+
+    def test_modular_floats(self):
+        self.assertRaises(ValueError, evaluate_univariate, [0.5, 1], [1], 7)
+
+    def test_unknown_method(self):
+        self.assertRaises(ValueError, evaluate_univariate, [1, 2], [1],
+                          method='foo')
@@ -0,0 +1,55 @@
+import unittest
+
+from evaluator.polynomial import Polynomial
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestExpansion(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def expand(self, text):
+        return Polynomial.from_tree(self.parser.parse(text))
+
+    def test_binomial(self):
+        polynomial = self.expand('(x + 1)**2 - y')
+
+        self.assertEqual(polynomial.variables, ('x', 'y'))
+        self.assertEqual(polynomial.terms,
+                         {(2, 0): 1, (1, 0): 2, (0, 0): 1, (0, 1): -1})
+
+    def test_cancellation(self):
+        self.assertEqual(self.expand('x*y - y*x').terms, {})
+
+    def test_division_by_constant(self):
+        self.assertEqual(self.expand('(2*x + 4) / 2').coefficients(),
+                         [2.0, 1.0])
+
+    def test_degree(self):
+        self.assertEqual(self.expand('x**3*y + y**2').degree(), 4)
+
+    def test_function_is_not_polynomial(self):
+        self.assertRaises(ValueError, self.expand, 'sin(x)')
+
+    def test_division_by_variable_is_not_polynomial(self):
+        self.assertRaises(ValueError, self.expand, '1 / x')
+
+    def test_negative_exponent_is_not_polynomial(self):
+        self.assertRaises(ValueError, self.expand, 'x ** -1')
+
+class TestConversion(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def test_to_tree_round_trip(self):
+        polynomial = Polynomial.from_tree(self.parser.parse(
+            '(x - 2*y)**3 + 5'))
+        tree = self.parser.parse(polynomial.to_tree().to_text())
+
+        self.assertEqual(Polynomial.from_tree(tree), polynomial)
+
+    def test_zero_polynomial(self):
+        self.assertEqual(Polynomial(('x',), {}).to_tree().to_text(), '0')
+
+    def test_coefficients_of_multivariate_polynomial(self):
+        polynomial = Polynomial.from_tree(self.parser.parse('x + y'))
+        self.assertRaises(ValueError, polynomial.coefficients)
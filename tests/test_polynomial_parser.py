@@ -1,6 +1,8 @@
+import io
 import math
 import unittest
 
+from lexer.diagnostics import Diagnostic
 from parser.polynomial_parser import PolynomialParser
 
 class TestBasicArithmetic(unittest.TestCase):
@@ -374,5 +376,37 @@ class TestComplexExpressions(unittest.TestCase):
         result = self.parser.parse('sqrt(16) + ln(1) + exp(0)')
         self.assertAlmostEqual(result, 5, places=10)  # 4 + 0 + 1
 
+class TestDocuments(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialParser.build()
+
+    def test_statements(self):
+        results = self.parser.parse_document('a = 2; b = a * 3\na + b')
+        self.assertEqual(results, [2, 6, 8])
+
+    def test_empty_statements(self):
+        self.assertEqual(self.parser.parse_document('\n\n1;; 2\n\n'), [1, 2])
+        self.assertEqual(self.parser.parse_document(''), [])
+        self.assertEqual(self.parser.parse_document(';\n;'), [])
+
+    def test_file(self):
+        document = io.StringIO('\n'.join(f'x{i} = {i}' for i in range(100)))
+        self.assertEqual(self.parser.parse_document(document), list(range(100)))
+        self.assertEqual(self.parser.ids['x99'], 99)
+
+    def test_syntax_errors(self):
+        self.parser.parse_document('1; 2 +; 3')
+        self.assertEqual(self.parser.syntax_errors, 1)
+        self.assertEqual(self.parser.diagnostics,
+                         [Diagnostic("Syntax error at ';'", 6, ';')])
+        self.assertIsNone(self.parser.parse(''))
+        self.assertIsNone(self.parser.parse('1 )'))
+        self.assertEqual(self.parser.syntax_errors, 3)
+        self.assertEqual(self.parser.diagnostics,
+                         [Diagnostic("Syntax error at ')'", 2, ')')])
+
+    def test_last_result(self):
+        self.assertEqual(self.parser.parse('x = 4; x * 2'), 8)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,124 @@
+import mmap
+import tempfile
+import unittest
+from fractions import Fraction
+
+from lexer.polynomial_lexer import PolynomialLexer
+from lexer.polynomial_scanner import PolynomialScanner
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+TEXTS = [
+    '',
+    'x + 2',
+    '   \t x1*y_2 ',
+    'sin(x)**2 - 3.5*var/|z| = 4',
+    'VarName = _temp ** -0.001',
+    'asin acos atan exp ln log2 log10 sqrt tan cos sine',
+    '2x 1.5.3 10.',
+    '***',
+    '١٢ + 3',
+    'x; y\n\nz;',
+]
+
+def describe(tokens):
+    return [(token.type, token.value, token.lineno, token.lexpos)
+            for token in tokens]
+
+class TestPolynomialScanner(unittest.TestCase):
+    def setUp(self):
+        self.lexer = PolynomialLexer.build()
+        self.scanner = PolynomialLexer.build(scanner=True)
+
+    def test_scanner_is_used(self):
+        self.assertIsInstance(self.scanner.get_lexer(), PolynomialScanner)
+
+    def test_same_tokens(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(describe(self.scanner.tokenize(text)),
+                                 describe(self.lexer.tokenize(text)))
+
+    def test_exact_numbers(self):
+        scanner = PolynomialLexer.build(exact=True, scanner=True)
+        self.assertEqual(scanner.tokenize('0.1')[0].value, Fraction(1, 10))
+
+    def capture_errors(self, lexer, text):
+        lexer.diagnostics.clear()
+        tokens = describe(lexer.tokenize(text))
+
+        return tokens, list(lexer.diagnostics)
+
+    def test_illegal_characters(self):
+        for text in ('x # y', '1 $$ 2', 'x\ry'):
+            with self.subTest(text=text):
+                tokens, errors = self.capture_errors(self.lexer, text)
+                self.assertTrue(errors)
+                self.assertEqual(self.capture_errors(self.scanner, text),
+                                 (tokens, errors))
+
+    def test_token_interface(self):
+        lexer = self.scanner.get_lexer()
+        lexer.input('x + 1')
+        self.assertEqual(lexer.token().type, 'ID')
+        self.assertEqual([token.type for token in lexer], ['PLUS', 'NUMBER'])
+        self.assertIsNone(lexer.token())
+
+    def test_token_arrays(self):
+        lexer = self.scanner.get_lexer()
+        lexer.input('ab * (ab + 2)')
+        self.assertEqual(lexer.types, ['ID', 'TIMES', 'LPAREN', 'ID', 'PLUS',
+                                       'NUMBER', 'RPAREN'])
+        self.assertEqual(lexer.values, ['ab', '*', '(', 'ab', '+', 2, ')'])
+        self.assertEqual(list(lexer.positions), [0, 3, 5, 6, 9, 11, 12])
+        self.assertIs(lexer.values[0], lexer.values[3])
+        self.assertEqual(lexer.token().type, 'ID')
+        self.assertEqual(lexer.remaining(), 1)
+        self.assertIsNone(lexer.token())
+
+    def test_slotted_tokens(self):
+        token = self.scanner.tokenize('x')[0]
+        self.assertFalse(hasattr(token, '__dict__'))
+        self.assertRaises(AttributeError, setattr, token, 'extra', None)
+
+    def test_no_input(self):
+        self.assertRaises(RuntimeError, PolynomialLexer.build(
+            scanner=True).get_lexer().token)
+
+    def test_binary_input(self):
+        for text in TEXTS:
+            if not text.isascii():
+                continue
+
+            expected = describe(self.scanner.tokenize(text))
+            data = text.encode('ascii')
+
+            for buffer in (data, bytearray(data), memoryview(data)):
+                with self.subTest(text=text, type=type(buffer)):
+                    self.assertEqual(describe(self.scanner.tokenize(buffer)),
+                                     expected)
+
+    def test_binary_illegal_characters(self):
+        self.assertEqual(self.capture_errors(self.scanner, b'x # y'),
+                         self.capture_errors(self.scanner, 'x # y'))
+
+    def test_mmap_input(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(b'sin(x1)**2 + 3.5')
+            file.flush()
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self.assertEqual(describe(self.scanner.tokenize(data)),
+                                 describe(self.scanner.tokenize(
+                                     'sin(x1)**2 + 3.5')))
+
+class TestScannerParsing(unittest.TestCase):
+    def test_evaluation(self):
+        parser = PolynomialParser.build(scanner=True)
+        self.assertEqual(parser.parse('x = 2 + 3'), 5)
+        self.assertEqual(parser.parse('|x - 7| * sqrt(16) ** 2'), 32.0)
+
+    def test_trees(self):
+        text = '-x**2**y / (3.5 - sin(z)) + |a = b|'
+        self.assertEqual(PolynomialTreeParser.build(scanner=True).parse(text),
+                         PolynomialTreeParser.build().parse(text))
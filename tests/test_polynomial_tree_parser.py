@@ -0,0 +1,164 @@
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+from evaluator.nodes import (AbsoluteValue, Assignment, BinaryOperation,
+                             Function, Negation, Number, Variable)
+from lexer.diagnostics import Diagnostic
+from lexer.polynomial_lexer import PolynomialLexer
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestTreeConstruction(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def test_number(self):
+        tree = self.parser.parse('3.5')
+        self.assertEqual(tree, Number(3.5))
+
+    def test_variable(self):
+        tree = self.parser.parse('x')
+        self.assertEqual(tree, Variable('x'))
+
+    def test_binary_operation(self):
+        tree = self.parser.parse('x + 2')
+        self.assertEqual(tree, BinaryOperation('+', Variable('x'), Number(2)))
+
+    def test_power_right_associative(self):
+        tree = self.parser.parse('2 ** 3 ** 2')
+        expected = BinaryOperation('**', Number(2),
+                                   BinaryOperation('**', Number(3), Number(2)))
+        self.assertEqual(tree, expected)
+
+    def test_unary_minus(self):
+        tree = self.parser.parse('-x')
+        self.assertEqual(tree, Negation(Variable('x')))
+
+    def test_absolute_value(self):
+        tree = self.parser.parse('|x|')
+        self.assertEqual(tree, AbsoluteValue(Variable('x')))
+
+    def test_function(self):
+        tree = self.parser.parse('sin(x)')
+        self.assertEqual(tree, Function('sin', Variable('x')))
+
+    def test_assignment(self):
+        tree = self.parser.parse('y = x')
+        self.assertEqual(tree, Assignment('y', Variable('x')))
+
+    def test_integer_and_real_literals_differ(self):
+        self.assertNotEqual(Number(1), Number(1.0))
+
+    def test_variables(self):
+        tree = self.parser.parse('x * y + z ** 2 + x')
+        self.assertEqual(tree.variables(), ('x', 'y', 'z'))
+
+class TestTextRendering(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def assertRoundTrip(self, text):
+        tree = self.parser.parse(text)
+        self.assertEqual(self.parser.parse(tree.to_text()), tree)
+
+    def test_precedence(self):
+        self.assertRoundTrip('2 + 3 * 4 - (5 - 6)')
+
+    def test_power_grouping(self):
+        self.assertRoundTrip('(2 ** 3) ** 2 + 2 ** 3 ** 2')
+
+    def test_negation(self):
+        self.assertRoundTrip('-(x + 1) * 3 - -x ** 2')
+
+    def test_functions_and_absolute_value(self):
+        self.assertRoundTrip('|x - 1| * sin(x) / sqrt(y = 2)')
+
+    def test_small_real_literal(self):
+        self.assertRoundTrip('0.00001 * x')
+
+    def test_negative_literal(self):
+        tree = BinaryOperation('*', Number(-2), Variable('x'))
+        self.assertEqual(tree.to_text(), '(-2) * x')
+
+    def test_long_sum(self):
+        text = ' + '.join(f'{i}*x**{i}' for i in range(5000))
+        tree = self.parser.parse(text)
+        self.assertEqual(tree.to_text().replace(' ', ''), text.replace(' ', ''))
+
+class TestOptimizedParsing(unittest.TestCase):
+    TEXTS = ['-x**2**y / (3.5 - sin(z)) + |a = b|', 'x = y = 2*x', '(((1)))',
+             'x +', '2 * * 3', ') x (', '|x', 'sin x', '']
+
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+        self.reference = PolynomialTreeParser.build()
+        self.reference.parser.optimize = False
+
+    def test_same_results(self):
+        for text in self.TEXTS:
+            with self.subTest(text=text):
+                tree = self.reference.parse(text)
+                self.assertEqual(self.parser.parse(text), tree)
+                self.assertEqual(self.parser.diagnostics,
+                                 self.reference.diagnostics)
+
+    def test_reused_stacks(self):
+        self.parser.parse('x + 1')
+        stacks = self.parser.parser._stacks
+        self.parser.parse('(x + 1) * y')
+        self.assertIs(self.parser.parser._stacks, stacks)
+        self.assertEqual(stacks, ([], [], [], []))
+
+    def test_debug_parse(self):
+        self.assertEqual(self.parser.get_parser().parse(
+            'x * 2', lexer=self.parser.lexer, tracking=True),
+            self.parser.parse_document('x * 2'))
+
+class TestTrustedBuild(unittest.TestCase):
+    def setUp(self):
+        PolynomialLexer._trusted_lexer = None
+        PolynomialParser._trusted_parsers.clear()
+
+    def test_no_file_access(self):
+        with mock.patch('builtins.open') as open_file, \
+                mock.patch('inspect.getsourcelines') as getsourcelines:
+            PolynomialTreeParser.build(validate=False)
+            PolynomialTreeParser.build(validate=False)
+
+        open_file.assert_not_called()
+        getsourcelines.assert_not_called()
+
+    def test_same_tables(self):
+        validated = PolynomialTreeParser.build().parser
+        trusted = PolynomialTreeParser.build(validate=False).parser
+
+        self.assertEqual(trusted.action, validated.action)
+        self.assertEqual(trusted.goto, validated.goto)
+        self.assertEqual([str(p) for p in trusted.productions],
+                         [str(p) for p in validated.productions])
+
+    def test_shared_tables(self):
+        first = PolynomialTreeParser.build(validate=False)
+        second = PolynomialTreeParser.build(validate=False)
+        evaluating = PolynomialParser.build(validate=False)
+
+        self.assertIs(second.parser.action, first.parser.action)
+        self.assertIsNot(evaluating.parser.action, first.parser.action)
+        self.assertEqual(first.parse('x + 1'),
+                         BinaryOperation('+', Variable('x'), Number(1)))
+        self.assertEqual(evaluating.parse('x = 2; x + 1'), 3)
+
+    def test_independent_instances(self):
+        floats = PolynomialParser.build(validate=False)
+        fractions = PolynomialParser.build(exact=True, validate=False)
+        floats.ids['x'] = 1
+
+        self.assertEqual(fractions.parse('0.5 + 0.25'), Fraction(3, 4))
+        self.assertEqual(floats.parse('0.5 + x'), 1.5)
+        self.assertIsNone(fractions.parse('1 $ +'))
+        self.assertEqual(fractions.diagnostics, [
+            Diagnostic("Illegal character '$'", 2, '$'),
+            Diagnostic('Syntax error at end of input'),
+        ])
+        self.assertEqual(floats.diagnostics, [])
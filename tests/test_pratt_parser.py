@@ -0,0 +1,83 @@
+import unittest
+
+import test_polynomial_parser
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+from parser.pratt_parser import PrattParser
+
+def _pratt_case(case):
+    def setUp(self):
+        case.setUp(self)
+        ids = self.parser.ids
+        self.parser = PolynomialParser.build(pratt=True)
+        self.parser.ids = ids
+
+    return type(f'Pratt{case.__name__}', (case,), {'setUp': setUp})
+
+# Every test of the LALR parser is run again against the Pratt parser.
+for _name, _case in vars(test_polynomial_parser).items():
+    if isinstance(_case, type) and issubclass(_case, unittest.TestCase):
+        globals()[f'Pratt{_name}'] = _pratt_case(_case)
+
+TEXTS = [
+    '2*x**2 + 1',
+    '-x**2**y / (3.5 - sin(z)) + |a = b|',
+    '1 + x = y = 3 * 2',
+    '-a * -b ** -c - -d',
+    '2 ** -x * 3 + 4',
+    '||x| - |y||',
+    'sqrt(|x - 1|) * log10(2) / ln(x)',
+]
+
+INVALID_TEXTS = ['', '1 +', ')', '(1 + 2', 'sin 2', 'x = ', '2 3', '|x| |x|',
+                 '1 ) + 2 + 3 + 4', '()', 'x (x']
+
+class TestPrattParser(unittest.TestCase):
+    def setUp(self):
+        self.lalr = PolynomialTreeParser.build()
+        self.pratt = PolynomialTreeParser.build(pratt=True)
+
+    def test_no_tables(self):
+        self.assertIsInstance(self.pratt.get_parser(), PrattParser)
+
+    def test_same_trees(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(self.pratt.parse(text),
+                                 self.lalr.parse(text))
+
+    def test_scanner(self):
+        parser = PolynomialTreeParser.build(scanner=True, pratt=True)
+
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(parser.parse(text), self.lalr.parse(text))
+
+    def test_syntax_errors(self):
+        for text in INVALID_TEXTS:
+            with self.subTest(text=text):
+                self.assertIsNone(self.pratt.parse(text))
+                self.lalr.parse(text)
+                # The Pratt parser stops at the first error.
+                self.assertEqual(self.pratt.diagnostics,
+                                 self.lalr.diagnostics[:1])
+
+    def test_scanner_syntax_errors(self):
+        scanner = PolynomialTreeParser.build(scanner=True, pratt=True)
+
+        for text in INVALID_TEXTS:
+            with self.subTest(text=text):
+                self.pratt.parse(text)
+                self.assertIsNone(scanner.parse(text))
+                self.assertEqual(scanner.diagnostics, self.pratt.diagnostics)
+
+    def test_deep_nesting(self):
+        self.assertEqual(self.pratt.parse('(' * 5000 + 'x' + ')' * 5000),
+                         self.lalr.parse('x'))
+        self.assertIsNotNone(self.pratt.parse('x ** ' * 5000 + 'x'))
+
+    def test_evaluation_order(self):
+        parser = PolynomialParser.build(pratt=True)
+        self.assertEqual(parser.parse('x = 2'), 2)
+        self.assertEqual(parser.parse('x * (x = 3) + x'), 9)
+        self.assertEqual(parser.ids['x'], 3)
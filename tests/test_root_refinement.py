@@ -0,0 +1,52 @@
+import math
+import unittest
+
+from evaluator.roots import refine_roots
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestRootRefinement(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def test_newton(self):
+        tree = self.parser.parse('x**2 - 2')
+        result = refine_roots(tree, [1.0, -3.0])
+
+        self.assertEqual(result.converged, [True, True])
+        self.assertAlmostEqual(result.roots[0], math.sqrt(2))
+        self.assertAlmostEqual(result.roots[1], -math.sqrt(2))
+
+    def test_halley(self):
+        tree = self.parser.parse('x**3 - 2*x + 1')
+        newton = refine_roots(tree, [-3.0])
+        halley = refine_roots(tree, [-3.0], method='halley')
+
+        self.assertTrue(halley.converged[0])
+        self.assertAlmostEqual(halley.roots[0], newton.roots[0])
+        self.assertLess(halley.iterations[0], newton.iterations[0])
+
+    def test_other_variables_are_bound(self):
+        tree = self.parser.parse('x**2 - a')
+        result = refine_roots(tree, [1.0], variable='x', a=9)
+
+        self.assertAlmostEqual(result.roots[0], 3.0)
+
+    def test_converged_points_stop_iterating(self):
+        tree = self.parser.parse('x - 1')
+        result = refine_roots(tree, [1.0, 5.0])
+
+        self.assertEqual(result.iterations, [1, 2])
+
+    def test_vanishing_derivative(self):
+        tree = self.parser.parse('x**2 + 1')
+        result = refine_roots(tree, [0.0])
+
+        self.assertEqual(result.converged, [False])
+
+    def test_ambiguous_variable(self):
+        tree = self.parser.parse('x * y - 1')
+        self.assertRaises(ValueError, refine_roots, tree, [1.0])
+
+    def test_unknown_method(self):
+        tree = self.parser.parse('x - 1')
+        self.assertRaises(ValueError, refine_roots, tree, [1.0], method='foo')
@@ -0,0 +1,52 @@
+import unittest
+
+from evaluator.simplify import specialize
+from interpreter.polynomial_interpreter import PolynomialInterpreter
+from parser.polynomial_tree_parser import PolynomialTreeParser
+
+class TestSpecialize(unittest.TestCase):
+    def setUp(self):
+        self.parser = PolynomialTreeParser.build()
+
+    def test_collects_terms(self):
+        tree = self.parser.parse('x*y + x*z**2 + y*z')
+        self.assertEqual(specialize(tree, {'y': 1, 'z': 2}).to_text(),
+                         '5 * x + 2')
+
+    def test_residual_variables(self):
+        tree = self.parser.parse('x*y*w + z')
+        residual = specialize(tree, {'y': 3})
+        self.assertEqual(residual.variables(), ('w', 'x', 'z'))
+
+    def test_non_polynomial(self):
+        tree = self.parser.parse('sin(x*y) + y')
+        self.assertEqual(specialize(tree, {'y': 2}).to_text(),
+                         'sin(x * 2) + 2')
+
+    def test_keeps_smaller_tree(self):
+        tree = self.parser.parse('(x + y)**10')
+        self.assertEqual(specialize(tree, {'y': 2}).to_text(), '(x + 2) ** 10')
+
+    def test_assigned_variable(self):
+        tree = self.parser.parse('(y = x + 1) * y')
+        self.assertRaises(ValueError, specialize, tree, {'y': 2})
+
+class TestInterpreterSpecialize(unittest.TestCase):
+    def test_agrees_with_evaluation(self):
+        text = '3.58*x**5 + 6.28*x**2*y*z + x*y*z**3 + 3'
+        interpreter = PolynomialInterpreter(text)
+        residual = interpreter.specialize(y=1, z=0.5)
+
+        self.assertEqual(residual.variables, ('x',))
+
+        for x in (-2, 0, 0.5, 2):
+            self.assertAlmostEqual(residual.evaluate(x=x),
+                                   interpreter.evaulate(x=x, y=1, z=0.5))
+
+    def test_all_variables_bound(self):
+        residual = PolynomialInterpreter('x**2 + y').specialize(x=3, y=1)
+        self.assertEqual(residual.variables, ())
+        self.assertEqual(residual.evaluate(), 10)
+
+    def test_syntax_error(self):
+        self.assertIsNone(PolynomialInterpreter('x +').specialize(x=1))
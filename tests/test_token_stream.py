@@ -0,0 +1,146 @@
+import io
+import mmap
+import tempfile
+import unittest
+
+from lexer.diagnostics import Diagnostic
+from lexer.polynomial_lexer import PolynomialLexer
+from lexer.token_stream import TokenStream
+from parser.polynomial_parser import PolynomialParser
+from parser.polynomial_tree_parser import PolynomialTreeParser
+from parser.pratt_parser import _TokenWindow
+
+TEXTS = [
+    '',
+    'x + 2',
+    'sin(x)**2 - 3.25*var/|z| = 4',
+    'long_variable_name ** 12345.678 * (a1 - b2)',
+    '2x 1.5.3 10. $ y',
+]
+
+def describe(tokens):
+    return [(token.type, token.value, token.lexpos) for token in tokens]
+
+def position(diagnostic):
+    return diagnostic.position
+
+class TestTokenStream(unittest.TestCase):
+    def setUp(self):
+        self.lexer = PolynomialLexer.build()
+
+    def tokenize(self, polynomial_lexer, source, **kwargs):
+        polynomial_lexer.diagnostics.clear()
+
+        if isinstance(source, str) and not kwargs:
+            tokens = describe(polynomial_lexer.tokenize(source))
+        else:
+            tokens = describe(polynomial_lexer.stream(source, **kwargs))
+
+        return tokens, list(polynomial_lexer.diagnostics)
+
+    def test_text(self):
+        stream = self.lexer.stream('x + 2')
+        self.assertIsInstance(stream, TokenStream)
+        self.assertEqual(next(stream).type, 'ID')
+        self.assertEqual([token.type for token in stream], ['PLUS', 'NUMBER'])
+        self.assertIsNone(stream.token())
+
+    def test_chunks(self):
+        for scanner in (False, True):
+            polynomial_lexer = PolynomialLexer.build(scanner=scanner)
+
+            for text in TEXTS:
+                expected = self.tokenize(polynomial_lexer, text)
+
+                for chunk_size in (1, 2, 3, 7, 1 << 16):
+                    with self.subTest(text=text, chunk_size=chunk_size,
+                                      scanner=scanner):
+                        self.assertEqual(self.tokenize(
+                            polynomial_lexer, io.StringIO(text),
+                            chunk_size=chunk_size), expected)
+
+    def test_buffers(self):
+        scanner = PolynomialLexer.build(scanner=True)
+
+        for text in TEXTS:
+            expected = self.tokenize(scanner, text)
+            data = text.encode('ascii')
+
+            for chunk_size in (1, 2, 3, 7, 1 << 16):
+                for buffer in (data, memoryview(bytearray(data))):
+                    with self.subTest(text=text, chunk_size=chunk_size,
+                                      type=type(buffer)):
+                        self.assertEqual(self.tokenize(
+                            scanner, buffer, chunk_size=chunk_size), expected)
+
+    def test_split_tokens(self):
+        tokens = describe(self.lexer.stream(io.StringIO('ab**12.5'),
+                                            chunk_size=1))
+        self.assertEqual(tokens, [('ID', 'ab', 0), ('POWER', '**', 2),
+                                  ('NUMBER', 12.5, 4)])
+
+class TestStreamParsing(unittest.TestCase):
+    def test_mmap(self):
+        parser = PolynomialParser.build(scanner=True)
+        parser.ids['x'] = 3
+        text = ' + '.join(f'{i}.5*x**2' for i in range(1000))
+
+        with tempfile.TemporaryFile() as file:
+            file.write(text.encode('ascii'))
+            file.flush()
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self.assertEqual(parser.parse_stream(data, 100),
+                                 parser.parse(text))
+                self.assertEqual(parser.parse(data), parser.parse(text))
+
+    def test_evaluation(self):
+        parser = PolynomialParser.build()
+        parser.ids['x'] = 2
+        text = ' + '.join(f'{i}*x**2' for i in range(1000))
+        self.assertEqual(parser.parse_stream(io.StringIO(text), 64),
+                         parser.parse(text))
+
+    def test_diagnostics(self):
+        text = 'x + 1; $ 2 +\n' * 50
+
+        for scanner in (False, True):
+            with self.subTest(scanner=scanner):
+                parser = PolynomialTreeParser.build(scanner=scanner)
+                parser.parse_document(text)
+                # The scanner reports the illegal characters of a whole chunk
+                # before its syntax errors.
+                expected = sorted(parser.diagnostics, key=position)
+                parser.parse_stream(io.StringIO(text), 5)
+                self.assertEqual(sorted(parser.diagnostics, key=position),
+                                 expected)
+                self.assertEqual(expected[:2], [
+                    Diagnostic("Illegal character '$'", 7, '$'),
+                    Diagnostic("Syntax error at '\\n'", 12, '\n'),
+                ])
+
+    def test_trees(self):
+        text = '-x**2**y / (3.5 - sin(z)) + |a = b|'
+
+        for pratt in (False, True):
+            with self.subTest(pratt=pratt):
+                parser = PolynomialTreeParser.build(pratt=pratt)
+                self.assertEqual(parser.parse_stream(io.StringIO(text), 3),
+                                 parser.parse(text))
+                self.assertEqual(parser.parse_stream(text), parser.parse(text))
+
+    def test_lazy_pratt(self):
+        text = ' + '.join(f'sin(x{i})' for i in range(1000))
+        stream = PolynomialLexer.build().stream(io.StringIO(text), 64)
+        window = _TokenWindow(stream)
+
+        for index in range(4999):
+            self.assertIsNotNone(window.types[index])
+            self.assertLessEqual(len(window.tokens), 18)
+
+        self.assertIsNone(window.types[4999])
+        self.assertIsNone(window.values[5000])
+
+        parser = PolynomialTreeParser.build(pratt=True)
+        self.assertEqual(parser.parse_stream(io.StringIO(text + '\n'), 64),
+                         parser.parse(text))